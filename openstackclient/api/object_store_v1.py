@@ -13,21 +13,134 @@
 
 """Object Store v1 API Library"""
 
+from collections.abc import Callable, Iterable, Iterator
+from concurrent import futures
+import hashlib
+import json
 import logging
 import os
 import sys
 from typing import Any
 import urllib.parse
 
+from keystoneauth1 import exceptions as ks_exceptions
+from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.api import api
+from openstackclient.common import cache
+from openstackclient.common import progressbar
+from openstackclient.common import transfer
+from openstackclient.i18n import _
 
 
 GLOBAL_READ_ACL = ".r:*"
 LIST_CONTENTS_ACL = ".rlistings"
 PUBLIC_CONTAINER_ACLS = [GLOBAL_READ_ACL, LIST_CONTENTS_ACL]
 
+# The number of requests made at once by operations spanning many objects
+DEFAULT_CONCURRENCY = 10
+# The number of bulk delete requests made at once; each one already covers
+# many objects so there is little to gain from more
+BULK_DELETE_CONCURRENCY = 2
+# The number of objects removed per bulk delete request if the cluster does
+# not advertise its own limit
+BULK_DELETE_MAX = 10000
+
+# The size of the chunks read from local files when hashing or uploading
+CHUNK_SIZE = 64 * 1024
+# The size of the ranges fetched by concurrent downloads of large objects
+DEFAULT_RANGE_SIZE = 64 * 1024 * 1024
+
+LOG = logging.getLogger(__name__)
+
+
+def _iter_listing(
+    fetch: Callable[[str | None], Any],
+    marker: str | None = None,
+    prefetch: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over a marker-paged listing one page at a time
+
+    :param fetch: a function returning the page of the listing after the
+        given marker
+    :param marker: the marker to start the listing from
+    :param prefetch: fetch the next page in the background while the
+        current one is being consumed
+    :returns: an iterator of listing entries
+    """
+
+    def _next_marker(entry: dict[str, Any]) -> str:
+        # entries rolled up by a delimiter only have a subdir
+        return entry['name'] if 'name' in entry else entry['subdir']
+
+    if not prefetch:
+        while True:
+            page = fetch(marker)
+            if not page or not isinstance(page, list):
+                return
+            yield from page
+            marker = _next_marker(page[-1])
+
+    with futures.ThreadPoolExecutor(max_workers=1) as executor:
+        page = fetch(marker)
+        while page and isinstance(page, list):
+            next_page = executor.submit(fetch, _next_marker(page[-1]))
+            yield from page
+            page = next_page.result()
+
+
+class _FileRange:
+    """A file-like view of part of a local file
+
+    This lets a single segment of a large file be streamed in a request
+    without reading it into memory or uploading the rest of the file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offset: int,
+        length: int,
+        progress: progressbar.Transfer | None = None,
+    ) -> None:
+        self._file = open(path, 'rb')
+        self._file.seek(offset)
+        self._remaining = length
+        self._progress = progress
+
+    def __len__(self) -> int:
+        # requests uses this to set the Content-Length of the request
+        return self._remaining
+
+    def __enter__(self) -> '_FileRange':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._file.close()
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        if self._progress is not None:
+            self._progress.update(len(data))
+        return data
+
+    def md5(self) -> str:
+        """Hash the rest of the range, leaving it ready to be read again"""
+        position = self._file.tell()
+        remaining = self._remaining
+        md5 = hashlib.md5(usedforsecurity=False)
+        while remaining and (
+            chunk := self._file.read(min(CHUNK_SIZE, remaining))
+        ):
+            md5.update(chunk)
+            remaining -= len(chunk)
+        self._file.seek(position)
+        return md5.hexdigest()
+
 
 class APIv1(api.BaseAPI):
     """Object Store v1 API"""
@@ -114,25 +227,15 @@ class APIv1(api.BaseAPI):
         params['format'] = 'json'
 
         if full_listing:
-            data = listing = self.container_list(
-                limit=limit,
-                marker=marker,
-                end_marker=end_marker,
-                prefix=prefix,
-                **params,
-            )
-            while listing:
-                marker = listing[-1]['name']
-                listing = self.container_list(
+            return list(
+                self.container_list_iter(
                     limit=limit,
                     marker=marker,
                     end_marker=end_marker,
                     prefix=prefix,
                     **params,
                 )
-                if listing:
-                    data.extend(listing)
-            return data
+            )
 
         if limit:
             params['limit'] = limit
@@ -145,16 +248,105 @@ class APIv1(api.BaseAPI):
 
         return self.list('', **params)
 
-    def container_save(self, container: str) -> None:
+    def container_list_iter(
+        self,
+        limit: int | None = None,
+        marker: str | None = None,
+        end_marker: str | None = None,
+        prefix: str | None = None,
+        prefetch: bool = False,
+        **params: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all the containers in an account
+
+        Pages of the listing are only fetched as they are needed, so the
+        first containers are available straight away and memory use does not
+        grow with the size of the account.
+
+        :param integer limit:
+            the number of containers to fetch per page
+        :param string marker:
+            query marker
+        :param string end_marker:
+            query end_marker
+        :param string prefix:
+            query prefix
+        :param boolean prefetch:
+            fetch the next page in the background while the current one is
+            being consumed
+        :returns:
+            an iterator of containers
+        """
+
+        def _fetch(marker: str | None) -> Any:
+            return self.container_list(
+                limit=limit,
+                marker=marker,
+                end_marker=end_marker,
+                prefix=prefix,
+                **params,
+            )
+
+        return _iter_listing(_fetch, marker=marker, prefetch=prefetch)
+
+    def container_save(
+        self,
+        container: str,
+        prefix: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        sync: bool = False,
+    ) -> list[tuple[str, str]]:
         """Save all the content from a container
 
+        The container listing is paged through as the objects are saved, so
+        containers of any size are handled in bounded memory.
+
         :param string container:
             name of container to save
+        :param string prefix:
+            only save objects whose names start with this prefix
+        :param integer concurrency:
+            the number of objects to save at once
+        :param bool sync:
+            skip objects whose local copy already has the size and MD5
+            checksum given in the listing
+        :returns:
+            a list of (object name, reason) tuples for the objects that could
+            not be saved
         """
 
-        objects = self.object_list(container=container)
-        for object in objects:
-            self.object_save(container=container, object=object['name'])
+        def _save(obj: dict[str, Any]) -> None:
+            name = obj['name']
+            if name.endswith('/'):
+                # pseudo-directory markers have no content to save
+                os.makedirs(name, exist_ok=True)
+                return
+            if sync and self._is_saved(
+                name, obj.get('bytes'), obj.get('hash')
+            ):
+                LOG.debug('Skipping unchanged object %s', name)
+                return
+            self.object_save(container=container, object=name)
+
+        transfer.grow_connection_pool(self.session, concurrency)
+        failures = []
+        for obj, _result, error in transfer.run_concurrently(
+            _save, self.object_list_iter(container, prefix=prefix), concurrency
+        ):
+            if error is not None:
+                failures.append((obj['name'], str(error)))
+        return failures
+
+    @staticmethod
+    def _is_saved(file: str, size: int | None, checksum: str | None) -> bool:
+        try:
+            if size is None or os.path.getsize(file) != size:
+                return False
+        except OSError:
+            return False
+        # only hash the file once its size shows that it may be unchanged
+        with _FileRange(file, 0, size) as data:
+            return data.md5() == checksum
 
     def container_set(
         self,
@@ -228,7 +420,11 @@ class APIv1(api.BaseAPI):
             self.create(urllib.parse.quote(container), headers=headers)
 
     def object_create(
-        self, container: str, object: str, name: str | None = None
+        self,
+        container: str,
+        object: str,
+        name: str | None = None,
+        progress: progressbar.ProgressReporter | None = None,
     ) -> dict[str, Any]:
         """Create an object inside a container
 
@@ -238,6 +434,8 @@ class APIv1(api.BaseAPI):
             local path to object
         :param string name:
             name of object to create
+        :param progress:
+            a reporter to report the progress of the upload to
         :returns:
             dict of returned headers
         """
@@ -251,10 +449,16 @@ class APIv1(api.BaseAPI):
         name = name if name else object
 
         with open(object, 'rb') as f:
+            data: Any = f
+            if progress is not None:
+                size = os.fstat(f.fileno()).st_size
+                data = progressbar.VerboseFileWrapper(
+                    f, size, progress.start(name, size)
+                )
             response = self.create(
                 f"{urllib.parse.quote(container)}/{urllib.parse.quote(name)}",
                 method='PUT',
-                data=f,
+                data=data,
             )
         data = {
             'account': self._find_account_id(),
@@ -266,6 +470,154 @@ class APIv1(api.BaseAPI):
 
         return data
 
+    def object_create_many(
+        self,
+        container: str,
+        objects: Iterable[str],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any] | None, Exception | None]]:
+        """Create objects inside a container concurrently
+
+        The uploads share the session's HTTP connection pool, which is
+        grown to hold a connection for each worker if needed.
+
+        :param string container:
+            name of container to store objects
+        :param objects:
+            local paths of the objects to upload, which are also used as
+            the object names
+        :param integer concurrency:
+            the number of uploads to run at once
+        :param progress:
+            a reporter to report the progress of the uploads to
+        :returns:
+            an iterator of (object, headers, error) tuples in the order the
+            uploads complete, where only one of headers and error is set
+        """
+
+        transfer.grow_connection_pool(self.session, concurrency)
+
+        def _create(obj: str) -> dict[str, Any]:
+            return self.object_create(
+                container=container, object=obj, progress=progress
+            )
+
+        return transfer.run_concurrently(_create, objects, concurrency)
+
+    def object_create_segmented(
+        self,
+        container: str,
+        object: str,
+        segment_size: int,
+        name: str | None = None,
+        segment_container: str | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        resume: bool = False,
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> dict[str, Any]:
+        """Create a Static Large Object from a local file
+
+        The file is split into segments which are uploaded concurrently to
+        a segment container, each with its MD5 checksum so that the cluster
+        verifies it, before a manifest joining them is written.
+
+        :param string container:
+            name of container to store object
+        :param string object:
+            local path to object
+        :param integer segment_size:
+            the size of each segment in bytes
+        :param string name:
+            name of object to create
+        :param string segment_container:
+            name of container to store segments, defaults to
+            ``<container>_segments``
+        :param integer concurrency:
+            the number of segments to upload at once
+        :param bool resume:
+            skip segments which were already uploaded with a matching
+            checksum by a previous attempt
+        :param progress:
+            a reporter to report the progress of the upload to
+        :returns:
+            dict of returned headers
+        """
+
+        name = name if name else object
+        segment_container = segment_container or f'{container}_segments'
+
+        stat = os.stat(object)
+        # segment names embed the size and modification time of the file so
+        # that a resumed upload never reuses segments of an older version
+        segment_prefix = (
+            f'{name}/slo/{stat.st_mtime:.6f}/{stat.st_size}/{segment_size}'
+        )
+        count = max(1, -(-stat.st_size // segment_size))
+
+        max_segments = self.info().get('slo', {}).get('max_manifest_segments')
+        if max_segments and count > max_segments:
+            msg = _(
+                "%(object)s would need %(count)s segments but the cluster "
+                "allows at most %(max)s; use a larger segment size"
+            ) % {'object': object, 'count': count, 'max': max_segments}
+            raise exceptions.CommandError(msg)
+
+        self.container_create(container=segment_container)
+        transfer.grow_connection_pool(self.session, concurrency)
+        tracker = progress.start(name, stat.st_size) if progress else None
+
+        def _upload(index: int) -> dict[str, Any]:
+            offset = index * segment_size
+            length = min(segment_size, stat.st_size - offset)
+            path = (
+                f'{urllib.parse.quote(segment_container)}/'
+                f'{urllib.parse.quote(segment_prefix)}/{index:08d}'
+            )
+            with _FileRange(object, offset, length, tracker) as data:
+                md5 = data.md5()
+                if not resume or self._get_etag(path) != md5:
+                    self.create(
+                        path,
+                        method='PUT',
+                        data=data,
+                        headers={'ETag': md5},
+                    )
+                elif tracker is not None:
+                    tracker.skip(length)
+            return {
+                'path': '/' + urllib.parse.unquote(path),
+                'etag': md5,
+                'size_bytes': length,
+            }
+
+        manifest: list[dict[str, Any] | None] = [None] * count
+        for index, segment, error in transfer.run_concurrently(
+            _upload, range(count), concurrency
+        ):
+            if error is not None:
+                msg = _(
+                    "Failed to upload segment %(index)s of %(object)s: %(e)s"
+                ) % {'index': index, 'object': object, 'e': error}
+                raise exceptions.CommandError(msg) from error
+            manifest[index] = segment
+
+        response = self._request(
+            'PUT',
+            f"{urllib.parse.quote(container)}/{urllib.parse.quote(name)}",
+            params={'multipart-manifest': 'put'},
+            data=json.dumps(manifest),
+        )
+        if tracker is not None:
+            tracker.finish()
+        return {
+            'account': self._find_account_id(),
+            'container': container,
+            'object': name,
+            'x-trans-id': response.headers.get('X-Trans-Id'),
+            'etag': response.headers.get('Etag'),
+        }
+
     def object_delete(self, container: str, object: str) -> None:
         """Delete an object from a container
 
@@ -282,6 +634,109 @@ class APIv1(api.BaseAPI):
             f"{urllib.parse.quote(container)}/{urllib.parse.quote(object)}"
         )
 
+    def object_delete_all(
+        self,
+        container: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[tuple[str, str]]:
+        """Delete every object in a container
+
+        The container listing is paged through as the objects are deleted,
+        so containers of any size are handled in bounded memory. Objects are
+        removed with the bulk delete middleware if the cluster advertises it
+        and with concurrent DELETE requests otherwise. Objects that are
+        already gone are not treated as failures.
+
+        :param string container:
+            name of container to empty
+        :param integer concurrency:
+            the number of DELETE requests to make at once when bulk delete is
+            not available
+        :returns:
+            a list of (object name, reason) tuples for the objects that could
+            not be deleted
+        """
+
+        names = (obj['name'] for obj in self.object_list_iter(container))
+
+        bulk_delete = self.info().get('bulk_delete')
+        if bulk_delete:
+            batch_size = min(
+                bulk_delete.get('max_deletes_per_request') or BULK_DELETE_MAX,
+                BULK_DELETE_MAX,
+            )
+            return self._object_delete_bulk(container, names, batch_size)
+
+        def _delete(name: str) -> None:
+            try:
+                self.object_delete(container=container, object=name)
+            except ks_exceptions.NotFound:
+                pass
+
+        transfer.grow_connection_pool(self.session, concurrency)
+        failures = []
+        for name, _result, error in transfer.run_concurrently(
+            _delete, names, concurrency
+        ):
+            if error is not None:
+                failures.append((name, str(error)))
+        return failures
+
+    def _object_delete_bulk(
+        self,
+        container: str,
+        names: Iterable[str],
+        batch_size: int,
+    ) -> list[tuple[str, str]]:
+        prefix = urllib.parse.quote(container) + '/'
+
+        def _batches() -> Iterator[list[str]]:
+            batch = []
+            for name in names:
+                batch.append(name)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        def _delete(batch: list[str]) -> list[tuple[str, str]]:
+            body = '\n'.join(prefix + urllib.parse.quote(n) for n in batch)
+            response = self._request(
+                'POST',
+                '',
+                params={'bulk-delete': 'true'},
+                data=body.encode('utf-8'),
+                headers={
+                    'Accept': 'application/json',
+                    'Content-Type': 'text/plain',
+                },
+            )
+            result = response.json()
+            failures = []
+            for path, reason in result.get('Errors') or []:
+                path = urllib.parse.unquote(path.lstrip('/'))
+                failures.append((path[len(container) + 1 :], reason))
+            if not failures and not result.get(
+                'Response Status', '200'
+            ).startswith('2'):
+                # the whole request was rejected, so nothing was deleted
+                reason = result.get('Response Body') or result.get(
+                    'Response Status'
+                )
+                failures = [(name, reason) for name in batch]
+            return failures
+
+        failures: list[tuple[str, str]] = []
+        for batch, result, error in transfer.run_concurrently(
+            _delete, _batches(), BULK_DELETE_CONCURRENCY
+        ):
+            if error is not None:
+                failures.extend((name, str(error)) for name in batch)
+            else:
+                failures.extend(result)
+        return failures
+
     def object_list(
         self,
         container: str,
@@ -319,21 +774,8 @@ class APIv1(api.BaseAPI):
 
         params['format'] = 'json'
         if full_listing:
-            data = listing = self.object_list(
-                container=container,
-                limit=limit,
-                marker=marker,
-                end_marker=end_marker,
-                prefix=prefix,
-                delimiter=delimiter,
-                **params,
-            )
-            while listing:
-                if delimiter:
-                    marker = listing[-1].get('name', listing[-1].get('subdir'))
-                else:
-                    marker = listing[-1]['name']
-                listing = self.object_list(
+            return list(
+                self.object_list_iter(
                     container=container,
                     limit=limit,
                     marker=marker,
@@ -342,9 +784,7 @@ class APIv1(api.BaseAPI):
                     delimiter=delimiter,
                     **params,
                 )
-                if listing:
-                    data.extend(listing)
-            return data
+            )
 
         if limit:
             params['limit'] = limit
@@ -359,8 +799,61 @@ class APIv1(api.BaseAPI):
 
         return self.list(urllib.parse.quote(container), **params)
 
+    def object_list_iter(
+        self,
+        container: str,
+        limit: int | None = None,
+        marker: str | None = None,
+        end_marker: str | None = None,
+        delimiter: str | None = None,
+        prefix: str | None = None,
+        prefetch: bool = False,
+        **params: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all the objects in a container
+
+        Pages of the listing are only fetched as they are needed, so the
+        first objects are available straight away and memory use does not
+        grow with the size of the container.
+
+        :param string container:
+            container name to get a listing for
+        :param integer limit:
+            the number of objects to fetch per page
+        :param string marker:
+            query marker
+        :param string end_marker:
+            query end_marker
+        :param string delimiter:
+            string to delimit the queries on
+        :param string prefix:
+            query prefix
+        :param boolean prefetch:
+            fetch the next page in the background while the current one is
+            being consumed
+        :returns:
+            an iterator of objects
+        """
+
+        def _fetch(marker: str | None) -> Any:
+            return self.object_list(
+                container=container,
+                limit=limit,
+                marker=marker,
+                end_marker=end_marker,
+                delimiter=delimiter,
+                prefix=prefix,
+                **params,
+            )
+
+        return _iter_listing(_fetch, marker=marker, prefetch=prefetch)
+
     def object_save(
-        self, container: str, object: str, file: str | None = None
+        self,
+        container: str,
+        object: str,
+        file: str | None = None,
+        progress: progressbar.ProgressReporter | None = None,
     ) -> None:
         """Save an object stored in a container
 
@@ -370,6 +863,8 @@ class APIv1(api.BaseAPI):
             name of object to save
         :param string file:
             local name of object
+        :param progress:
+            a reporter to report the progress of the download to
         """
 
         if not file:
@@ -381,18 +876,263 @@ class APIv1(api.BaseAPI):
             stream=True,
         )
         if response.status_code == 200:
+            tracker = None
+            if progress is not None:
+                size = response.headers.get('Content-Length')
+                tracker = progress.start(object, int(size) if size else None)
+
+            def _write(f: Any) -> None:
+                for chunk in response.iter_content(64 * 1024):
+                    f.write(chunk)
+                    if tracker is not None:
+                        tracker.update(len(chunk))
+                if tracker is not None:
+                    tracker.finish()
+
             if file == '-':
                 with os.fdopen(sys.stdout.fileno(), 'wb') as f:
-                    for chunk in response.iter_content(64 * 1024):
-                        f.write(chunk)
+                    _write(f)
             else:
                 file_path = file or ''
-                if not os.path.exists(os.path.dirname(file_path)):
-                    if len(os.path.dirname(file_path)) > 0:
-                        os.makedirs(os.path.dirname(file_path))
+                if len(os.path.dirname(file_path)) > 0:
+                    # concurrent saves may be creating the same directory
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
                 with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(64 * 1024):
-                        f.write(chunk)
+                    _write(f)
+
+    def object_save_ranged(
+        self,
+        container: str,
+        object: str,
+        file: str | None = None,
+        range_size: int = DEFAULT_RANGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> None:
+        """Save an object stored in a container using concurrent ranges
+
+        The object is fetched as ranges of ``range_size`` bytes, each
+        written at its offset in a preallocated ``<file>.part`` file which
+        is moved into place once the whole object has been verified against
+        its ETag, or the ETags of its segments for a Static Large Object.
+        The ranges fetched so far are recorded in ``<file>.part.json`` so
+        that an interrupted download only fetches the ranges it is missing
+        when run again.
+
+        :param string container:
+            name of container that stores object
+        :param string object:
+            name of object to save
+        :param string file:
+            local name of object
+        :param integer range_size:
+            the size of each range in bytes
+        :param integer concurrency:
+            the number of ranges to fetch at once
+        :param progress:
+            a reporter to report the progress of the download to
+        """
+
+        file = file or object
+        path = f'{urllib.parse.quote(container)}/{urllib.parse.quote(object)}'
+
+        headers = self._request('HEAD', path).headers
+        size = int(headers.get('Content-Length', 0))
+        etag = headers.get('Etag', '').strip('"')
+        is_slo = headers.get('X-Static-Large-Object', '').lower() == 'true'
+        if 'X-Object-Manifest' in headers:
+            # the ETag of a dynamic large object is not a checksum of its
+            # data so it can be used neither to verify nor to pin it
+            etag = ''
+        if size <= range_size:
+            self.object_save(
+                container=container,
+                object=object,
+                file=file,
+                progress=progress,
+            )
+            return
+
+        download = transfer.RangedDownload(
+            file, size, range_size, {'etag': etag}
+        )
+        request_headers = {}
+        if etag and not is_slo:
+            # fail rather than mix ranges of two versions of the object
+            request_headers['If-Match'] = etag
+
+        def _fetch(start: int, end: int) -> Iterator[bytes]:
+            response = self._request(
+                'GET',
+                path,
+                headers=dict(request_headers, Range=f'bytes={start}-{end}'),
+                stream=True,
+            )
+            if response.status_code != 206:
+                msg = _("Server ignored the range request for %s") % path
+                raise exceptions.CommandError(msg)
+            return response.iter_content(CHUNK_SIZE)
+
+        transfer.grow_connection_pool(self.session, concurrency)
+        tracker = progress.start(object, size) if progress else None
+        try:
+            download.run(_fetch, concurrency, tracker)
+        except Exception as e:
+            msg = _(
+                "Failed to download %(object)s, run the command again to "
+                "resume: %(e)s"
+            ) % {'object': object, 'e': e}
+            raise exceptions.CommandError(msg)
+
+        if not self._verify_download(path, download.part_path, etag, is_slo):
+            download.discard()
+            msg = (
+                _("Downloaded data for %s does not match its checksum")
+                % object
+            )
+            raise exceptions.CommandError(msg)
+
+        download.commit()
+        if tracker is not None:
+            tracker.finish()
+
+    def _verify_download(
+        self, path: str, file: str, etag: str, is_slo: bool
+    ) -> bool:
+        if is_slo:
+            manifest = self._request(
+                'GET', path, params={'multipart-manifest': 'get'}
+            ).json()
+            if any('range' in s or s.get('sub_slo') for s in manifest):
+                LOG.debug('Not verifying %s with a nested manifest', path)
+                return True
+            # check each segment against the checksum it was stored with
+            offset = 0
+            for segment in manifest:
+                with _FileRange(file, offset, segment['bytes']) as data:
+                    if data.md5() != segment['hash']:
+                        return False
+                offset += segment['bytes']
+            return True
+
+        if not etag:
+            LOG.debug('Not verifying %s without a checksum', path)
+            return True
+        with _FileRange(file, 0, os.path.getsize(file)) as data:
+            return data.md5() == etag
+
+    def object_sync(
+        self,
+        directory: str,
+        container: str,
+        prefix: str = '',
+        index: cache.FileCache | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        delete: bool = False,
+    ) -> Iterator[tuple[str, str | None, Exception | None]]:
+        """Upload the files in a local directory that differ from a container
+
+        The sorted local tree is compared with a streamed listing of the
+        container, so the listing is never held in memory. Files are
+        uploaded if the container has no object of the same size and MD5
+        checksum. The checksums of local files are kept in an index along
+        with their size and modification time, so unchanged files are not
+        hashed again by later runs.
+
+        :param string directory:
+            local directory to upload
+        :param string container:
+            name of container to store objects
+        :param string prefix:
+            prefix to add to the relative path of each file to get its object
+            name; only objects with this prefix are considered for deletion
+        :param index:
+            a cache of the size, modification time and MD5 checksum of
+            each file, keyed by relative path, which is updated as files are
+            hashed and from which files that no longer exist are dropped
+        :param integer concurrency:
+            the number of files to hash and upload at once
+        :param bool delete:
+            delete objects with the prefix that have no local file
+        :returns:
+            an iterator of (object name, action, error) tuples in the order
+            the objects are processed, where action is one of 'uploaded',
+            'deleted' or None if the object was unchanged
+        """
+
+        index_path = os.path.abspath(index.path) if index else None
+        files = []
+        for root, _dirs, names in os.walk(directory):
+            for name in names:
+                path = os.path.join(root, name)
+                if os.path.abspath(path) == index_path:
+                    continue
+                relpath = os.path.relpath(path, directory)
+                files.append((relpath.replace(os.sep, '/'), path))
+        # compare names the way the cluster sorts them, by their UTF-8 bytes
+        files.sort(key=lambda f: f[0].encode('utf-8'))
+        if index is not None:
+            # forget the checksums of files which no longer exist
+            index.retain(relpath for relpath, _path in files)
+
+        def _tasks() -> Iterator[tuple[str, str | None, Any]]:
+            listing = self.object_list_iter(
+                container, prefix=prefix or None, prefetch=True
+            )
+            remote = next(listing, None)
+            for relpath, path in files:
+                name = (prefix + relpath).encode('utf-8')
+                while remote and remote['name'].encode('utf-8') < name:
+                    if delete:
+                        yield remote['name'], None, None
+                    remote = next(listing, None)
+                if remote and remote['name'].encode('utf-8') == name:
+                    yield relpath, path, remote
+                    remote = next(listing, None)
+                else:
+                    yield relpath, path, None
+            while remote and delete:
+                yield remote['name'], None, None
+                remote = next(listing, None)
+
+        def _sync(
+            task: tuple[str, str | None, Any],
+        ) -> tuple[str | None, Any]:
+            name, path, remote = task
+            if path is None:
+                try:
+                    self.object_delete(container=container, object=name)
+                except ks_exceptions.NotFound:
+                    pass
+                return 'deleted', None
+
+            stat = os.stat(path)
+            entry = index.get(name) if index else None
+            if not entry or entry[:2] != [stat.st_size, stat.st_mtime_ns]:
+                with _FileRange(path, 0, stat.st_size) as data:
+                    entry = [stat.st_size, stat.st_mtime_ns, data.md5()]
+
+            if (
+                remote
+                and remote.get('bytes') == stat.st_size
+                and remote.get('hash') == entry[2]
+            ):
+                return None, entry
+            self.object_create(
+                container=container, object=path, name=prefix + name
+            )
+            return 'uploaded', entry
+
+        transfer.grow_connection_pool(self.session, concurrency)
+        for task, result, error in transfer.run_concurrently(
+            _sync, _tasks(), concurrency
+        ):
+            name, path, _remote = task
+            if path is not None:
+                if index is not None and result is not None:
+                    index.set(name, result[1])
+                name = prefix + name
+            yield name, result[0] if result else None, error
 
     def object_set(
         self,
@@ -529,6 +1269,41 @@ class APIv1(api.BaseAPI):
         if headers:
             self.create("", headers=headers)
 
+    def info(self) -> dict[str, Any]:
+        """Get the capabilities of the cluster
+
+        :returns:
+            dict of capabilities keyed by middleware name, which is empty if
+            the cluster does not expose them
+        """
+
+        # the info endpoint sits at the root of the service rather than
+        # under the version, so strip the version and anything after it, such
+        # as the account, from the path. Not every endpoint has an account:
+        # radosgw's are typically .../swift/v1
+        url_parts = urllib.parse.urlparse(self.endpoint or '')
+        segments = url_parts.path.rstrip('/').split('/')
+        for index in range(len(segments) - 1, -1, -1):
+            if segments[index] in ('v1', 'v1.0'):
+                segments = segments[:index]
+                break
+        url = urllib.parse.urlunparse(
+            url_parts._replace(path='/'.join([*segments, 'info']), query='')
+        )
+        try:
+            response = self.session.request(url, 'GET')
+            return response.json()
+        except (ks_exceptions.ClientException, ValueError) as e:
+            LOG.debug('Failed to get cluster capabilities: %s', e)
+            return {}
+
+    def _get_etag(self, path: str) -> str | None:
+        try:
+            response = self._request('HEAD', path)
+        except ks_exceptions.NotFound:
+            return None
+        return response.headers.get('Etag', '').strip('"') or None
+
     def _find_account_id(self) -> str:
         url_parts = urllib.parse.urlparse(self.endpoint or '')
         return str(url_parts.path).split('/')[-1]
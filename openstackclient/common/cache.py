@@ -0,0 +1,118 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+
+"""Persistent caches for expensive lookups"""
+
+from collections.abc import Iterable
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any
+
+LOG = logging.getLogger(__name__)
+
+
+class FileCache:
+    """A small key-value cache persisted as a JSON file.
+
+    Entries are stored alongside the time they were written and are ignored
+    once they are older than ``max_age`` seconds. The cache is best effort:
+    a missing, unreadable or corrupt file is treated as empty, and failures
+    to write it are logged and otherwise ignored.
+
+    :param path: The path of the cache file
+    :param max_age: The maximum age of an entry in seconds, or None to keep
+        entries forever
+    """
+
+    def __init__(self, path: str, max_age: float | None = None) -> None:
+        self.path = path
+        self.max_age = max_age
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path) as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            LOG.debug('Ignoring unreadable cache %s: %s', self.path, e)
+            return
+
+        if not isinstance(data, dict):
+            return
+
+        now = time.time()
+        for key, entry in data.items():
+            try:
+                timestamp, value = entry
+            except (TypeError, ValueError):
+                continue
+            if self.max_age is None or now - timestamp <= self.max_age:
+                self._entries[key] = (timestamp, value)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.time(), value)
+        self._dirty = True
+
+    def update(self, values: dict[str, Any]) -> None:
+        now = time.time()
+        for key, value in values.items():
+            self._entries[key] = (now, value)
+        self._dirty = bool(values) or self._dirty
+
+    def retain(self, keys: Iterable[str]) -> None:
+        """Drop every entry whose key is not in ``keys``."""
+        keys = set(keys)
+        stale = [key for key in self._entries if key not in keys]
+        for key in stale:
+            del self._entries[key]
+        self._dirty = bool(stale) or self._dirty
+
+    def save(self) -> None:
+        """Write the cache back to disk if it has changed."""
+        if not self._dirty:
+            return
+
+        directory = os.path.dirname(self.path) or '.'
+        try:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            # write to a temporary file and rename it into place so that
+            # concurrent readers never see a partially written cache
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as fh:
+                    json.dump(self._entries, fh)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            LOG.warning('Failed to write cache %s: %s', self.path, e)
+            return
+
+        self._dirty = False
@@ -0,0 +1,624 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+
+"""Project cleanup plans"""
+
+import collections
+from collections.abc import Iterable
+from concurrent import futures
+import functools
+import importlib
+import json
+import logging
+import queue
+import re
+import threading
+import time
+from typing import Any
+
+from openstack import exceptions as sdk_exceptions
+from openstack import resource
+from osc_lib import exceptions
+
+from openstackclient.i18n import _
+
+
+LOG = logging.getLogger(__name__)
+
+PLAN_VERSION = 1
+
+ROUTER_INTERFACE_OWNERS = (
+    'network:router_interface',
+    'network:router_interface_distributed',
+    'network:ha_router_replicated_interface',
+)
+
+# resource kinds whose name cannot be derived from the class name
+_KIND_OVERRIDES = {
+    'VpnIPSecSiteConnection': 'vpn_ipsec_site_connection',
+}
+
+# proxy methods used to delete resources of a kind, where these are not
+# simply ``delete_<kind>``
+_DELETE_METHODS = {
+    'network.floating_ip': 'delete_ip',
+    'dns.floating_ip': 'unset_floating_ip',
+}
+
+# resources whose deletion is asynchronous and which other resources may
+# depend on, so we wait for them to go away like openstacksdk does
+_WAIT_FOR_DELETE = {
+    'block_storage.backup',
+    'block_storage.snapshot',
+    'compute.server',
+    'load_balancer.load_balancer',
+    'orchestration.stack',
+}
+
+# the kinds of resources that must be gone before a resource of a given kind
+# can be deleted; dependencies are transitive
+DELETE_AFTER = {
+    'block_storage.snapshot': ('block_storage.backup',),
+    'block_storage.volume': (
+        'block_storage.backup',
+        'block_storage.snapshot',
+        'compute.server',
+    ),
+    'compute.server': ('orchestration.stack',),
+    'compute.server_group': ('compute.server',),
+    'key_manager.secret': ('key_manager.container',),
+    'load_balancer.load_balancer': ('orchestration.stack',),
+    'network.floating_ip': ('dns.floating_ip', 'orchestration.stack'),
+    'network.network': (
+        'network.port',
+        'network.router_interface',
+        'network.subnet',
+    ),
+    'network.port': ('compute.server', 'load_balancer.load_balancer'),
+    'network.router': (
+        'network.floating_ip',
+        'network.router_interface',
+        'network.vpn_service',
+    ),
+    'network.router_interface': (
+        'load_balancer.load_balancer',
+        'network.floating_ip',
+        'network.vpn_service',
+    ),
+    'network.security_group': (
+        'compute.server',
+        'load_balancer.load_balancer',
+        'network.port',
+    ),
+    'network.subnet': (
+        'compute.server',
+        'load_balancer.load_balancer',
+        'network.port',
+        'network.router_interface',
+        'network.vpn_service',
+    ),
+    'network.vpn_endpoint_group': ('network.vpn_ipsec_site_connection',),
+    'network.vpn_ike_policy': ('network.vpn_ipsec_site_connection',),
+    'network.vpn_ipsec_policy': ('network.vpn_ipsec_site_connection',),
+    'network.vpn_service': ('network.vpn_ipsec_site_connection',),
+    'object_store.container': ('object_store.object',),
+}
+
+# the maximum number of concurrent deletions per service
+SERVICE_CONCURRENCY = {
+    'compute': 8,
+    'network': 8,
+    'object_store': 16,
+}
+DEFAULT_CONCURRENCY = 4
+
+# the number of attempts made to delete a resource which failed to delete in
+# an earlier run, and the delay before the first retry in seconds; the delay
+# doubles after each attempt
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 1.0
+
+# proxy methods used to check that a resource of a kind exists, where these
+# are not simply ``get_<kind>``
+_GET_METHODS = {
+    'network.floating_ip': 'get_ip',
+    'network.router_interface': 'get_port',
+    'object_store.container': 'get_container_metadata',
+    'object_store.object': 'get_object_metadata',
+}
+
+_CAMEL_RE = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+
+
+def get_service(res: resource.Resource) -> str:
+    """Return the service a resource belongs to.
+
+    This is also the name of the proxy on the SDK connection, e.g. ``network``
+    for ``openstack.network.v2.port.Port``.
+    """
+    return type(res).__module__.split('.')[1]
+
+
+def get_kind(res: resource.Resource) -> str:
+    """Return the kind of a resource, e.g. ``network.port``.
+
+    Ports that attach a router to a subnet are reported as
+    ``network.router_interface`` since these must be detached from the router
+    rather than deleted.
+    """
+    service = get_service(res)
+    name = type(res).__name__
+    kind = _KIND_OVERRIDES.get(name) or _CAMEL_RE.sub('_', name).lower()
+    if (
+        kind == 'port'
+        and getattr(res, 'device_owner', None) in ROUTER_INTERFACE_OWNERS
+    ):
+        kind = 'router_interface'
+    return f'{service}.{kind}'
+
+
+@functools.cache
+def _get_dependencies(kind: str) -> frozenset[str]:
+    deps = set(DELETE_AFTER.get(kind, ()))
+    for dep in DELETE_AFTER.get(kind, ()):
+        deps |= _get_dependencies(dep)
+    return frozenset(deps)
+
+
+def get_key(res: resource.Resource) -> str:
+    """Return a key identifying a resource within its project.
+
+    IDs are not unique on their own for all resources; objects, for example,
+    are identified by their name within their container.
+    """
+    uri_attrs = [
+        str(getattr(res, name, None))
+        for name in sorted(type(res)._uri_mapping())
+    ]
+    return '/'.join([get_kind(res), *uri_attrs, str(res.id)])
+
+
+def _dump_resource(res: resource.Resource) -> dict[str, Any]:
+    attrs = res.to_dict(headers=False, computed=False, ignore_none=True)
+    # URI attributes, such as the container of an object, are not part of
+    # the body but are needed to address the resource again
+    for name in type(res)._uri_mapping():
+        value = getattr(res, name, None)
+        if value is not None:
+            attrs[name] = value
+    cls = type(res)
+    return {
+        'resource': f'{cls.__module__}.{cls.__name__}',
+        'attrs': attrs,
+    }
+
+
+def _load_resource(data: dict[str, Any]) -> resource.Resource:
+    module_name, _sep, class_name = data['resource'].rpartition('.')
+    # only ever instantiate openstacksdk resources from a plan file
+    if not module_name.startswith('openstack.'):
+        raise ValueError(f'unsupported resource type {data["resource"]}')
+    cls = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(cls, type) and issubclass(cls, resource.Resource)):
+        raise ValueError(f'unsupported resource type {data["resource"]}')
+    return cls.existing(**data['attrs'])
+
+
+def delete_resource(connection: Any, res: resource.Resource) -> None:
+    """Delete a single resource using the matching SDK proxy.
+
+    Resources that no longer exist are ignored.
+
+    :param connection: The SDK connection to the project owning the resource
+    :param res: The resource to delete
+    """
+    kind = get_kind(res)
+    proxy = getattr(connection, get_service(res))
+    try:
+        if kind == 'network.router_interface':
+            router = proxy.get_router(res.device_id)
+            # router interfaces cannot be removed while the router has
+            # static routes
+            if router.routes:
+                proxy.remove_extra_routes_from_router(
+                    router, {'router': {'routes': router.routes}}
+                )
+            proxy.remove_interface_from_router(
+                router=res.device_id, port=res.id
+            )
+            return
+        elif kind == 'load_balancer.load_balancer':
+            proxy.delete_load_balancer(res, cascade=True)
+        else:
+            method = _DELETE_METHODS.get(kind, 'delete_' + kind.split('.')[1])
+            getattr(proxy, method)(res)
+
+        if kind in _WAIT_FOR_DELETE:
+            proxy.wait_for_delete(res)
+    except sdk_exceptions.NotFoundException:
+        LOG.debug('%s %s is already gone', kind, res.id)
+
+
+def resource_exists(connection: Any, res: resource.Resource) -> bool:
+    """Check whether a resource still exists.
+
+    :param connection: The SDK connection to the project owning the resource
+    :param res: The resource to look for
+    """
+    kind = get_kind(res)
+    proxy = getattr(connection, get_service(res))
+    method = _GET_METHODS.get(kind, 'get_' + kind.split('.')[1])
+    try:
+        getattr(proxy, method)(res)
+    except sdk_exceptions.NotFoundException:
+        return False
+    return True
+
+
+def _delete_resource(
+    connection: Any, res: resource.Resource, state: str | None
+) -> None:
+    if state == 'deleted':
+        # deleted in an earlier run; just make sure it is really gone
+        if resource_exists(connection, res):
+            delete_resource(connection, res)
+        return
+
+    attempts = RETRY_ATTEMPTS if state == 'failed' else 1
+    delay = RETRY_DELAY
+    for attempt in range(1, attempts + 1):
+        try:
+            delete_resource(connection, res)
+            return
+        except Exception as e:
+            if attempt == attempts:
+                raise
+            LOG.debug(
+                'Attempt %d to delete %s %s failed, retrying in %.1fs: %s',
+                attempt,
+                get_kind(res),
+                res.id,
+                delay,
+                e,
+            )
+            time.sleep(delay)
+            delay *= 2
+
+
+class CleanupPlan:
+    """The set of resources a project cleanup will delete.
+
+    A plan is built from the resources discovered by a dry run of
+    openstacksdk's project cleanup. It can be saved to a file and loaded
+    again later so that discovery and deletion can happen in separate runs.
+
+    :param project_id: The ID of the project the resources belong to
+    :param resources: The resources to delete; any resource given more than
+        once is only kept the first time
+    :param created_at: The time the resources were discovered, in seconds
+        since the epoch; defaults to now
+    """
+
+    def __init__(
+        self,
+        project_id: str | None,
+        resources: Iterable[resource.Resource] = (),
+        created_at: float | None = None,
+    ) -> None:
+        self.project_id = project_id
+        # openstacksdk reports a router once for each of its interfaces
+        unique: dict[str, resource.Resource] = {}
+        for res in resources:
+            unique.setdefault(get_key(res), res)
+        self.resources = list(unique.values())
+        self.created_at = time.time() if created_at is None else created_at
+
+    def __len__(self) -> int:
+        return len(self.resources)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def rows(self) -> list[tuple[str, str, str]]:
+        return [
+            (type(res).__name__, res.id, res.name) for res in self.resources
+        ]
+
+    def check(self, project_id: str | None, max_age: float | None) -> None:
+        """Ensure the plan may be executed against a project.
+
+        :param project_id: The ID of the project that is being cleaned
+        :param max_age: The maximum age of the plan in seconds, or None to
+            accept plans of any age
+        :raises: `osc_lib.exceptions.CommandError` if the plan was made for
+            another project or is too old
+        """
+        if project_id and self.project_id != project_id:
+            msg = _(
+                "Cleanup plan was created for project %(plan)s, "
+                "not %(project)s"
+            )
+            raise exceptions.CommandError(
+                msg % {'plan': self.project_id, 'project': project_id}
+            )
+
+        if max_age is not None and self.age > max_age:
+            msg = _(
+                "Cleanup plan is %(age)d seconds old, which is more than "
+                "the allowed %(max_age)d seconds; discover the project's "
+                "resources again or increase --plan-max-age"
+            )
+            raise exceptions.CommandError(
+                msg % {'age': self.age, 'max_age': max_age}
+            )
+
+    def execute(
+        self,
+        connection: Any,
+        status_queue: queue.Queue[Any] | None = None,
+        journal: 'CleanupJournal | None' = None,
+    ) -> list[tuple[resource.Resource, Exception]]:
+        """Delete the resources of the plan.
+
+        Resources are deleted concurrently, with at most
+        ``SERVICE_CONCURRENCY`` deletions in flight per service, but a
+        resource is only deleted once all resources of the kinds listed for
+        it in ``DELETE_AFTER`` have been. Failures are logged and do not stop
+        the remaining deletions.
+
+        :param connection: The SDK connection to the project being cleaned
+        :param status_queue: A queue which receives a ``(resource, error)``
+            tuple as each deletion completes, where ``error`` is None on
+            success
+        :param journal: A journal to record the outcome of each deletion
+            in. Resources which the journal records as deleted by an earlier
+            run are only deleted again if they still exist, and resources
+            which failed to delete are retried up to ``RETRY_ATTEMPTS``
+            times with exponential backoff.
+        :returns: A list of ``(resource, exception)`` tuples for the
+            resources which could not be deleted
+        """
+        pending: dict[str, collections.deque[resource.Resource]] = {}
+        remaining: collections.Counter[str] = collections.Counter()
+        for res in self.resources:
+            kind = get_kind(res)
+            pending.setdefault(kind, collections.deque()).append(res)
+            remaining[kind] += 1
+
+        services = {kind.split('.')[0] for kind in pending}
+        max_workers = sum(
+            SERVICE_CONCURRENCY.get(service, DEFAULT_CONCURRENCY)
+            for service in services
+        )
+        in_flight: dict[futures.Future[None], tuple[str, Any, str | None]] = {}
+        load: collections.Counter[str] = collections.Counter()
+        failures: list[tuple[resource.Resource, Exception]] = []
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers or 1) as pool:
+            while pending or in_flight:
+                for kind in list(pending):
+                    if any(remaining[dep] for dep in _get_dependencies(kind)):
+                        continue
+                    service = kind.split('.')[0]
+                    limit = SERVICE_CONCURRENCY.get(
+                        service, DEFAULT_CONCURRENCY
+                    )
+                    resources = pending[kind]
+                    while resources and load[service] < limit:
+                        res = resources.popleft()
+                        state = None
+                        if journal is not None:
+                            state = journal.get_state(self.project_id, res)
+                        LOG.debug('Deleting %s %s', kind, res.id)
+                        future = pool.submit(
+                            _delete_resource, connection, res, state
+                        )
+                        in_flight[future] = (kind, res, state)
+                        load[service] += 1
+                    if not resources:
+                        del pending[kind]
+
+                done, _not_done = futures.wait(
+                    in_flight, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    kind, res, state = in_flight.pop(future)
+                    load[kind.split('.')[0]] -= 1
+                    remaining[kind] -= 1
+                    error = future.exception()
+                    if journal is not None and (error or state != 'deleted'):
+                        journal.record(self.project_id, res, error)
+                    if isinstance(error, Exception):
+                        LOG.error(
+                            _('Cannot delete %(type)s %(id)s: %(error)s'),
+                            {
+                                'type': type(res).__name__,
+                                'id': res.id,
+                                'error': error,
+                            },
+                        )
+                        failures.append((res, error))
+                    if status_queue is not None:
+                        status_queue.put((res, error))
+
+        return failures
+
+    def save(self, path: str) -> None:
+        data = {
+            'version': PLAN_VERSION,
+            'project_id': self.project_id,
+            'created_at': self.created_at,
+            'resources': [_dump_resource(res) for res in self.resources],
+        }
+        try:
+            with open(path, 'w') as fh:
+                json.dump(data, fh, default=str)
+        except OSError as e:
+            msg = _("Unable to write cleanup plan %(path)s: %(error)s")
+            raise exceptions.CommandError(msg % {'path': path, 'error': e})
+
+    @classmethod
+    def load(cls, path: str) -> 'CleanupPlan':
+        try:
+            with open(path) as fh:
+                data = json.load(fh)
+            if data.get('version') != PLAN_VERSION:
+                raise ValueError(
+                    f'unsupported plan version {data.get("version")}'
+                )
+            resources = [_load_resource(r) for r in data['resources']]
+            return cls(
+                data['project_id'], resources, created_at=data['created_at']
+            )
+        except (
+            AttributeError,
+            ImportError,
+            KeyError,
+            OSError,
+            TypeError,
+            ValueError,
+        ) as e:
+            msg = _("Unable to read cleanup plan %(path)s: %(error)s")
+            raise exceptions.CommandError(msg % {'path': path, 'error': e})
+
+
+class CleanupJournal:
+    """An append-only record of the progress of project cleanups.
+
+    The journal is a file of JSON lines recording the resources planned for
+    deletion in each project, followed by the outcome of each deletion. It
+    allows an interrupted cleanup to be resumed without searching for
+    resources again or repeating deletions which succeeded.
+
+    :param path: The path of the journal file. Any existing entries are
+        loaded and new entries are appended to it.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.plans: dict[str | None, CleanupPlan] = {}
+        self._states: dict[tuple[str | None, str], str] = {}
+        self._lock = threading.Lock()
+        self._fh: Any = None
+        self._load()
+
+    def _load(self) -> None:
+        planned: dict[str | None, list[resource.Resource]] = {}
+        try:
+            with open(self.path) as fh:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                        event = entry['event']
+                        project_id = entry['project_id']
+                        if event == 'planned':
+                            res = _load_resource(entry['resource'])
+                            planned.setdefault(project_id, []).append(res)
+                        elif event == 'discovered':
+                            self.plans[project_id] = CleanupPlan(
+                                project_id,
+                                planned.pop(project_id, []),
+                                created_at=entry['time'],
+                            )
+                        elif event in ('deleted', 'failed'):
+                            self._states[(project_id, entry['key'])] = event
+                    except (
+                        AttributeError,
+                        ImportError,
+                        KeyError,
+                        TypeError,
+                        ValueError,
+                    ) as e:
+                        # most likely the last entry of an interrupted run
+                        # which was only partially written
+                        LOG.debug('Ignoring journal entry %r: %s', line, e)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            msg = _("Unable to read cleanup journal %(path)s: %(error)s")
+            raise exceptions.CommandError(
+                msg % {'path': self.path, 'error': e}
+            )
+
+    def _write(self, entries: Iterable[dict[str, Any]]) -> None:
+        with self._lock:
+            if self._fh is None:
+                self._fh = open(self.path, 'a')
+            for entry in entries:
+                self._fh.write(json.dumps(entry, default=str) + '\n')
+            self._fh.flush()
+
+    def get_state(
+        self, project_id: str | None, res: resource.Resource
+    ) -> str | None:
+        """Return ``deleted`` or ``failed`` for a resource, or None."""
+        return self._states.get((project_id, get_key(res)))
+
+    def get_counts(self, project_id: str | None) -> collections.Counter[str]:
+        """Count the outcomes recorded for a project's resources."""
+        return collections.Counter(
+            state
+            for (state_project_id, _key), state in self._states.items()
+            if state_project_id == project_id
+        )
+
+    def record_plan(self, plan: CleanupPlan) -> None:
+        """Record the resources planned for deletion in a project."""
+        now = time.time()
+        self._write(
+            [
+                *(
+                    {
+                        'event': 'planned',
+                        'project_id': plan.project_id,
+                        'time': now,
+                        'resource': _dump_resource(res),
+                    }
+                    for res in plan.resources
+                ),
+                {
+                    'event': 'discovered',
+                    'project_id': plan.project_id,
+                    'time': plan.created_at,
+                    'count': len(plan),
+                },
+            ]
+        )
+        self.plans[plan.project_id] = plan
+
+    def record(
+        self,
+        project_id: str | None,
+        res: resource.Resource,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record the outcome of deleting a resource."""
+        key = get_key(res)
+        event = 'failed' if error else 'deleted'
+        entry: dict[str, Any] = {
+            'event': event,
+            'project_id': project_id,
+            'time': time.time(),
+            'key': key,
+        }
+        if error:
+            entry['error'] = str(error)
+        self._write([entry])
+        with self._lock:
+            self._states[(project_id, key)] = event
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
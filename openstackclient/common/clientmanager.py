@@ -17,8 +17,10 @@
 
 import argparse
 from collections.abc import Callable
+import hashlib
 import importlib
 import logging
+import os
 import sys
 from typing import Any, Protocol, TypeVar, runtime_checkable
 
@@ -34,6 +36,7 @@ from osc_lib import shell
 import stevedore
 
 from openstackclient.api import object_store_v1
+from openstackclient.identity import common as identity_common
 
 LOG = logging.getLogger(__name__)
 PLUGIN_MODULES: list[Any] = []
@@ -145,6 +148,34 @@ class ClientManager(clientmanager.ClientManager):
         else:
             raise e
 
+    @property
+    def identity_resolver(self) -> identity_common.IdentityResolver:
+        """Memoizing identity name resolver for the current command"""
+        return identity_common.get_identity_resolver(
+            self.sdk_connection.identity
+        )
+
+    def reset_identity_resolver(self) -> None:
+        """Forget identity lookups made by a previous command"""
+        identity_common.reset_identity_resolvers()
+
+    def get_cache_file(self, name: str) -> str:
+        """Get the path of a persistent cache file for this cloud and region
+
+        Cache files live under the openstacksdk cache path and are namespaced
+        by the identity endpoint and region so that caches for different
+        clouds never collide.
+        """
+        cache_path = self._cli_options.get_cache_path() or os.path.join(
+            os.path.expanduser('~'), '.cache', 'openstack'
+        )
+        auth_url = self._cli_options.config.get('auth', {}).get('auth_url')
+        scope = f'{auth_url or ""}|{self.region_name or ""}'
+        digest = hashlib.sha256(scope.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(
+            cache_path, 'openstackclient', f'{name}-{digest}.json'
+        )
+
     def is_network_endpoint_enabled(self) -> bool:
         """Check if the network endpoint is enabled"""
         # NOTE(dtroyer): is_service_available() can also return None if
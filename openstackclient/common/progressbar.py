@@ -13,58 +13,276 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from collections.abc import Callable
+import json
 import sys
+import threading
+import time
 from typing import Any
 
+# The minimum number of seconds between redraws of a progress bar, and
+# between progress events for each transfer when not writing to a terminal
+TTY_INTERVAL = 0.2
+EVENT_INTERVAL = 5.0
 
-class _ProgressBarBase:
-    """A progress bar provider for a wrapped object.
+BAR_WIDTH = 30
 
-    Base abstract class used by specific class wrapper to show
-    a progress bar when the wrapped object are consumed.
+_SIZE_UNITS = ('B', 'KiB', 'MiB', 'GiB', 'TiB')
 
-    :param wrapped: Object to wrap that hold data to be consumed.
-    :param totalsize: The total size of the data in the wrapped object.
 
-    :note: The progress will be displayed only if sys.stdout is a tty.
+def _format_size(size: float) -> str:
+    for unit in _SIZE_UNITS[:-1]:
+        if size < 1024:
+            return f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} {_SIZE_UNITS[-1]}'
+
+
+def _format_eta(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}:{minutes:02}:{seconds:02}'
+
+
+class Transfer:
+    """The progress of a single transfer
+
+    Transfers are created by :meth:`ProgressReporter.start` and may be
+    updated from any thread.
     """
 
-    def __init__(self, wrapped: Any, totalsize: int) -> None:
-        self._wrapped = wrapped
-        self._totalsize = float(totalsize)
-        self._show_progress = sys.stdout.isatty() and self._totalsize != 0
-        self._percent = 0.0
+    def __init__(
+        self,
+        reporter: 'ProgressReporter',
+        name: str,
+        total: int | None,
+        started: float,
+    ) -> None:
+        self._reporter = reporter
+        self.name = name
+        self.total = total or None
+        self.started = started
+        self.done = 0
+        # bytes which were already transferred by an earlier attempt, and
+        # so do not count towards the rate
+        self.skipped = 0
+        self.finished = False
+        self._reported_at: float | None = None
 
-    def _display_progress_bar(self, size_read: int) -> None:
-        if self._show_progress:
-            self._percent += size_read / self._totalsize
-            # Output something like this: [==========>             ] 49%
-            sys.stdout.write(
-                '\r[{:<30}] {:.0%}'.format(
-                    '=' * round(self._percent * 29) + '>', self._percent
-                )
+    def update(self, count: int) -> None:
+        """Record that ``count`` more bytes have been transferred"""
+        self._reporter._update(self, count)
+
+    def skip(self, count: int) -> None:
+        """Record that ``count`` bytes were transferred by an earlier run"""
+        self._reporter._update(self, count, skipped=True)
+
+    def finish(self) -> None:
+        """Record that the transfer is complete"""
+        self._reporter._finish(self)
+
+    def rate(self, now: float) -> float:
+        return (self.done - self.skipped) / max(now - self.started, 1e-6)
+
+    def eta(self, now: float) -> float | None:
+        rate = self.rate(now)
+        if self.total is None or not rate:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+
+class ProgressReporter:
+    """Report the progress of one or more concurrent transfers
+
+    Updates only add to counters, and the display is redrawn at most once
+    every ``interval`` seconds, so that reporting progress costs little
+    even when updates are very frequent. If ``stream`` is a terminal a
+    single progress bar covering all the transfers is drawn on it, showing
+    the rate and estimated time remaining. Otherwise each transfer is
+    reported as JSON events on ``events``, one per line, so that the
+    progress can be followed by other programs without it being mixed into
+    the output of the command.
+
+    :param stream: The stream to draw a progress bar on (default: stderr)
+    :param events: The stream to write JSON events to when ``stream`` is not
+        a terminal (default: stderr)
+    :param interval: The minimum number of seconds between redraws or
+        between the events of a transfer
+    :param clock: A monotonic clock, for testing
+    """
+
+    def __init__(
+        self,
+        stream: Any = None,
+        events: Any = None,
+        interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.stream = stream if stream is not None else sys.stderr
+        self.events = events if events is not None else sys.stderr
+        self.is_tty = self.stream.isatty()
+        if interval is None:
+            interval = TTY_INTERVAL if self.is_tty else EVENT_INTERVAL
+        self.interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._transfers: list[Transfer] = []
+        self._started: float | None = None
+        self._drawn_at: float | None = None
+        self._width = 0
+
+    def __enter__(self) -> 'ProgressReporter':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def start(self, name: str, total: int | None = None) -> Transfer:
+        """Start reporting the progress of a transfer
+
+        :param name: A name identifying the transfer in events
+        :param total: The size of the transfer in bytes, if known
+        :returns: A :class:`Transfer` to update as the data is transferred
+        """
+        with self._lock:
+            now = self._clock()
+            if self._started is None:
+                self._started = now
+            transfer = Transfer(self, name, total, now)
+            self._transfers.append(transfer)
+            if not self.is_tty:
+                self._emit('start', transfer, now)
+            return transfer
+
+    def close(self) -> None:
+        """Finish the display, leaving the cursor on a new line"""
+        with self._lock:
+            if self.is_tty and self._drawn_at is not None:
+                self._draw(self._clock())
+                self.stream.write('\n')
+                self.stream.flush()
+                self._drawn_at = None
+
+    def _update(
+        self, transfer: Transfer, count: int, skipped: bool = False
+    ) -> None:
+        with self._lock:
+            transfer.done += count
+            if skipped:
+                transfer.skipped += count
+            now = self._clock()
+            if self.is_tty:
+                if (
+                    self._drawn_at is None
+                    or now - self._drawn_at >= self.interval
+                ):
+                    self._draw(now)
+            elif (
+                transfer._reported_at is None
+                or now - transfer._reported_at >= self.interval
+            ):
+                self._emit('progress', transfer, now)
+
+    def _finish(self, transfer: Transfer) -> None:
+        with self._lock:
+            if transfer.finished:
+                return
+            transfer.finished = True
+            now = self._clock()
+            if self.is_tty:
+                self._draw(now)
+            else:
+                self._emit('finish', transfer, now)
+
+    def _emit(self, event: str, transfer: Transfer, now: float) -> None:
+        transfer._reported_at = now
+        eta = transfer.eta(now)
+        self.events.write(
+            json.dumps(
+                {
+                    'event': event,
+                    'name': transfer.name,
+                    'bytes': transfer.done,
+                    'total': transfer.total,
+                    'rate': round(transfer.rate(now)),
+                    'eta': None if eta is None else round(eta),
+                }
             )
-            sys.stdout.flush()
+            + '\n'
+        )
+        self.events.flush()
 
-    def __getattr__(self, attr: str) -> Any:
-        # Forward other attribute access to the wrapped object.
-        return getattr(self._wrapped, attr)
+    def _draw(self, now: float) -> None:
+        self._drawn_at = now
+        done = sum(t.done for t in self._transfers)
+        skipped = sum(t.skipped for t in self._transfers)
+        started = now if self._started is None else self._started
+        rate = (done - skipped) / max(now - started, 1e-6)
+        totals = [t.total for t in self._transfers]
+        finished = all(t.finished for t in self._transfers)
+
+        parts = []
+        if None in totals:
+            parts.append(_format_size(done))
+        else:
+            total = sum(t for t in totals if t is not None)
+            percent = min(done / total, 1.0)
+            # Output something like this: [==========>             ] 49%
+            bar = '=' * round(percent * (BAR_WIDTH - 1)) + '>'
+            parts.append(f'[{bar:<{BAR_WIDTH}}] {percent:.0%}')
+        if len(self._transfers) > 1:
+            count = sum(t.finished for t in self._transfers)
+            parts.append(f'({count}/{len(self._transfers)})')
+        parts.append(f'{_format_size(rate)}/s')
+        if None not in totals and not finished and rate:
+            remaining = sum(t for t in totals if t is not None) - done
+            parts.append(f'ETA {_format_eta(max(remaining, 0) / rate)}')
+
+        line = ' '.join(parts)
+        # pad the line to clear what is left of a longer one drawn before it
+        self.stream.write('\r' + line.ljust(self._width))
+        self.stream.flush()
+        self._width = max(self._width, len(line))
 
 
-class VerboseFileWrapper(_ProgressBarBase):
+class VerboseFileWrapper:
     """A file wrapper with a progress bar.
 
-    The file wrapper shows and advances a progress bar whenever the
-    wrapped file's read method is called.
+    The file wrapper advances the progress of a transfer whenever the
+    wrapped file's read method is called, and finishes it once the file has
+    been read to the end. If no transfer is given, a progress bar for the
+    file alone is drawn on stdout.
+
+    :param wrapped: The file to wrap
+    :param totalsize: The size of the data in the file
+    :param transfer: The transfer to report the progress of
     """
 
+    def __init__(
+        self,
+        wrapped: Any,
+        totalsize: int,
+        transfer: Transfer | None = None,
+    ) -> None:
+        self._wrapped = wrapped
+        self._reporter = None
+        if transfer is None:
+            self._reporter = ProgressReporter(stream=sys.stdout)
+            transfer = self._reporter.start(
+                getattr(wrapped, 'name', ''), totalsize
+            )
+        self._transfer = transfer
+
     def read(self, *args: Any, **kwargs: Any) -> Any:
         data = self._wrapped.read(*args, **kwargs)
         if data:
-            self._display_progress_bar(len(data))
+            self._transfer.update(len(data))
         else:
-            if self._show_progress:
-                # Break to a new line from the progress bar for incoming
-                # output.
-                sys.stdout.write('\n')
+            self._transfer.finish()
+            if self._reporter is not None:
+                self._reporter.close()
         return data
+
+    def __getattr__(self, attr: str) -> Any:
+        # Forward other attribute access to the wrapped object.
+        return getattr(self._wrapped, attr)
@@ -14,22 +14,31 @@
 #
 
 import argparse
+from concurrent import futures
 import getpass
 import logging
 import os
 import queue
+import time
 from typing import Any
 
 from cliff.formatters import table
 from openstack import utils as sdk_utils
+from osc_lib import exceptions
 
 from openstackclient import command
+from openstackclient.common import cleanup_plan
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
 
 LOG = logging.getLogger(__name__)
 
+# the default maximum age of a cleanup plan passed with --plan-in, in seconds
+PLAN_MAX_AGE = 3600
+# the default number of projects cleaned concurrently
+PROJECT_CONCURRENCY = 4
+
 
 def ask_user_yesno(msg: str) -> bool:
     """Ask user Y/N question
@@ -45,6 +54,15 @@ def ask_user_yesno(msg: str) -> bool:
             return False
 
 
+def _connect_as_project(connection: Any, project: Any) -> Any:
+    project_connection = connection.connect_as_project(project)
+    # keystone tokens are project scoped so each project needs its own
+    # connection, but there is no need for each to open its own HTTP
+    # connections too
+    project_connection.session.session = connection.session.session
+    return project_connection
+
+
 class ProjectCleanup(command.Command):
     _description = _("Clean resources associated with a project")
 
@@ -70,7 +88,36 @@ class ProjectCleanup(command.Command):
         project_group.add_argument(
             '--project',
             metavar='<project>',
-            help=_('Project to clean (name or ID)'),
+            action='append',
+            help=_(
+                'Project to clean (name or ID) (repeat option to clean '
+                'multiple projects)'
+            ),
+        )
+        project_group.add_argument(
+            '--projects-tagged',
+            metavar='<tag>',
+            action='append',
+            help=_(
+                'Clean all projects which have the given tag (repeat '
+                'option to only clean projects which have all given '
+                'tags)'
+            ),
+        )
+        project_group.add_argument(
+            '--projects-disabled',
+            action='store_true',
+            help=_('Clean all disabled projects'),
+        )
+        parser.add_argument(
+            '--project-concurrency',
+            metavar='<count>',
+            type=int,
+            default=PROJECT_CONCURRENCY,
+            help=_(
+                'Maximum number of projects to clean concurrently '
+                '(default: %(default)s)'
+            ),
         )
         parser.add_argument(
             '--created-before',
@@ -88,78 +135,358 @@ class ProjectCleanup(command.Command):
             help='Skip cleanup of specific resource (repeat if necessary)',
             action='append',
         )
+        parser.add_argument(
+            '--plan-out',
+            metavar='<file>',
+            help=_(
+                'Write the resources found to <file> as a cleanup plan, '
+                'which can later be executed with --plan-in. Only '
+                'supported when cleaning a single project.'
+            ),
+        )
+        parser.add_argument(
+            '--plan-in',
+            metavar='<file>',
+            help=_(
+                'Delete the resources of a cleanup plan previously written '
+                'with --plan-out instead of searching for resources. '
+                'The plan must have been created for the same project '
+                'and only a single project may be cleaned. '
+                '--created-before, --updated-before and --skip-resource '
+                'are ignored.'
+            ),
+        )
+        parser.add_argument(
+            '--journal',
+            metavar='<file>',
+            help=_(
+                'Record the resources to delete and the outcome of each '
+                'deletion in <file>. If <file> already exists, resume the '
+                'cleanup it records instead of searching for resources '
+                'again: resources already deleted are skipped once they '
+                'are confirmed to be gone and failed deletions are retried.'
+            ),
+        )
+        parser.add_argument(
+            '--plan-max-age',
+            metavar='<seconds>',
+            type=int,
+            default=PLAN_MAX_AGE,
+            help=_(
+                'Refuse to execute a cleanup plan given with --plan-in '
+                'which is older than <seconds>, and search for resources '
+                'again rather than resume a cleanup recorded by --journal '
+                'from a plan older than this (default: %(default)s)'
+            ),
+        )
         identity_common.add_project_domain_option_to_parser(parser)
         return parser
 
-    def take_action(self, parsed_args: argparse.Namespace) -> None:
-        connection = self.app.client_manager.sdk_connection
+    def _discover(
+        self,
+        connection: Any,
+        project_id: str | None,
+        parsed_args: argparse.Namespace,
+    ) -> cleanup_plan.CleanupPlan:
+        status_queue: queue.Queue[Any] = queue.Queue()
+
+        self.log.info('Searching resources...')
+
+        filters = {}
+        if parsed_args.created_before:
+            filters['created_at'] = parsed_args.created_before
+
+        if parsed_args.updated_before:
+            filters['updated_at'] = parsed_args.updated_before
+
+        connection.project_cleanup(
+            dry_run=True,
+            status_queue=status_queue,
+            filters=filters,
+            skip_resources=parsed_args.skip_resource,
+        )
+
+        resources = []
+        while not status_queue.empty():
+            resources.append(status_queue.get_nowait())
+            status_queue.task_done()
+        status_queue.join()
+
+        return cleanup_plan.CleanupPlan(project_id, resources)
+
+    def _show_progress(
+        self,
+        status_queue: queue.Queue[Any],
+        future: futures.Future[Any],
+        total: int,
+    ) -> None:
+        # the plan reports every deletion before it returns, so a marker
+        # queued once it is done tells us there is nothing left to report
+        future.add_done_callback(lambda _future: status_queue.put(None))
+
+        start = time.monotonic()
+        done = 0
+        while (status := status_queue.get()) is not None:
+            res, error = status
+            done += 1
+            rate = done / max(time.monotonic() - start, 0.001)
+            action = _('Failed to delete') if error else _('Deleted')
+            self.app.stderr.write(
+                f'[{done}/{total}] {action} {type(res).__name__} '
+                f'{res.id} ({rate:.1f}/s)\n'
+            )
+            self.app.stderr.flush()
 
+    def _get_projects(
+        self, connection: Any, parsed_args: argparse.Namespace
+    ) -> list[tuple[Any, str | None]]:
+        """Return a connection and project ID for each project to clean."""
         if parsed_args.auth_project:
             # is we've got a project already configured, use the connection
             # as-is
-            pass
-        elif parsed_args.project:
-            identity_client = sdk_utils.ensure_service_version(
-                connection.identity, '3'
-            )
-            project = identity_client.find_project(
-                name_or_id=parsed_args.project, ignore_missing=False
+            return [(connection, connection.current_project_id)]
+
+        identity_client = sdk_utils.ensure_service_version(
+            connection.identity, '3'
+        )
+        kwargs: dict[str, Any] = {}
+        if parsed_args.project_domain:
+            resolver = self.app.client_manager.identity_resolver
+            kwargs['domain_id'] = resolver.find_domain_id(
+                parsed_args.project_domain
             )
-            connection = connection.connect_as_project(project)
 
-        if connection:
-            status_queue: queue.Queue[Any] = queue.Queue()
-            parsed_args.max_width = int(
-                os.environ.get('CLIFF_MAX_TERM_WIDTH', 0)
+        if parsed_args.project:
+            projects = [
+                identity_client.find_project(
+                    name_or_id=name_or_id, ignore_missing=False, **kwargs
+                )
+                for name_or_id in parsed_args.project
+            ]
+        else:
+            if parsed_args.projects_tagged:
+                kwargs['tags'] = ','.join(parsed_args.projects_tagged)
+            if parsed_args.projects_disabled:
+                kwargs['is_enabled'] = False
+            projects = list(identity_client.projects(**kwargs))
+
+        # the same project may have been given by name and by ID
+        unique = {project.id: project for project in projects}
+        return [
+            (_connect_as_project(connection, project), project_id)
+            for project_id, project in unique.items()
+        ]
+
+    def _discover_all(
+        self,
+        projects: list[tuple[Any, str | None]],
+        parsed_args: argparse.Namespace,
+        journal: cleanup_plan.CleanupJournal | None = None,
+    ) -> tuple[list[tuple[Any, cleanup_plan.CleanupPlan]], list[str | None]]:
+        def _discover(
+            project: tuple[Any, str | None],
+        ) -> cleanup_plan.CleanupPlan | None:
+            project_connection, project_id = project
+            plan = None
+            if journal is not None:
+                plan = journal.plans.get(project_id)
+            max_age = parsed_args.plan_max_age
+            if plan is not None and max_age is not None and plan.age > max_age:
+                self.log.info(
+                    _(
+                        'Journaled cleanup plan of project %(project)s is '
+                        '%(age)d seconds old, which is more than the allowed '
+                        '%(max_age)d seconds; searching resources again'
+                    ),
+                    {
+                        'project': project_id,
+                        'age': plan.age,
+                        'max_age': max_age,
+                    },
+                )
+                plan = None
+            if plan is not None:
+                assert journal is not None  # narrow type
+                counts = journal.get_counts(project_id)
+                self.log.info(
+                    _(
+                        'Resuming cleanup of project %(project)s: '
+                        '%(deleted)d deleted, %(failed)d failed'
+                    ),
+                    {
+                        'project': project_id,
+                        'deleted': counts['deleted'],
+                        'failed': counts['failed'],
+                    },
+                )
+                return plan
+            try:
+                return self._discover(
+                    project_connection, project_id, parsed_args
+                )
+            except Exception as e:
+                if len(projects) == 1:
+                    raise
+                LOG.error(
+                    _(
+                        'Failed to search resources of project %(project)s: '
+                        '%(error)s'
+                    ),
+                    {'project': project_id, 'error': e},
+                )
+                return None
+
+        with futures.ThreadPoolExecutor(
+            max_workers=parsed_args.project_concurrency
+        ) as executor:
+            results = list(executor.map(_discover, projects))
+
+        plans = []
+        failed = []
+        for (project_connection, project_id), plan in zip(projects, results):
+            if plan is None:
+                failed.append(project_id)
+            else:
+                plans.append((project_connection, plan))
+        return plans, failed
+
+    def _execute_all(
+        self,
+        plans: list[tuple[Any, cleanup_plan.CleanupPlan]],
+        status_queue: queue.Queue[Any],
+        max_projects: int,
+        journal: cleanup_plan.CleanupJournal | None = None,
+    ) -> list[list[tuple[Any, Exception]]]:
+        with futures.ThreadPoolExecutor(max_workers=max_projects) as executor:
+            return list(
+                executor.map(
+                    lambda item: item[1].execute(
+                        item[0], status_queue, journal
+                    ),
+                    plans,
+                )
             )
-            parsed_args.fit_width = bool(
-                int(os.environ.get('CLIFF_FIT_WIDTH', 0))
+
+    def take_action(self, parsed_args: argparse.Namespace) -> None:
+        if parsed_args.project_concurrency < 1:
+            msg = _('--project-concurrency must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        connection = self.app.client_manager.sdk_connection
+        projects = self._get_projects(connection, parsed_args)
+
+        if (parsed_args.plan_in or parsed_args.plan_out) and len(
+            projects
+        ) != 1:
+            msg = _(
+                '--plan-in and --plan-out can only be used when cleaning '
+                'a single project'
             )
-            parsed_args.print_empty = False
-            table_fmt = table.TableFormatter()
+            raise exceptions.CommandError(msg)
 
-            self.log.info('Searching resources...')
+        if not projects:
+            self.log.warning(_('No projects match the given criteria'))
+            return
 
-            filters = {}
-            if parsed_args.created_before:
-                filters['created_at'] = parsed_args.created_before
+        parsed_args.max_width = int(os.environ.get('CLIFF_MAX_TERM_WIDTH', 0))
+        parsed_args.fit_width = bool(int(os.environ.get('CLIFF_FIT_WIDTH', 0)))
+        parsed_args.print_empty = False
+        table_fmt = table.TableFormatter()
 
-            if parsed_args.updated_before:
-                filters['updated_at'] = parsed_args.updated_before
+        journal = None
+        if parsed_args.journal:
+            journal = cleanup_plan.CleanupJournal(parsed_args.journal)
 
-            connection.project_cleanup(
-                dry_run=True,
-                status_queue=status_queue,
-                filters=filters,
-                skip_resources=parsed_args.skip_resource,
+        failed_projects: list[str | None] = []
+        if parsed_args.plan_in:
+            project_connection, project_id = projects[0]
+            plan = cleanup_plan.CleanupPlan.load(parsed_args.plan_in)
+            plan.check(project_id, parsed_args.plan_max_age)
+            plans = [(project_connection, plan)]
+        else:
+            plans, failed_projects = self._discover_all(
+                projects, parsed_args, journal
             )
 
-            data = []
-            while not status_queue.empty():
-                resource = status_queue.get_nowait()
-                data.append(
-                    (type(resource).__name__, resource.id, resource.name)
-                )
-                status_queue.task_done()
-            status_queue.join()
-            table_fmt.emit_list(
-                ('Type', 'ID', 'Name'), data, self.app.stdout, parsed_args
-            )
+        if parsed_args.plan_out:
+            plans[0][1].save(parsed_args.plan_out)
+
+        if len(projects) == 1:
+            columns: tuple[str, ...] = ('Type', 'ID', 'Name')
+            data: list[tuple[Any, ...]] = plans[0][1].rows()
+        else:
+            columns = ('Project', 'Type', 'ID', 'Name')
+            data = [
+                (plan.project_id, *row)
+                for _conn, plan in plans
+                for row in plan.rows()
+            ]
+        table_fmt.emit_list(columns, data, self.app.stdout, parsed_args)
 
-            if parsed_args.dry_run:
+        total = sum(len(plan) for _conn, plan in plans)
+        if parsed_args.dry_run or not total:
+            self._check_failures(failed_projects)
+            return
+
+        if not parsed_args.auto_approve:
+            if not ask_user_yesno(
+                _("These resources will be deleted. Are you sure")
+            ):
                 return
 
-            if not parsed_args.auto_approve:
-                if not ask_user_yesno(
-                    _("These resources will be deleted. Are you sure")
-                ):
-                    return
+        self.log.warning(_('Deleting resources'))
+
+        status_queue: queue.Queue[Any] = queue.Queue()
+        try:
+            if journal is not None:
+                for _conn, plan in plans:
+                    if journal.plans.get(plan.project_id) is not plan:
+                        journal.record_plan(plan)
 
-            self.log.warning(_('Deleting resources'))
+            with futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    self._execute_all,
+                    plans,
+                    status_queue,
+                    parsed_args.project_concurrency,
+                    journal,
+                )
+                self._show_progress(status_queue, future, total)
+            results = future.result()
+        finally:
+            if journal is not None:
+                journal.close()
 
-            connection.project_cleanup(
-                dry_run=False,
-                status_queue=status_queue,
-                filters=filters,
-                skip_resources=parsed_args.skip_resource,
+        if len(projects) > 1:
+            report = [
+                (plan.project_id, len(plan) - len(failures), len(failures))
+                for (_conn, plan), failures in zip(plans, results)
+            ]
+            table_fmt.emit_list(
+                ('Project', 'Deleted', 'Failed'),
+                report,
+                self.app.stdout,
+                parsed_args,
             )
+
+        self._check_failures(
+            failed_projects,
+            sum(len(failures) for failures in results),
+            total,
+        )
+
+    def _check_failures(
+        self,
+        failed_projects: list[str | None],
+        failed: int = 0,
+        total: int = 0,
+    ) -> None:
+        errors = []
+        if failed_projects:
+            msg = _("Failed to search resources of %(count)d project(s)")
+            errors.append(msg % {'count': len(failed_projects)})
+        if failed:
+            msg = _("%(failed)d of %(total)d resources failed to delete")
+            errors.append(msg % {'failed': failed, 'total': total})
+        if errors:
+            raise exceptions.CommandError('; '.join(errors))
@@ -0,0 +1,594 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+
+"""Helpers for moving large amounts of data efficiently"""
+
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent import futures
+import hashlib
+import json
+import logging
+import mmap
+import os
+import queue
+import threading
+from typing import Any
+
+from osc_lib import exceptions
+
+from openstackclient.common import progressbar
+from openstackclient.i18n import _
+
+# Reads start at the minimum buffer size, so that the first data arrives
+# quickly, and double while they keep filling the buffer
+MIN_BUFFER_SIZE = 64 * 1024
+MAX_BUFFER_SIZE = 8 * 1024 * 1024
+# The number of buffers shared by the reader and the writer
+BUFFER_COUNT = 4
+# The size of the blocks checked for zeros when writing sparse files, which
+# matches the block size of most filesystems
+SPARSE_BLOCK_SIZE = 4096
+
+LOG = logging.getLogger(__name__)
+
+
+def run_concurrently(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    concurrency: int,
+) -> Generator[tuple[Any, Any, Exception | None], None, None]:
+    """Call a function for each item using a pool of worker threads
+
+    Items are consumed lazily so that no more than twice ``concurrency``
+    calls are queued at a time, which keeps memory use bounded when the items
+    come from a very long listing.
+
+    :param func: the function to call with each item
+    :param items: the items to pass to the function
+    :param concurrency: the number of worker threads
+    :returns: an iterator of (item, result, error) tuples in completion order
+    """
+
+    def _collect(
+        future: futures.Future[Any], item: Any
+    ) -> tuple[Any, Any, Exception | None]:
+        try:
+            return item, future.result(), None
+        except Exception as e:
+            return item, None, e
+
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending: dict[futures.Future[Any], Any] = {}
+        for item in items:
+            if len(pending) >= concurrency * 2:
+                done, _not_done = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield _collect(future, pending.pop(future))
+            pending[executor.submit(func, item)] = item
+
+        for future in futures.as_completed(pending):
+            yield _collect(future, pending[future])
+
+
+def grow_connection_pool(session: Any, size: int) -> None:
+    """Let a session keep enough connections open for concurrent requests
+
+    requests keeps up to 10 idle connections per host by default and drops
+    any extra ones, so concurrent callers would otherwise keep opening new
+    connections.
+
+    :param session: a keystoneauth session
+    :param size: the number of connections to keep per host
+    """
+    requests_session = getattr(session, 'session', None)
+    if requests_session is None:
+        return
+
+    replaced: dict[int, Any] = {}
+    for prefix, adapter in list(requests_session.adapters.items()):
+        if getattr(adapter, '_pool_maxsize', size) >= size:
+            continue
+        if id(adapter) not in replaced:
+            replaced[id(adapter)] = type(adapter)(
+                pool_connections=adapter._pool_connections,
+                pool_maxsize=size,
+            )
+        requests_session.mount(prefix, replaced[id(adapter)])
+
+
+def read_ahead(
+    source: Any,
+    hashers: Iterable[Any] = (),
+    buffer_size: int | None = None,
+    count: int = BUFFER_COUNT,
+) -> Generator[memoryview, None, None]:
+    """Read a binary stream ahead of its consumer
+
+    A background thread reads from the source into a bounded ring of
+    reusable buffers, hashing each one as it is filled, while the caller
+    consumes the buffers already filled. Waiting on a slow source such as
+    a pipe or a network filesystem therefore overlaps with the work done
+    on the data, rather than the two taking turns.
+
+    Each buffer is yielded as a ``memoryview`` which is only valid until
+    the next one is requested, as its buffer is then handed back to the
+    reader.
+
+    :param source: a binary stream with a ``readinto`` method
+    :param hashers: ``hashlib`` objects to update with the data
+    :param buffer_size: a fixed size for reads, rather than letting them
+        grow from ``MIN_BUFFER_SIZE`` to ``MAX_BUFFER_SIZE``
+    :param count: the number of buffers to fill ahead of the consumer
+    """
+    hashers = list(hashers)
+    max_size = buffer_size or MAX_BUFFER_SIZE
+    read_size = buffer_size or MIN_BUFFER_SIZE
+
+    free: queue.Queue[bytearray | None] = queue.Queue()
+    for _buffer in range(count):
+        free.put(bytearray(max_size))
+    filled: queue.Queue[tuple[bytearray, int] | None] = queue.Queue()
+    errors: list[BaseException] = []
+
+    def _read() -> None:
+        nonlocal read_size
+        try:
+            while (buf := free.get()) is not None:
+                filled_size = source.readinto(memoryview(buf)[:read_size])
+                if not filled_size:
+                    break
+                for hasher in hashers:
+                    hasher.update(memoryview(buf)[:filled_size])
+                filled.put((buf, filled_size))
+                if filled_size == read_size:
+                    read_size = min(read_size * 2, max_size)
+        except BaseException as e:
+            errors.append(e)
+        filled.put(None)
+
+    reader = threading.Thread(target=_read, daemon=True)
+    reader.start()
+
+    try:
+        while (item := filled.get()) is not None:
+            buf, filled_size = item
+            with memoryview(buf)[:filled_size] as data:
+                yield data
+            free.put(buf)
+    finally:
+        # stop the reader at its next buffer if the consumer gave up; a
+        # reader blocked on the source is left to finish in the background
+        free.put(None)
+
+    reader.join()
+    if errors:
+        raise errors[0]
+
+
+def copy(
+    source: Any,
+    write: Callable[[memoryview], Any],
+    hashers: Iterable[Any] = (),
+    buffer_size: int | None = None,
+) -> int:
+    """Copy a binary stream, reading and writing from separate threads
+
+    The source is read ahead of the writes by :func:`read_ahead`, so that
+    waiting on the network overlaps with writing the data. Neither hashing
+    nor writing holds the GIL for large buffers, so the two threads
+    genuinely run in parallel.
+
+    :param source: a binary stream with a ``readinto`` method, such as the
+        ``raw`` attribute of a streamed response
+    :param write: the function to call with each buffer of data
+    :param hashers: ``hashlib`` objects to update with the data
+    :param buffer_size: a fixed size for reads, rather than letting them
+        grow from ``MIN_BUFFER_SIZE`` to ``MAX_BUFFER_SIZE``
+    :returns: the number of bytes copied
+    """
+    total = 0
+    for data in read_ahead(source, hashers, buffer_size):
+        write(data)
+        total += len(data)
+    return total
+
+
+class UploadSource:
+    """A local file to upload without copying it through Python reads
+
+    Iterating over the source yields ``memoryview`` slices of a memory
+    mapping of the file, which the HTTP layer hands straight to the socket.
+    Files which cannot be mapped, such as empty files and pipes, are read
+    ahead of the upload by a background thread instead. The data is hashed
+    as it is sent so that it can be compared with the checksum computed by
+    the server without reading the file a second time, and the hashes start
+    afresh each time the source is iterated, as happens when a request is
+    retried.
+
+    The source deliberately has no ``read`` method, so that requests and
+    urllib3 iterate over it in large slices rather than reading it in small
+    blocks, and its length is used as the Content-Length of the request.
+
+    :param path: the path of the file to upload
+    :param algorithms: the names of the ``hashlib`` algorithms to compute
+    :param progress: a transfer to report the progress of the upload to
+    :param chunk_size: the size of the slices to send
+    """
+
+    def __init__(
+        self,
+        path: str,
+        algorithms: Iterable[str] = (),
+        progress: progressbar.Transfer | None = None,
+        chunk_size: int = MAX_BUFFER_SIZE,
+    ) -> None:
+        self.path = path
+        self.algorithms = tuple(algorithms)
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self.hashers: dict[str, Any] = {}
+        self._file = open(path, 'rb', buffering=0)
+        self.size = os.fstat(self._file.fileno()).st_size
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __bool__(self) -> bool:
+        # an empty file is still data to upload
+        return True
+
+    def __enter__(self) -> 'UploadSource':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def hexdigests(self) -> dict[str, str]:
+        """Get the hashes of the data sent, by algorithm"""
+        return {
+            algorithm: hasher.hexdigest()
+            for algorithm, hasher in self.hashers.items()
+        }
+
+    def __iter__(self) -> Iterator[memoryview]:
+        self.hashers = {
+            algorithm: hashlib.new(algorithm) for algorithm in self.algorithms
+        }
+        try:
+            mapping = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except (OSError, ValueError):
+            yield from self._iter_read()
+            return
+
+        with mapping, memoryview(mapping) as view:
+            if hasattr(mapping, 'madvise'):
+                mapping.madvise(mmap.MADV_SEQUENTIAL)
+            # hash the mapping in another thread while it is sent; hashing
+            # releases the GIL, so the upload takes as long as the slower of
+            # the two rather than both one after the other
+            stop = threading.Event()
+            hashing = threading.Thread(
+                target=self._hash_view, args=(view, stop), daemon=True
+            )
+            hashing.start()
+            sent = False
+            try:
+                for offset in range(0, len(view), self.chunk_size):
+                    # release each slice once it has been sent, as the
+                    # mapping cannot be closed while any views of it remain
+                    with view[offset : offset + self.chunk_size] as data:
+                        if self.progress is not None:
+                            self.progress.update(len(data))
+                        yield data
+                sent = True
+                if self.progress is not None:
+                    self.progress.finish()
+            finally:
+                if not sent:
+                    stop.set()
+                hashing.join()
+
+    def _hash_view(self, view: memoryview, stop: threading.Event) -> None:
+        for offset in range(0, len(view), self.chunk_size):
+            if stop.is_set():
+                return
+            with view[offset : offset + self.chunk_size] as data:
+                for hasher in self.hashers.values():
+                    hasher.update(data)
+
+    def _iter_read(self) -> Iterator[memoryview]:
+        self._file.seek(0)
+        for data in read_ahead(
+            self._file, self.hashers.values(), self.chunk_size
+        ):
+            if self.progress is not None:
+                self.progress.update(len(data))
+            yield data
+        if self.progress is not None:
+            self.progress.finish()
+
+
+class StreamSource:
+    """A stream, such as stdin, to upload as it is read
+
+    The stream is read ahead of the upload by :func:`read_ahead`, so that a
+    slow producer such as a conversion piped into the command keeps working
+    while earlier data is sent. As with :class:`UploadSource` the data is
+    hashed as it is read. A stream can only be read once, so the source
+    cannot be iterated again to retry a request.
+
+    If the size of the data is given it is used as the Content-Length of
+    the request, and the upload fails if the stream turns out to hold more
+    or less data than that. Otherwise the data is sent in chunks.
+
+    :param stream: the binary stream to upload
+    :param size: the number of bytes the stream will provide, if known
+    :param algorithms: the names of the ``hashlib`` algorithms to compute
+    :param buffer_size: the size of the buffers to read into
+    """
+
+    def __init__(
+        self,
+        stream: Any,
+        size: int | None = None,
+        algorithms: Iterable[str] = (),
+        buffer_size: int = MAX_BUFFER_SIZE,
+    ) -> None:
+        self.stream = stream
+        self.size = size
+        self.buffer_size = buffer_size
+        self.hashers = {
+            algorithm: hashlib.new(algorithm) for algorithm in algorithms
+        }
+        self._started = False
+
+    def __len__(self) -> int:
+        if self.size is None:
+            # requests falls back to a chunked upload
+            raise TypeError('the size of the stream is not known')
+        return self.size
+
+    def __bool__(self) -> bool:
+        return True
+
+    def hexdigests(self) -> dict[str, str]:
+        """Get the hashes of the data sent, by algorithm"""
+        return {
+            algorithm: hasher.hexdigest()
+            for algorithm, hasher in self.hashers.items()
+        }
+
+    def __iter__(self) -> Iterator[memoryview]:
+        if self._started:
+            raise exceptions.CommandError(
+                _("The upload cannot be retried as its data has been read")
+            )
+        self._started = True
+
+        total = 0
+        for data in read_ahead(
+            self.stream, self.hashers.values(), self.buffer_size
+        ):
+            total += len(data)
+            if self.size is not None and total > self.size:
+                raise exceptions.CommandError(
+                    _("The data is larger than its size of %(size)s bytes")
+                    % {'size': self.size}
+                )
+            yield data
+
+        if self.size is not None and total < self.size:
+            raise exceptions.CommandError(
+                _(
+                    "The data ended after %(total)s bytes, short of its size "
+                    "of %(size)s bytes"
+                )
+                % {'total': total, 'size': self.size}
+            )
+
+
+class SparseWriter:
+    """Write to a file, seeking over blocks of zeros instead of writing them
+
+    This produces a sparse file on filesystems which support them. The file
+    must be newly created and seekable, and :meth:`finish` must be called
+    once all the data has been written so that the file has its full size
+    even if it ends with a hole.
+
+    :param file: a binary file object opened for writing
+    :param block_size: the size of the aligned blocks checked for zeros
+    """
+
+    def __init__(self, file: Any, block_size: int = SPARSE_BLOCK_SIZE) -> None:
+        self.file = file
+        self.block_size = block_size
+        self.offset = 0
+        self._zeros = bytes(block_size)
+
+    def write(self, data: memoryview) -> None:
+        # check each block aligned to its offset in the file so that holes
+        # line up with filesystem blocks, then write or seek over each run of
+        # blocks at once; comparing bytes objects is a memcmp, not a loop
+        base = self.offset
+        run_start = 0
+        run_is_zero = False
+        start = 0
+        while start < len(data):
+            end = min(
+                start + self.block_size - (base + start) % self.block_size,
+                len(data),
+            )
+            zeros = self._zeros
+            if end - start != self.block_size:
+                zeros = zeros[: end - start]
+            is_zero = data[start:end].tobytes() == zeros
+            if is_zero != run_is_zero:
+                self._flush(data[run_start:start], run_is_zero)
+                run_start = start
+                run_is_zero = is_zero
+            start = end
+        self._flush(data[run_start:], run_is_zero)
+        self.offset = base + len(data)
+
+    def _flush(self, data: memoryview, is_zero: bool) -> None:
+        if not data:
+            return
+        if is_zero:
+            self.file.seek(len(data), os.SEEK_CUR)
+        else:
+            self.file.write(data)
+
+    def finish(self) -> None:
+        """Extend the file to its full size if it ends with a hole"""
+        self.file.truncate(self.offset)
+
+
+class RangedDownload:
+    """Download a file as concurrent ranges, resuming after interruptions
+
+    Each range is written at its offset in ``<path>.part``, which is
+    preallocated so that the download fails early if the disk is too small,
+    and the ranges completed so far are recorded in ``<path>.part.json``.
+    Running a download again with the same ``identity`` only fetches the
+    ranges it is missing. Once :meth:`run` returns the caller verifies the
+    part file and then calls :meth:`commit` or :meth:`discard`.
+
+    :param path: the path of the file to download to
+    :param size: the size of the file in bytes
+    :param range_size: the size of each range in bytes
+    :param identity: details of the data, such as its checksum, which must
+        match for the progress of an earlier download to be reused
+    """
+
+    def __init__(
+        self,
+        path: str,
+        size: int,
+        range_size: int,
+        identity: dict[str, Any],
+    ) -> None:
+        self.path = path
+        self.size = size
+        self.range_size = range_size
+        self.part_path = path + '.part'
+        self.state_path = self.part_path + '.json'
+        self._state = dict(identity, size=size, range_size=range_size)
+
+    def _load_done(self) -> set[int]:
+        try:
+            with open(self.state_path) as fh:
+                saved = json.load(fh)
+        except (OSError, ValueError):
+            return set()
+        if not isinstance(saved, dict) or not os.path.exists(self.part_path):
+            return set()
+        if {k: saved.get(k) for k in self._state} != self._state:
+            LOG.debug('Discarding stale progress in %s', self.state_path)
+            return set()
+        return set(saved.get('done', []))
+
+    def _save_done(self, done: set[int]) -> None:
+        # replace the file atomically so an interruption never leaves a
+        # partially written file behind
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as fh:
+            json.dump(dict(self._state, done=sorted(done)), fh)
+        os.replace(tmp_path, self.state_path)
+
+    def run(
+        self,
+        fetch: Callable[[int, int], Iterable[bytes]],
+        concurrency: int,
+        progress: progressbar.Transfer | None = None,
+    ) -> None:
+        """Fetch the ranges which have not been downloaded yet
+
+        :param fetch: a function called with the first and last offsets of a
+            range, inclusive, which returns an iterable of its data
+        :param concurrency: the number of ranges to fetch at once
+        :param progress: a transfer to report the progress of the download to
+        :raises: the first error raised while fetching a range, once the
+            ranges completed so far have been recorded
+        """
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        done = self._load_done()
+        fd = os.open(self.part_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if not done:
+                os.ftruncate(fd, 0)
+                if hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(fd, 0, self.size)
+                else:
+                    os.ftruncate(fd, self.size)
+            elif progress is not None:
+                progress.skip(
+                    sum(
+                        min(self.range_size, self.size - i * self.range_size)
+                        for i in done
+                    )
+                )
+
+            def _fetch(index: int) -> None:
+                start = index * self.range_size
+                end = min(start + self.range_size, self.size) - 1
+                offset = start
+                for chunk in fetch(start, end):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
+                if offset != end + 1:
+                    msg = _("Short read of range %(start)s-%(end)s") % {
+                        'start': start,
+                        'end': end,
+                    }
+                    raise exceptions.CommandError(msg)
+
+            # after an error stop starting new ranges, but still record the
+            # ones already being fetched so that they are not fetched again
+            errors: list[Exception] = []
+            count = -(-self.size // self.range_size)
+            missing = (i for i in range(count) if i not in done and not errors)
+            for index, _result, error in run_concurrently(
+                _fetch, missing, concurrency
+            ):
+                if error is not None:
+                    errors.append(error)
+                    continue
+                done.add(index)
+                self._save_done(done)
+            if errors:
+                raise errors[0]
+        finally:
+            os.close(fd)
+
+    def commit(self) -> None:
+        """Move the downloaded file into place"""
+        os.replace(self.part_path, self.path)
+        os.unlink(self.state_path)
+
+    def discard(self) -> None:
+        """Remove the downloaded data and the record of its progress"""
+        for path in (self.part_path, self.state_path):
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
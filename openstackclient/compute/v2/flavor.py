@@ -17,6 +17,7 @@
 
 import argparse
 from collections.abc import Iterable, Sequence
+from concurrent import futures
 import logging
 from typing import Any
 
@@ -28,6 +29,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient import command
+from openstackclient.common import cache
 from openstackclient.common import pagination
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
@@ -35,6 +37,12 @@ from openstackclient.identity import common as identity_common
 
 LOG = logging.getLogger(__name__)
 
+# Maximum number of flavor extra specs requests issued concurrently
+EXTRA_SPECS_CONCURRENCY = 8
+
+# Nova does not record when extra specs change, so cached ones must expire
+EXTRA_SPECS_CACHE_MAX_AGE = 60 * 60
+
 
 _formatters = {
     'extra_specs': format_columns.DictColumn,
@@ -321,13 +329,68 @@ class ListFlavor(command.Lister):
             default=False,
             help=_("List additional fields in output"),
         )
+        parser.add_argument(
+            '--cache-properties',
+            action='store_true',
+            default=False,
+            help=_(
+                "Cache flavor properties on disk and reuse them across "
+                "invocations when the server does not include them in the "
+                "listing. Cached properties are refreshed after an hour. "
+                "Only used with --long."
+            ),
+        )
         pagination.add_marker_pagination_option_to_parser(parser)
         return parser
 
+    def _fetch_extra_specs(
+        self, compute_client: Any, flavors: list[Any], use_cache: bool
+    ) -> None:
+        # Starting with 2.61 the server embeds extra specs in the listing, so
+        # an empty set means the flavor has none. Policy can still stop it
+        # sending them though, so fetch them for any flavor whose listing
+        # didn't include them
+        embedded = sdk_utils.supports_microversion(compute_client, '2.61')
+        missing = [
+            f
+            for f in flavors
+            if not (embedded and 'extra_specs' in f._body)
+            and not f.extra_specs
+        ]
+        if not missing:
+            return
+
+        spec_cache = None
+        if use_cache:
+            spec_cache = cache.FileCache(
+                self.app.client_manager.get_cache_file('flavor-extra-specs'),
+                max_age=EXTRA_SPECS_CACHE_MAX_AGE,
+            )
+            for f in missing:
+                if f.id in spec_cache:
+                    f.extra_specs = spec_cache.get(f.id)
+            missing = [f for f in missing if f.id not in spec_cache]
+
+        if missing:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(missing), EXTRA_SPECS_CONCURRENCY)
+            ) as executor:
+                # consume the results so that any errors are raised here
+                list(
+                    executor.map(
+                        compute_client.fetch_flavor_extra_specs, missing
+                    )
+                )
+
+        if spec_cache is not None:
+            spec_cache.update({f.id: f.extra_specs for f in missing})
+            spec_cache.save()
+
     def take_action(
         self, parsed_args: argparse.Namespace
     ) -> tuple[tuple[str, ...], Iterable[tuple[Any, ...]]]:
         compute_client = self.app.client_manager.compute
+
         # is_public is ternary - None means give all flavors,
         # True is public only and False is private only
         # By default Nova assumes True and gives admins public flavors
@@ -356,11 +419,10 @@ class ListFlavor(command.Lister):
             query_attrs['min_ram'] = parsed_args.min_ram
 
         data = list(compute_client.flavors(**query_attrs))  # type: ignore[arg-type]
-        # Even if server supports 2.61 some policy might stop it sending us
-        # extra_specs. So try to fetch them if they are absent
-        for f in data:
-            if parsed_args.long and not f.extra_specs:
-                compute_client.fetch_flavor_extra_specs(f)
+        if parsed_args.long:
+            self._fetch_extra_specs(
+                compute_client, data, parsed_args.cache_properties
+            )
 
         columns: tuple[str, ...] = (
             "id",
@@ -35,6 +35,7 @@ from osc_lib import utils
 
 from openstackclient.api import compute_v2
 from openstackclient import command
+from openstackclient.common import cache
 from openstackclient.common import envvars
 from openstackclient.common import pagination
 from openstackclient.i18n import _
@@ -44,6 +45,65 @@ LOG = logging.getLogger(__name__)
 
 IMAGE_STRING_FOR_BFV = 'N/A (booted from volume)'
 
+# The image attributes which --image-property filters are passed to the image
+# service for, as it matches them exactly as the client would
+IMAGE_SERVER_FILTERS = ('id', 'name', 'owner', 'status')
+
+# The image service does not tell us when public images change, so the cached
+# index of their properties must expire
+IMAGE_PROPERTIES_CACHE_MAX_AGE = 60 * 60
+
+
+def _get_image_property(image: Any, key: str) -> tuple[bool, Any]:
+    """Get an image property or attribute as --image-property compares it
+
+    Properties take precedence over attributes of the same name, and values
+    which cannot be compared are ignored.
+
+    :returns: whether the image has a comparable value and the value
+    """
+    properties = image.properties or {}
+    for source in (properties, image):
+        if key not in source:
+            continue
+        value = source[key]
+        try:
+            hash(value)
+        except TypeError:
+            LOG.debug(
+                "Skipped the '%s' attribute. That cannot be compared. "
+                "(image: %s, value: %s)",
+                key,
+                image.id,
+                value,
+            )
+            continue
+        return True, value
+    return False, None
+
+
+def _image_matches(image: Any, wanted: dict[str, str]) -> bool:
+    for key, value in wanted.items():
+        found, actual = _get_image_property(image, key)
+        if not found or actual != value:
+            return False
+    return True
+
+
+def _index_image_properties(image: Any) -> dict[str, str]:
+    """Get the image properties and attributes worth indexing
+
+    Only strings are kept, as --image-property values are always strings and
+    so could never match anything else.
+    """
+    index = {k: v for k, v in image.items() if isinstance(v, str)}
+    index.update(
+        (k, v)
+        for k, v in (image.properties or {}).items()
+        if isinstance(v, str)
+    )
+    return index
+
 
 class PowerStateColumn(cliff_columns.FormattableColumn[int]):
     """Generate a formatted string of a server's power state."""
@@ -1236,6 +1296,17 @@ class CreateServer(command.ShowOne):
                 'volume.'
             ),
         )
+        parser.add_argument(
+            '--cache-image-properties',
+            action='store_true',
+            default=False,
+            help=_(
+                'Look for the image matching --image-property in an index of '
+                'the properties of public images cached on disk, falling '
+                'back to searching all images if none in the index match. '
+                'The index is refreshed after an hour.'
+            ),
+        )
         parser.add_argument(
             '--boot-from-volume',
             metavar='<volume-size>',
@@ -1631,6 +1702,58 @@ class CreateServer(command.ShowOne):
         )
         return parser
 
+    def _match_cached_images(
+        self, image_client: Any, wanted: dict[str, str]
+    ) -> list[Any]:
+        index_cache = cache.FileCache(
+            self.app.client_manager.get_cache_file('image-properties'),
+            max_age=IMAGE_PROPERTIES_CACHE_MAX_AGE,
+        )
+        index = index_cache.get('public')
+        if index is None:
+            index = {
+                image.id: _index_image_properties(image)
+                for image in image_client.images(visibility='public')
+            }
+            index_cache.set('public', index)
+            index_cache.save()
+
+        images = []
+        for image_id, properties in index.items():
+            if not all(properties.get(k) == v for k, v in wanted.items()):
+                continue
+            # the index may be stale, so check candidates against the image
+            # service before using them
+            try:
+                image = image_client.get_image(image_id)
+            except sdk_exceptions.ResourceNotFound:
+                continue
+            if _image_matches(image, wanted):
+                images.append(image)
+        return images
+
+    def _match_images(
+        self, image_client: Any, wanted: dict[str, str], use_cache: bool
+    ) -> list[Any]:
+        if use_cache:
+            images = self._match_cached_images(image_client, wanted)
+            if images:
+                return images
+            LOG.debug('No cached public images match, searching all images')
+
+        # the image service matches these exactly as we would, so have it
+        # filter the listing rather than paging through every image
+        query = {
+            k: v
+            for k, v in wanted.items()
+            if k in IMAGE_SERVER_FILTERS and v and ':' not in v
+        }
+        return [
+            image
+            for image in image_client.images(**query)
+            if _image_matches(image, wanted)
+        ]
+
     def take_action(
         self, parsed_args: argparse.Namespace
     ) -> tuple[Sequence[str], Iterable[Any]]:
@@ -1654,43 +1777,11 @@ class CreateServer(command.ShowOne):
             )
 
         if not image and parsed_args.image_properties:
-
-            def _match_image(image_api: Any, wanted_properties: Any) -> Any:
-                image_list = image_api.images()
-                images_matched = []
-                for img in image_list:
-                    img_dict = {}
-
-                    # exclude any unhashable entries
-                    img_dict_items = list(img.items())
-                    if img.properties:
-                        img_dict_items.extend(list(img.properties.items()))
-                    for key, value in img_dict_items:
-                        try:
-                            {key, value}
-                        except TypeError:
-                            if key != 'properties':
-                                LOG.debug(
-                                    'Skipped the \'%s\' attribute. '
-                                    'That cannot be compared. '
-                                    '(image: %s, value: %s)',
-                                    key,
-                                    img.id,
-                                    value,
-                                )
-                            pass
-                        else:
-                            img_dict[key] = value
-
-                    if all(
-                        k in img_dict and img_dict[k] == v
-                        for k, v in wanted_properties.items()
-                    ):
-                        images_matched.append(img)
-
-                return images_matched
-
-            images = _match_image(image_client, parsed_args.image_properties)
+            images = self._match_images(
+                image_client,
+                parsed_args.image_properties,
+                parsed_args.cache_image_properties,
+            )
             if len(images) > 1:
                 img_uuid_list = [str(image.id) for image in images]
                 LOG.warning(
@@ -17,18 +17,28 @@
 
 import argparse
 from collections.abc import Collection, Iterable, Sequence
+from concurrent import futures
 import datetime
 import functools
+import math
 from typing import Any
 
 from cliff import columns as cliff_columns
 from openstack import utils as sdk_utils
+from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient import command
+from openstackclient.common import cache
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
+# Project names rarely change, but don't trust cached ones forever
+PROJECT_NAME_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Maximum number of usage shards fetched concurrently
+USAGE_SHARD_CONCURRENCY = 4
+
 
 # TODO(stephenfin): This exists in a couple of places and should be moved to a
 # common module
@@ -112,6 +122,79 @@ def _merge_usage_list(usages: Any, next_usage_list: Any) -> None:
             usages[next_usage.project_id] = next_usage
 
 
+def _shard_range(
+    start: datetime.datetime,
+    end: datetime.datetime,
+    interval: datetime.timedelta,
+) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """Split a time window into adjacent sub-windows of at most interval."""
+    shards = []
+    shard_start = start
+    while shard_start < end:
+        shard_end = min(shard_start + interval, end)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end
+    return shards
+
+
+def _merge_project_usages(usages: list[Any]) -> Any:
+    """Merge the usage of a single project over adjacent time windows.
+
+    Nova reports the usage of a server that spans several windows in each of
+    them, so servers are merged by instance ID and their hours summed. All
+    sums use :func:`math.fsum` so the result does not depend on the number
+    of windows the range was split into.
+
+    :param usages: The usage records of the project, in chronological order
+    :returns: The first usage record, updated to cover all the windows
+    """
+    merged = usages[0]
+    if len(usages) == 1:
+        return merged
+
+    servers: dict[str, Any] = {}
+    server_hours: dict[str, list[float]] = {}
+    for usage in usages:
+        for server in usage.server_usages or []:
+            instance_id = server.instance_id
+            if instance_id in servers:
+                # keep the earliest start but the most recent state
+                server.started_at = servers[instance_id].started_at
+            servers[instance_id] = server
+            server_hours.setdefault(instance_id, []).append(server.hours or 0)
+
+    for instance_id, server in servers.items():
+        server.hours = math.fsum(server_hours[instance_id])
+
+    merged.server_usages = list(servers.values())
+    for field in (
+        'total_hours',
+        'total_memory_mb_usage',
+        'total_vcpus_usage',
+        'total_local_gb_usage',
+    ):
+        setattr(
+            merged,
+            field,
+            math.fsum(getattr(usage, field) or 0 for usage in usages),
+        )
+    merged.stop = usages[-1].stop
+    return merged
+
+
+def _merge_usage_shards(shards: Iterable[Iterable[Any]]) -> list[Any]:
+    """Merge per-project usage fetched for adjacent time windows.
+
+    :param shards: The usage records of each window, in chronological order
+    :returns: A single usage record per project
+    """
+    by_project: dict[str, list[Any]] = {}
+    for shard in shards:
+        for usage in shard:
+            by_project.setdefault(usage.project_id, []).append(usage)
+    return [_merge_project_usages(usages) for usages in by_project.values()]
+
+
 class ListUsage(command.Lister):
     _description = _("List resource usage per project")
 
@@ -131,21 +214,65 @@ class ListUsage(command.Lister):
             default=None,
             help=_("Usage range end date, ex 2012-01-20 (default: tomorrow)"),
         )
+        parser.add_argument(
+            '--shard-interval',
+            metavar='<days>',
+            type=int,
+            default=None,
+            help=_(
+                'Split the usage range into windows of this many days and '
+                'fetch them concurrently, merging the results. This can '
+                'avoid timeouts when listing usage over long periods.'
+            ),
+        )
+        parser.add_argument(
+            '--cache-project-names',
+            action='store_true',
+            default=False,
+            help=_(
+                'Cache project names on disk and reuse them across '
+                'invocations. Cached names are refreshed after a day.'
+            ),
+        )
         return parser
 
+    def _get_project_names(
+        self, project_ids: set[str], use_cache: bool
+    ) -> dict[str, str]:
+        name_cache = None
+        project_cache: dict[str, str] = {}
+        if use_cache:
+            name_cache = cache.FileCache(
+                self.app.client_manager.get_cache_file('project-names'),
+                max_age=PROJECT_NAME_CACHE_MAX_AGE,
+            )
+            project_cache = {
+                project_id: name_cache.get(project_id)
+                for project_id in project_ids
+                if project_id in name_cache
+            }
+
+        try:
+            project_cache.update(
+                self.app.client_manager.identity_resolver.find_project_names(
+                    project_ids - project_cache.keys()
+                )
+            )
+        except Exception:  # noqa: S110
+            # Just forget it if there's any trouble
+            pass
+
+        if name_cache is not None:
+            name_cache.update(project_cache)
+            name_cache.save()
+
+        return project_cache
+
     def take_action(
         self, parsed_args: argparse.Namespace
     ) -> tuple[tuple[str, ...], Iterable[tuple[Any, ...]]]:
-        def _format_project(project: str) -> str:
-            if not project:
-                return ""
-            if project in project_cache:
-                return project_cache[project]
-            else:
-                return project
-
         compute_client = self.app.client_manager.compute
-        identity_client = sdk_utils.ensure_service_version(
+        sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
 
@@ -179,22 +306,46 @@ class ListUsage(command.Lister):
         else:
             end = now + datetime.timedelta(days=1)
 
-        usage_list = list(
-            compute_client.usages(
-                start=start,
-                end=end,
-                detailed=True,
+        if parsed_args.shard_interval is None:
+            usage_list = list(
+                compute_client.usages(
+                    start=start,
+                    end=end,
+                    detailed=True,
+                )
+            )
+        else:
+            if parsed_args.shard_interval < 1:
+                msg = _("--shard-interval must be a positive number of days")
+                raise exceptions.CommandError(msg)
+
+            shards = _shard_range(
+                start,
+                end,
+                datetime.timedelta(days=parsed_args.shard_interval),
             )
-        )
 
-        # Cache the project list
-        project_cache = {}
-        try:
-            for p in identity_client.projects():
-                project_cache[p.id] = p.name
-        except Exception:  # noqa: S110
-            # Just forget it if there's any trouble
-            pass
+            def _fetch(
+                shard: tuple[datetime.datetime, datetime.datetime],
+            ) -> list[Any]:
+                return list(
+                    compute_client.usages(
+                        start=shard[0],
+                        end=shard[1],
+                        detailed=True,
+                    )
+                )
+
+            with futures.ThreadPoolExecutor(
+                max_workers=max(1, min(len(shards), USAGE_SHARD_CONCURRENCY))
+            ) as executor:
+                usage_list = _merge_usage_shards(executor.map(_fetch, shards))
+
+        # Only look up the names of the projects we're going to display
+        project_cache = self._get_project_names(
+            {u.project_id for u in usage_list if u.project_id},
+            parsed_args.cache_project_names,
+        )
 
         if parsed_args.formatter == 'table' and len(usage_list) > 0:
             self.app.stdout.write(
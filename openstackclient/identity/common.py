@@ -16,7 +16,10 @@
 """Common identity code"""
 
 import argparse
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent import futures
+import re
+import threading
 from typing import Any, cast
 
 from keystoneclient import exceptions as identity_exc
@@ -34,6 +37,25 @@ from osc_lib import utils
 
 from openstackclient.i18n import _
 
+# Keystone generates UUID4 hex IDs by default. Anything matching this can be
+# used as-is when the caller does not require the actor to exist.
+_ID_RE = re.compile(
+    r'^([0-9a-f]{32}|'
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$'
+)
+
+# Maximum number of identity lookups issued concurrently by resolve_many()
+DEFAULT_RESOLVER_WORKERS = 4
+
+# The resolver of the running command for each identity client; see
+# get_identity_resolver(). This is emptied before each command is run.
+_resolvers: dict[Any, 'IdentityResolver'] = {}
+_resolvers_lock = threading.Lock()
+
+# Above this many unknown projects, listing every project in a single request
+# is assumed to be cheaper than fetching each of them individually
+PROJECT_LIST_THRESHOLD = 100
+
 
 def find_service(identity_client: Any, name_type_or_id: str) -> Any:
     """Find a service by id, name or type."""
@@ -188,6 +210,29 @@ def _get_token_resource(
         return parsed_name
 
 
+def get_identity_resolver(
+    identity_client: identity_v2.Proxy | identity_v3.Proxy,
+) -> 'IdentityResolver':
+    """Get the resolver of the running command for an identity client
+
+    The ``find_*_id_sdk`` helpers and ``ClientManager.identity_resolver``
+    share this resolver, so every lookup made by a command is memoized
+    however it is made.
+    """
+    with _resolvers_lock:
+        resolver = _resolvers.get(identity_client)
+        if resolver is None:
+            resolver = IdentityResolver(identity_client)
+            _resolvers[identity_client] = resolver
+        return resolver
+
+
+def reset_identity_resolvers() -> None:
+    """Forget the lookups made by a previous command"""
+    with _resolvers_lock:
+        _resolvers.clear()
+
+
 def find_domain(identity_client: Any, name_or_id: str) -> domains.Domain:
     return _find_identity_resource(
         identity_client.domains, name_or_id, domains.Domain
@@ -200,9 +245,8 @@ def find_domain_id_sdk(
     *,
     validate_actor_existence: bool = True,
 ) -> str:
-    return _find_sdk_id(
-        identity_client.find_domain,
-        name_or_id=name_or_id,
+    return get_identity_resolver(identity_client).find_domain_id(
+        name_or_id,
         validate_actor_existence=validate_actor_existence,
     )
 
@@ -233,24 +277,11 @@ def find_group_id_sdk(
     *,
     validate_actor_existence: bool = True,
 ) -> str:
-    if domain_name_or_id is None:
-        return _find_sdk_id(
-            identity_client.find_group,
-            name_or_id=name_or_id,
-            validate_actor_existence=validate_actor_existence,
-        )
-
-    domain_id = find_domain_id_sdk(
-        identity_client,
-        name_or_id=domain_name_or_id,
+    return get_identity_resolver(identity_client).find_group_id(
+        name_or_id,
+        domain_name_or_id,
         validate_actor_existence=validate_actor_existence,
     )
-    return _find_sdk_id(
-        identity_client.find_group,
-        name_or_id=name_or_id,
-        validate_actor_existence=validate_actor_existence,
-        domain_id=domain_id,
-    )
 
 
 def find_project(
@@ -279,35 +310,11 @@ def find_project_id_sdk(
     validate_actor_existence: bool = True,
     validate_domain_actor_existence: bool | None = None,
 ) -> str:
-    if domain_name_or_id is None:
-        if isinstance(identity_client, identity_v2.Proxy):
-            return _find_sdk_id(
-                identity_client.find_tenant,
-                name_or_id=name_or_id,
-                validate_actor_existence=validate_actor_existence,
-            )
-
-        return _find_sdk_id(
-            identity_client.find_project,
-            name_or_id=name_or_id,
-            validate_actor_existence=validate_actor_existence,
-        )
-
-    if validate_domain_actor_existence is None:
-        validate_domain_actor_existence = validate_actor_existence
-
-    # only v3 supports the concept of domains
-    identity_client = sdk_utils.ensure_service_version(identity_client, '3')
-    domain_id = find_domain_id_sdk(
-        identity_client,
-        name_or_id=domain_name_or_id,
-        validate_actor_existence=validate_domain_actor_existence,
-    )
-    return _find_sdk_id(
-        identity_client.find_project,
-        name_or_id=name_or_id,
+    return get_identity_resolver(identity_client).find_project_id(
+        name_or_id,
+        domain_name_or_id,
         validate_actor_existence=validate_actor_existence,
-        domain_id=domain_id,
+        validate_domain_actor_existence=validate_domain_actor_existence,
     )
 
 
@@ -333,26 +340,11 @@ def find_user_id_sdk(
     *,
     validate_actor_existence: bool = True,
 ) -> str:
-    if domain_name_or_id is None:
-        return _find_sdk_id(
-            identity_client.find_user,
-            name_or_id=name_or_id,
-            validate_actor_existence=validate_actor_existence,
-        )
-
-    # only v3 supports the concept of domains
-    identity_client = sdk_utils.ensure_service_version(identity_client, '3')
-    domain_id = find_domain_id_sdk(
-        identity_client,
-        name_or_id=domain_name_or_id,
+    return get_identity_resolver(identity_client).find_user_id(
+        name_or_id,
+        domain_name_or_id,
         validate_actor_existence=validate_actor_existence,
     )
-    return _find_sdk_id(
-        identity_client.find_user,
-        name_or_id=name_or_id,
-        validate_actor_existence=validate_actor_existence,
-        domain_id=domain_id,
-    )
 
 
 def _find_identity_resource(
@@ -403,6 +395,7 @@ def _find_sdk_id(
     name_or_id: str,
     *,
     validate_actor_existence: bool = True,
+    resource_type: str = 'resource',
     **kwargs: Any,
 ) -> str:
     try:
@@ -414,10 +407,292 @@ def _find_sdk_id(
     except sdk_exceptions.ResourceNotFound as exc:
         if not validate_actor_existence:
             return name_or_id
-        raise exceptions.CommandError from exc
+        msg = _("No %(resource)s found for %(name)s") % {
+            'resource': resource_type,
+            'name': name_or_id,
+        }
+        raise exceptions.CommandError(msg) from exc
     return cast(str, resource.id)
 
 
+class IdentityResolver:
+    """Resolve identity resource names to IDs.
+
+    A resolver memoizes every ``(type, name_or_id, domain)`` lookup it
+    performs, so a command that references the same domain, project or user
+    several times only pays for a single round trip. One instance per
+    identity client is shared by everything a command does for the lifetime
+    of the command; see :func:`get_identity_resolver` and
+    ``ClientManager.identity_resolver``.
+
+    Values that look like IDs are returned as-is, without any API call, when
+    validation of the actor's existence is disabled.
+
+    :param identity_client: An SDK identity proxy, either v2 or v3
+    :param max_workers: Maximum number of lookups to issue concurrently from
+        :meth:`resolve_many`
+    """
+
+    def __init__(
+        self,
+        identity_client: identity_v2.Proxy | identity_v3.Proxy,
+        max_workers: int = DEFAULT_RESOLVER_WORKERS,
+    ) -> None:
+        self.identity_client = identity_client
+        self.max_workers = max_workers
+        self._cache: dict[tuple[str, str, str | None], str] = {}
+        self._project_names: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def resolve(
+        self,
+        resource_type: str,
+        name_or_id: str,
+        *,
+        validate_actor_existence: bool = True,
+        **kwargs: Any,
+    ) -> str:
+        """Resolve a single identity resource to its ID.
+
+        :param resource_type: The SDK resource name, for example ``domain``,
+            ``project``, ``tenant``, ``user``, ``group`` or ``role``
+        :param name_or_id: The name or ID of the resource
+        :param validate_actor_existence: Raise a ``CommandError`` if the
+            resource does not exist, rather than returning ``name_or_id``
+        :param kwargs: Additional filters for the underlying ``find_*`` call,
+            typically ``domain_id``
+        :returns: The ID of the resource
+        """
+        key = (resource_type, name_or_id, kwargs.get('domain_id'))
+        with self._lock:
+            if key in self._cache:
+                return self._cache[key]
+
+        # NOTE: openstacksdk's find_* calls already try a GET by ID before
+        # searching by name, so the only thing left to shortcut is the case
+        # where we have been told not to bother validating the ID at all
+        if not validate_actor_existence and _ID_RE.match(name_or_id):
+            return name_or_id
+
+        resource_id = _find_sdk_id(
+            getattr(self.identity_client, 'find_' + resource_type),
+            name_or_id=name_or_id,
+            validate_actor_existence=validate_actor_existence,
+            resource_type=resource_type,
+            **kwargs,
+        )
+
+        # don't remember names we were told to pass through unvalidated
+        if validate_actor_existence or resource_id != name_or_id:
+            with self._lock:
+                self._cache[key] = resource_id
+        return resource_id
+
+    def resolve_many(
+        self,
+        lookups: Iterable[tuple[str, str, dict[str, Any]]],
+        *,
+        validate_actor_existence: bool = True,
+    ) -> list[str]:
+        """Resolve several identity resources at once.
+
+        Duplicate lookups are only issued once, and lookups that are not
+        already memoized are issued concurrently.
+
+        :param lookups: An iterable of ``(resource_type, name_or_id, kwargs)``
+            tuples, as would be passed to :meth:`resolve`
+        :param validate_actor_existence: As for :meth:`resolve`
+        :returns: The IDs of the resources, in the order they were requested
+        """
+        lookups = list(lookups)
+        pending: dict[tuple[str, str, str | None], Any] = {}
+        with self._lock:
+            for resource_type, name_or_id, kwargs in lookups:
+                key = (resource_type, name_or_id, kwargs.get('domain_id'))
+                if key not in self._cache:
+                    pending.setdefault(
+                        key, (resource_type, name_or_id, kwargs)
+                    )
+
+        def _resolve(lookup: tuple[str, str, dict[str, Any]]) -> str:
+            resource_type, name_or_id, kwargs = lookup
+            return self.resolve(
+                resource_type,
+                name_or_id,
+                validate_actor_existence=validate_actor_existence,
+                **kwargs,
+            )
+
+        if len(pending) > 1 and self.max_workers > 1:
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(pending), self.max_workers)
+            ) as executor:
+                # consume the results so that any errors are raised here
+                list(executor.map(_resolve, pending.values()))
+
+        return [_resolve(lookup) for lookup in lookups]
+
+    def find_project_names(
+        self,
+        project_ids: Iterable[str],
+        *,
+        list_threshold: int = PROJECT_LIST_THRESHOLD,
+    ) -> dict[str, str]:
+        """Map project IDs to project names.
+
+        Only the requested projects are fetched, concurrently, unless there
+        are more than ``list_threshold`` of them that have not been seen
+        before, in which case all projects are listed instead. Projects that
+        cannot be found or that the user is not allowed to see are omitted
+        from the result.
+
+        :param project_ids: The IDs of the projects to look up
+        :param list_threshold: The number of unknown projects above which a
+            full listing is used
+        :returns: A dictionary of project names keyed by project ID
+        """
+        # projects are only a concept in v3; v2 calls them tenants
+        identity_client = sdk_utils.ensure_service_version(
+            self.identity_client, '3'
+        )
+        project_ids = set(project_ids)
+        with self._lock:
+            missing = project_ids - self._project_names.keys()
+
+        names: dict[str, str] = {}
+        if len(missing) > list_threshold:
+            for project in identity_client.projects():
+                names[project.id] = project.name
+        elif missing:
+
+            def _get_name(project_id: str) -> str | None:
+                try:
+                    project = identity_client.get_project(project_id)
+                except sdk_exceptions.SDKException:
+                    return None
+                return cast(str, project.name)
+
+            missing_ids = sorted(missing)
+            with futures.ThreadPoolExecutor(
+                max_workers=min(len(missing_ids), self.max_workers)
+            ) as executor:
+                for project_id, name in zip(
+                    missing_ids, executor.map(_get_name, missing_ids)
+                ):
+                    if name is not None:
+                        names[project_id] = name
+
+        with self._lock:
+            self._project_names.update(names)
+            return {
+                project_id: self._project_names[project_id]
+                for project_id in project_ids
+                if project_id in self._project_names
+            }
+
+    def find_domain_id(
+        self,
+        name_or_id: str,
+        *,
+        validate_actor_existence: bool = True,
+    ) -> str:
+        return self.resolve(
+            'domain',
+            name_or_id,
+            validate_actor_existence=validate_actor_existence,
+        )
+
+    def find_group_id(
+        self,
+        name_or_id: str,
+        domain_name_or_id: str | None = None,
+        *,
+        validate_actor_existence: bool = True,
+    ) -> str:
+        if domain_name_or_id is None:
+            return self.resolve(
+                'group',
+                name_or_id,
+                validate_actor_existence=validate_actor_existence,
+            )
+
+        domain_id = self.find_domain_id(
+            domain_name_or_id,
+            validate_actor_existence=validate_actor_existence,
+        )
+        return self.resolve(
+            'group',
+            name_or_id,
+            validate_actor_existence=validate_actor_existence,
+            domain_id=domain_id,
+        )
+
+    def find_project_id(
+        self,
+        name_or_id: str,
+        domain_name_or_id: str | None = None,
+        *,
+        validate_actor_existence: bool = True,
+        validate_domain_actor_existence: bool | None = None,
+    ) -> str:
+        if domain_name_or_id is None:
+            if isinstance(self.identity_client, identity_v2.Proxy):
+                return self.resolve(
+                    'tenant',
+                    name_or_id,
+                    validate_actor_existence=validate_actor_existence,
+                )
+
+            return self.resolve(
+                'project',
+                name_or_id,
+                validate_actor_existence=validate_actor_existence,
+            )
+
+        if validate_domain_actor_existence is None:
+            validate_domain_actor_existence = validate_actor_existence
+
+        # only v3 supports the concept of domains
+        sdk_utils.ensure_service_version(self.identity_client, '3')
+        domain_id = self.find_domain_id(
+            domain_name_or_id,
+            validate_actor_existence=validate_domain_actor_existence,
+        )
+        return self.resolve(
+            'project',
+            name_or_id,
+            validate_actor_existence=validate_actor_existence,
+            domain_id=domain_id,
+        )
+
+    def find_user_id(
+        self,
+        name_or_id: str,
+        domain_name_or_id: str | None = None,
+        *,
+        validate_actor_existence: bool = True,
+    ) -> str:
+        if domain_name_or_id is None:
+            return self.resolve(
+                'user',
+                name_or_id,
+                validate_actor_existence=validate_actor_existence,
+            )
+
+        # only v3 supports the concept of domains
+        sdk_utils.ensure_service_version(self.identity_client, '3')
+        domain_id = self.find_domain_id(
+            domain_name_or_id,
+            validate_actor_existence=validate_actor_existence,
+        )
+        return self.resolve(
+            'user',
+            name_or_id,
+            validate_actor_existence=validate_actor_existence,
+            domain_id=domain_id,
+        )
+
+
 def add_user_domain_option_to_parser(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         '--user-domain',
@@ -360,9 +360,10 @@ class ListApplicationCredential(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
         if parsed_args.user:
-            user_id = common.find_user_id_sdk(
-                identity_client, parsed_args.user, parsed_args.user_domain
+            user_id = resolver.find_user_id(
+                parsed_args.user, parsed_args.user_domain
             )
         else:
             conn = self.app.client_manager.sdk_connection
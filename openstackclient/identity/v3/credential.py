@@ -87,13 +87,10 @@ class CreateCredential(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
-        user_id = identity_client.find_user(
-            parsed_args.user, ignore_missing=False
-        ).id
+        resolver = self.app.client_manager.identity_resolver
+        user_id = resolver.find_user_id(parsed_args.user)
         if parsed_args.project:
-            project = identity_client.find_project(
-                parsed_args.project, ignore_missing=False
-            ).id
+            project = resolver.find_project_id(parsed_args.project)
         else:
             project = None
         credential = identity_client.create_credential(
@@ -173,15 +170,10 @@ class ListCredential(command.Lister):
 
         kwargs = {}
         if parsed_args.user:
-            domain_id = None
-            if parsed_args.user_domain:
-                domain_id = identity_client.find_domain(
-                    parsed_args.user_domain, ignore_missing=False
-                )
-            user_id = identity_client.find_user(
-                parsed_args.user, domain_id=domain_id, ignore_missing=False
-            ).id
-            kwargs["user_id"] = user_id
+            resolver = self.app.client_manager.identity_resolver
+            kwargs["user_id"] = resolver.find_user_id(
+                parsed_args.user, parsed_args.user_domain
+            )
 
         if parsed_args.type:
             kwargs["type"] = parsed_args.type
@@ -245,14 +237,11 @@ class SetCredential(command.Command):
             self.app.client_manager.sdk_connection.identity, '3'
         )
 
-        user_id = identity_client.find_user(
-            parsed_args.user, ignore_missing=False
-        ).id
+        resolver = self.app.client_manager.identity_resolver
+        user_id = resolver.find_user_id(parsed_args.user)
 
         if parsed_args.project:
-            project = identity_client.find_project(
-                parsed_args.project, ignore_missing=False
-            ).id
+            project = resolver.find_project_id(parsed_args.project)
         else:
             project = None
 
@@ -144,11 +144,11 @@ class DeleteDomain(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
         result = 0
         for i in parsed_args.domain:
             try:
-                domain = identity_client.find_domain(i, ignore_missing=False)
-                identity_client.delete_domain(domain.id)
+                identity_client.delete_domain(resolver.find_domain_id(i))
             except Exception as e:
                 result += 1
                 LOG.error(
@@ -257,8 +257,8 @@ class SetDomain(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
-        domain = identity_client.find_domain(
-            parsed_args.domain, ignore_missing=False
+        domain_id = self.app.client_manager.identity_resolver.find_domain_id(
+            parsed_args.domain
         )
         kwargs = {}
         if parsed_args.name:
@@ -270,7 +270,7 @@ class SetDomain(command.Command):
         if parsed_args.immutable is not None:
             kwargs['options'] = {'immutable': parsed_args.immutable}
 
-        identity_client.update_domain(domain.id, **kwargs)
+        identity_client.update_domain(domain_id, **kwargs)
 
 
 class ShowDomain(command.ShowOne):
@@ -86,13 +86,14 @@ class AddProjectToEndpoint(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         endpoint_id = identity_client.find_endpoint(
             parsed_args.endpoint, ignore_missing=False
         ).id
 
-        project_id = common.find_project_id_sdk(
-            identity_client, parsed_args.project, parsed_args.project_domain
+        project_id = resolver.find_project_id(
+            parsed_args.project, parsed_args.project_domain
         )
 
         identity_client.associate_endpoint_with_project(
@@ -250,6 +251,7 @@ class ListEndpoint(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         endpoint = None
         if parsed_args.endpoint:
@@ -259,16 +261,15 @@ class ListEndpoint(command.Lister):
 
         project_domain_id = None
         if parsed_args.project_domain:
-            project_domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.project_domain,
+            project_domain_id = resolver.resolve(
+                'domain', parsed_args.project_domain
             )
 
         project_id = None
         if parsed_args.project:
-            project_id = common._find_sdk_id(
-                identity_client.find_project,
-                name_or_id=common._get_token_resource(
+            project_id = resolver.resolve(
+                'project',
+                common._get_token_resource(
                     identity_client, 'project', parsed_args.project
                 ),
                 domain_id=project_domain_id,
@@ -373,13 +374,14 @@ class RemoveProjectFromEndpoint(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         endpoint_id = identity_client.find_endpoint(
             parsed_args.endpoint, ignore_missing=False
         ).id
 
-        project_id = common.find_project_id_sdk(
-            identity_client, parsed_args.project, parsed_args.project_domain
+        project_id = resolver.find_project_id(
+            parsed_args.project, parsed_args.project_domain
         )
 
         identity_client.disassociate_endpoint_from_project(
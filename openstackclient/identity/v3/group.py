@@ -81,17 +81,16 @@ class AddUserToGroup(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
-        group_id = common.find_group_id_sdk(
-            identity_client, parsed_args.group, parsed_args.group_domain
+        group_id = resolver.find_group_id(
+            parsed_args.group, parsed_args.group_domain
         )
 
         result = 0
         for i in parsed_args.user:
             try:
-                user_id = common.find_user_id_sdk(
-                    identity_client, i, parsed_args.user_domain
-                )
+                user_id = resolver.find_user_id(i, parsed_args.user_domain)
                 identity_client.add_user_to_group(user_id, group_id)
             except Exception as e:
                 result += 1
@@ -139,15 +138,14 @@ class CheckUserInGroup(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
-        user_id = common.find_user_id_sdk(
-            identity_client,
+        user_id = resolver.find_user_id(
             parsed_args.user,
             parsed_args.user_domain,
             validate_actor_existence=False,
         )
-        group_id = common.find_group_id_sdk(
-            identity_client,
+        group_id = resolver.find_group_id(
             parsed_args.group,
             parsed_args.group_domain,
             validate_actor_existence=False,
@@ -208,6 +206,7 @@ class CreateGroup(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs = {}
         if parsed_args.name:
@@ -215,9 +214,7 @@ class CreateGroup(command.ShowOne):
         if parsed_args.description:
             kwargs['description'] = parsed_args.description
         if parsed_args.domain:
-            kwargs['domain_id'] = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            kwargs['domain_id'] = resolver.find_domain_id(parsed_args.domain)
 
         try:
             group = identity_client.create_group(**kwargs)
@@ -263,13 +260,12 @@ class DeleteGroup(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         errors = 0
         for group in parsed_args.groups:
             try:
-                group_id = common.find_group_id_sdk(
-                    identity_client, group, parsed_args.domain
-                )
+                group_id = resolver.find_group_id(group, parsed_args.domain)
                 identity_client.delete_group(group_id)
             except Exception as e:
                 errors += 1
@@ -320,12 +316,11 @@ class ListGroup(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            domain = resolver.find_domain_id(parsed_args.domain)
 
         if not parsed_args.user:
             if domain:
@@ -333,10 +328,8 @@ class ListGroup(command.Lister):
             else:
                 data = list(identity_client.groups())
         else:
-            user = common.find_user_id_sdk(
-                identity_client,
-                parsed_args.user,
-                parsed_args.user_domain,
+            user = resolver.find_user_id(
+                parsed_args.user, parsed_args.user_domain
             )
             # NOTE(0weng): The API doesn't actually support filtering
             # additionally by domain_id, so this doesn't really do
@@ -388,17 +381,16 @@ class RemoveUserFromGroup(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
-        group_id = common.find_group_id_sdk(
-            identity_client, parsed_args.group, parsed_args.group_domain
+        group_id = resolver.find_group_id(
+            parsed_args.group, parsed_args.group_domain
         )
 
         result = 0
         for i in parsed_args.user:
             try:
-                user_id = common.find_user_id_sdk(
-                    identity_client, i, parsed_args.user_domain
-                )
+                user_id = resolver.find_user_id(i, parsed_args.user_domain)
                 identity_client.remove_user_from_group(user_id, group_id)
             except Exception as e:
                 result += 1
@@ -454,9 +446,8 @@ class SetGroup(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
-        group = common.find_group_id_sdk(
-            identity_client, parsed_args.group, parsed_args.domain
-        )
+        resolver = self.app.client_manager.identity_resolver
+        group = resolver.find_group_id(parsed_args.group, parsed_args.domain)
         kwargs = {}
         if parsed_args.name:
             kwargs['name'] = parsed_args.name
@@ -489,11 +480,10 @@ class ShowGroup(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         if parsed_args.domain:
-            domain = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            domain = resolver.find_domain_id(parsed_args.domain)
             group = identity_client.find_group(
                 parsed_args.group, domain_id=domain, ignore_missing=False
             )
@@ -26,7 +26,6 @@ from osc_lib import utils
 
 from openstackclient import command
 from openstackclient.i18n import _
-from openstackclient.identity import common
 
 
 LOG = logging.getLogger(__name__)
@@ -136,6 +135,7 @@ class CreateIdentityProvider(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
         kwargs = {'is_enabled': parsed_args.enabled}
         if parsed_args.identity_provider_id:
             kwargs['id'] = parsed_args.identity_provider_id
@@ -152,10 +152,8 @@ class CreateIdentityProvider(command.ShowOne):
             kwargs['remote_ids'] = parsed_args.remote_ids
 
         if parsed_args.domain:
-            kwargs['domain_id'] = common.find_domain_id_sdk(
-                identity_client,
-                parsed_args.domain,
-                validate_actor_existence=False,
+            kwargs['domain_id'] = resolver.find_domain_id(
+                parsed_args.domain, validate_actor_existence=False
             )
 
         auth_ttl = parsed_args.authorization_ttl
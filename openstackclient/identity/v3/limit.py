@@ -102,6 +102,7 @@ class CreateLimit(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs = {
             "resource_name": parsed_args.resource_name,
@@ -110,10 +111,8 @@ class CreateLimit(command.ShowOne):
         if parsed_args.description:
             kwargs["description"] = parsed_args.description
 
-        kwargs["project_id"] = common_utils.find_project_id_sdk(
-            identity_client,
-            parsed_args.project,
-            domain_name_or_id=parsed_args.project_domain,
+        kwargs["project_id"] = resolver.find_project_id(
+            parsed_args.project, domain_name_or_id=parsed_args.project_domain
         )
 
         kwargs["service_id"] = common_utils.find_service_sdk(
@@ -166,6 +165,7 @@ class ListLimit(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs: dict[str, object] = {}
         if parsed_args.service:
@@ -181,14 +181,12 @@ class ListLimit(command.Lister):
         if parsed_args.project:
             project_domain_id = None
             if parsed_args.project_domain:
-                project_domain_id = common_utils.find_domain_id_sdk(
-                    identity_client, parsed_args.project_domain
+                project_domain_id = resolver.find_domain_id(
+                    parsed_args.project_domain
                 )
 
-            kwargs["project_id"] = common_utils._find_sdk_id(
-                identity_client.find_project,
-                name_or_id=parsed_args.project,
-                domain_id=project_domain_id,
+            kwargs["project_id"] = resolver.resolve(
+                'project', parsed_args.project, domain_id=project_domain_id
             )
 
         if parsed_args.resource_name:
@@ -118,6 +118,7 @@ class CreateProject(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs = {}
 
@@ -140,16 +141,12 @@ class CreateProject(command.ShowOne):
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            domain = resolver.find_domain_id(parsed_args.domain)
             kwargs['domain_id'] = domain
 
         if parsed_args.parent:
-            kwargs['parent_id'] = common.find_project_id_sdk(
-                identity_client,
-                parsed_args.parent,
-                domain_name_or_id=domain,
+            kwargs['parent_id'] = resolver.find_project_id(
+                parsed_args.parent, domain_name_or_id=domain
             )
 
         kwargs['is_enabled'] = parsed_args.enabled
@@ -212,12 +209,12 @@ class DeleteProject(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         errors = 0
         for project in parsed_args.projects:
             try:
-                project = common.find_project_id_sdk(
-                    identity_client,
+                project = resolver.find_project_id(
                     project,
                     domain_name_or_id=parsed_args.domain,
                     validate_actor_existence=True,
@@ -310,6 +307,7 @@ class ListProject(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         column_headers: tuple[str, ...] = ('ID', 'Name')
         if parsed_args.long:
@@ -323,32 +321,23 @@ class ListProject(command.Lister):
 
         domain_id = None
         if parsed_args.domain:
-            domain_id = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            domain_id = resolver.find_domain_id(parsed_args.domain)
             kwargs['domain_id'] = domain_id
 
         if parsed_args.parent:
-            parent_id = common.find_project_id_sdk(
-                identity_client,
-                parsed_args.parent,
-                domain_name_or_id=domain_id,
+            parent_id = resolver.find_project_id(
+                parsed_args.parent, domain_name_or_id=domain_id
             )
             kwargs['parent_id'] = parent_id
 
         user = None
         if parsed_args.user:
             if parsed_args.domain:
-                user = common.find_user_id_sdk(
-                    identity_client,
-                    parsed_args.user,
-                    domain_name_or_id=domain_id,
+                user = resolver.find_user_id(
+                    parsed_args.user, domain_name_or_id=domain_id
                 )
             else:
-                user = common.find_user_id_sdk(
-                    identity_client,
-                    parsed_args.user,
-                )
+                user = resolver.find_user_id(parsed_args.user)
 
         if parsed_args.is_enabled is not None:
             kwargs['is_enabled'] = parsed_args.is_enabled
@@ -449,6 +438,7 @@ class SetProject(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs = {}
         if parsed_args.name:
@@ -463,10 +453,8 @@ class SetProject(command.Command):
             kwargs.update(parsed_args.properties)
 
         if parsed_args.domain:
-            domain = common.find_domain_id_sdk(
-                identity_client,
-                parsed_args.domain,
-                validate_actor_existence=False,
+            domain = resolver.find_domain_id(
+                parsed_args.domain, validate_actor_existence=False
             )
             project = identity_client.find_project(
                 parsed_args.project,
@@ -542,21 +530,19 @@ class ShowProject(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs: dict[str, Any] = {}
 
         domain = None
         if parsed_args.domain:
-            domain = common.find_domain_id_sdk(
-                identity_client, parsed_args.domain
-            )
+            domain = resolver.find_domain_id(parsed_args.domain)
 
             kwargs['domain_id'] = domain
 
         # Get project id first; otherwise, find_project() can't find
         # parents/children if only project name was given
-        project = common.find_project_id_sdk(
-            identity_client,
+        project = resolver.find_project_id(
             parsed_args.project,
             domain_name_or_id=domain,
             validate_actor_existence=False,
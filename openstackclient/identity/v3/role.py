@@ -91,56 +91,56 @@ def _add_identity_and_resource_options_to_parser(
 
 def _process_identity_and_resource_options(
     parsed_args: argparse.Namespace,
-    identity_client: Any,
+    resolver: common.IdentityResolver,
     validate_actor_existence: bool = True,
 ) -> dict[str, Any]:
     def _find_user() -> Any:
         domain_id = (
-            common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.user_domain,
+            resolver.resolve(
+                'domain',
+                parsed_args.user_domain,
                 validate_actor_existence=validate_actor_existence,
             )
             if parsed_args.user_domain
             else None
         )
-        return common._find_sdk_id(
-            identity_client.find_user,
-            name_or_id=parsed_args.user,
+        return resolver.resolve(
+            'user',
+            parsed_args.user,
             validate_actor_existence=validate_actor_existence,
             domain_id=domain_id,
         )
 
     def _find_group() -> Any:
         domain_id = (
-            common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.group_domain,
+            resolver.resolve(
+                'domain',
+                parsed_args.group_domain,
                 validate_actor_existence=validate_actor_existence,
             )
             if parsed_args.group_domain
             else None
         )
-        return common._find_sdk_id(
-            identity_client.find_group,
-            name_or_id=parsed_args.group,
+        return resolver.resolve(
+            'group',
+            parsed_args.group,
             validate_actor_existence=validate_actor_existence,
             domain_id=domain_id,
         )
 
     def _find_project() -> Any:
         domain_id = (
-            common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.project_domain,
+            resolver.resolve(
+                'domain',
+                parsed_args.project_domain,
                 validate_actor_existence=validate_actor_existence,
             )
             if parsed_args.project_domain
             else None
         )
-        return common._find_sdk_id(
-            identity_client.find_project,
-            name_or_id=parsed_args.project,
+        return resolver.resolve(
+            'project',
+            parsed_args.project,
             validate_actor_existence=validate_actor_existence,
             domain_id=domain_id,
         )
@@ -151,9 +151,9 @@ def _process_identity_and_resource_options(
         kwargs['system'] = parsed_args.system
     elif parsed_args.user and parsed_args.domain:
         kwargs['user'] = _find_user()
-        kwargs['domain'] = common._find_sdk_id(
-            identity_client.find_domain,
-            name_or_id=parsed_args.domain,
+        kwargs['domain'] = resolver.resolve(
+            'domain',
+            parsed_args.domain,
             validate_actor_existence=validate_actor_existence,
         )
     elif parsed_args.user and parsed_args.project:
@@ -164,9 +164,9 @@ def _process_identity_and_resource_options(
         kwargs['system'] = parsed_args.system
     elif parsed_args.group and parsed_args.domain:
         kwargs['group'] = _find_group()
-        kwargs['domain'] = common._find_sdk_id(
-            identity_client.find_domain,
-            name_or_id=parsed_args.domain,
+        kwargs['domain'] = resolver.resolve(
+            'domain',
+            parsed_args.domain,
             validate_actor_existence=validate_actor_existence,
         )
     elif parsed_args.group and parsed_args.project:
@@ -204,6 +204,7 @@ class AddRole(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         if (
             not parsed_args.user
@@ -219,17 +220,11 @@ class AddRole(command.Command):
 
         domain_id = None
         if parsed_args.role_domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain, name_or_id=parsed_args.role_domain
-            )
-        role = common._find_sdk_id(
-            identity_client.find_role,
-            name_or_id=parsed_args.role,
-            domain_id=domain_id,
-        )
+            domain_id = resolver.resolve('domain', parsed_args.role_domain)
+        role = resolver.resolve('role', parsed_args.role, domain_id=domain_id)
 
         add_kwargs = _process_identity_and_resource_options(
-            parsed_args, identity_client
+            parsed_args, resolver
         )
 
         if add_kwargs.get("domain"):
@@ -320,11 +315,12 @@ class CreateRole(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         create_kwargs: dict[str, Any] = {}
         if parsed_args.domain:
-            create_kwargs['domain_id'] = common._find_sdk_id(
-                identity_client.find_domain, name_or_id=parsed_args.domain
+            create_kwargs['domain_id'] = resolver.resolve(
+                'domain', parsed_args.domain
             )
 
         if parsed_args.name:
@@ -375,20 +371,15 @@ class DeleteRole(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         domain_id = None
         if parsed_args.domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain, parsed_args.domain
-            )
+            domain_id = resolver.resolve('domain', parsed_args.domain)
         errors = 0
         for role in parsed_args.roles:
             try:
-                role_id = common._find_sdk_id(
-                    identity_client.find_role,
-                    name_or_id=role,
-                    domain_id=domain_id,
-                )
+                role_id = resolver.resolve('role', role, domain_id=domain_id)
                 identity_client.delete_role(role=role_id, ignore_missing=False)
             except Exception as e:
                 errors += 1
@@ -474,6 +465,8 @@ class RemoveRole(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
+
         if (
             not parsed_args.user
             and not parsed_args.domain
@@ -488,19 +481,12 @@ class RemoveRole(command.Command):
 
         domain_id = None
         if parsed_args.role_domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.role_domain,
-            )
-        role = common._find_sdk_id(
-            identity_client.find_role,
-            name_or_id=parsed_args.role,
-            domain_id=domain_id,
-        )
+            domain_id = resolver.resolve('domain', parsed_args.role_domain)
+        role = resolver.resolve('role', parsed_args.role, domain_id=domain_id)
 
         remove_kwargs = _process_identity_and_resource_options(
             parsed_args,
-            identity_client,
+            resolver,
             validate_actor_existence=False,
         )
 
@@ -581,6 +567,7 @@ class SetRole(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         update_kwargs = {}
         if parsed_args.description:
@@ -590,20 +577,13 @@ class SetRole(command.Command):
 
         domain_id = None
         if parsed_args.domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.domain,
-            )
+            domain_id = resolver.resolve('domain', parsed_args.domain)
             update_kwargs["domain_id"] = domain_id
 
         if parsed_args.immutable is not None:
             update_kwargs["options"] = {"immutable": parsed_args.immutable}
 
-        role = common._find_sdk_id(
-            identity_client.find_role,
-            name_or_id=parsed_args.role,
-            domain_id=domain_id,
-        )
+        role = resolver.resolve('role', parsed_args.role, domain_id=domain_id)
         update_kwargs["role"] = role
 
         identity_client.update_role(**update_kwargs)
@@ -632,13 +612,11 @@ class ShowRole(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         domain_id = None
         if parsed_args.domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.domain,
-            )
+            domain_id = resolver.resolve('domain', parsed_args.domain)
 
         role = identity_client.find_role(
             name_or_id=parsed_args.role,
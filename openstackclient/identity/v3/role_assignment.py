@@ -133,96 +133,84 @@ class ListRoleAssignment(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
         auth_ref = self.app.client_manager.auth_ref
 
-        role_id = None
-        role_domain_id = None
-        if parsed_args.role_domain:
-            role_domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.role_domain,
+        # Resolve all the domains up front. These are often repeated across
+        # the various --*-domain options, and the resolver memoizes them.
+        domain_options = {
+            option: getattr(parsed_args, option)
+            for option in (
+                'role_domain',
+                'user_domain',
+                'domain',
+                'project_domain',
+                'group_domain',
             )
-        if parsed_args.role:
-            role_id = common._find_sdk_id(
-                identity_client.find_role,
-                name_or_id=parsed_args.role,
-                domain_id=role_domain_id,
+            if getattr(parsed_args, option)
+        }
+        domain_ids = dict(
+            zip(
+                domain_options,
+                resolver.resolve_many(
+                    ('domain', name_or_id, {})
+                    for name_or_id in domain_options.values()
+                ),
             )
+        )
+        domain_id = domain_ids.get('domain')
 
-        user_domain_id = None
-        if parsed_args.user_domain:
-            user_domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.user_domain,
+        lookups: dict[str, tuple[str, str, dict[str, Any]]] = {}
+        if parsed_args.role:
+            lookups['role'] = (
+                'role',
+                parsed_args.role,
+                {'domain_id': domain_ids.get('role_domain')},
             )
 
-        user_id = None
         if parsed_args.user:
-            user_id = common._find_sdk_id(
-                identity_client.find_user,
-                name_or_id=parsed_args.user,
-                domain_id=user_domain_id,
+            lookups['user'] = (
+                'user',
+                parsed_args.user,
+                {'domain_id': domain_ids.get('user_domain')},
             )
         elif parsed_args.authuser:
             if auth_ref:
                 if auth_ref.user_id is None:
                     raise exceptions.CommandError('missing auth info')
-                user_id = common._find_sdk_id(
-                    identity_client.find_user,
-                    name_or_id=auth_ref.user_id,
-                )
+                lookups['user'] = ('user', auth_ref.user_id, {})
 
         system = None
         if parsed_args.system:
             system = parsed_args.system
 
-        domain_id = None
-        if parsed_args.domain:
-            domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.domain,
-            )
-
-        project_domain_id = None
-        if parsed_args.project_domain:
-            project_domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.project_domain,
-            )
-
-        project_id = None
         if parsed_args.project:
-            project_id = common._find_sdk_id(
-                identity_client.find_project,
-                name_or_id=common._get_token_resource(
+            lookups['project'] = (
+                'project',
+                common._get_token_resource(
                     identity_client, 'project', parsed_args.project
                 ),
-                domain_id=project_domain_id,
+                {'domain_id': domain_ids.get('project_domain')},
             )
         elif parsed_args.authproject:
             if auth_ref:
                 if auth_ref.project_id is None:
                     raise exceptions.CommandError('missing auth info')
-                project_id = common._find_sdk_id(
-                    identity_client.find_project,
-                    name_or_id=auth_ref.project_id,
-                )
+                lookups['project'] = ('project', auth_ref.project_id, {})
 
-        group_domain_id = None
-        if parsed_args.group_domain:
-            group_domain_id = common._find_sdk_id(
-                identity_client.find_domain,
-                name_or_id=parsed_args.group_domain,
-            )
-
-        group_id = None
         if parsed_args.group:
-            group_id = common._find_sdk_id(
-                identity_client.find_group,
-                name_or_id=parsed_args.group,
-                domain_id=group_domain_id,
+            lookups['group'] = (
+                'group',
+                parsed_args.group,
+                {'domain_id': domain_ids.get('group_domain')},
             )
 
+        ids = dict(zip(lookups, resolver.resolve_many(lookups.values())))
+        role_id = ids.get('role')
+        user_id = ids.get('user')
+        project_id = ids.get('project')
+        group_id = ids.get('group')
+
         include_names = True if parsed_args.names else None
         columns = (
             'Role',
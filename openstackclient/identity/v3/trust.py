@@ -124,6 +124,7 @@ class CreateTrust(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs: dict[str, Any] = {}
 
@@ -131,60 +132,17 @@ class CreateTrust(command.ShowOne):
         # are necessary for making a trust usable, the API dictates that
         # trustee, project and role are optional, but that makes the trust
         # pointless, and trusts are immutable, so let's enforce it at the
-        # client level.
-        try:
-            if parsed_args.trustor_domain:
-                trustor_domain_id = identity_client.find_domain(
-                    parsed_args.trustor_domain, ignore_missing=False
-                ).id
-                trustor_id = identity_client.find_user(
-                    parsed_args.trustor,
-                    ignore_missing=False,
-                    domain_id=trustor_domain_id,
-                ).id
-            else:
-                trustor_id = identity_client.find_user(
-                    parsed_args.trustor, ignore_missing=False
-                ).id
-            kwargs['trustor_user_id'] = trustor_id
-        except sdk_exceptions.ForbiddenException:
-            kwargs['trustor_user_id'] = parsed_args.trustor
-
-        try:
-            if parsed_args.trustee_domain:
-                trustee_domain_id = identity_client.find_domain(
-                    parsed_args.trustee_domain, ignore_missing=False
-                ).id
-                trustee_id = identity_client.find_user(
-                    parsed_args.trustee,
-                    ignore_missing=False,
-                    domain_id=trustee_domain_id,
-                ).id
-            else:
-                trustee_id = identity_client.find_user(
-                    parsed_args.trustee, ignore_missing=False
-                ).id
-            kwargs['trustee_user_id'] = trustee_id
-        except sdk_exceptions.ForbiddenException:
-            kwargs['trustee_user_id'] = parsed_args.trustee
-
-        try:
-            if parsed_args.project_domain:
-                project_domain_id = identity_client.find_domain(
-                    parsed_args.project_domain, ignore_missing=False
-                ).id
-                project_id = identity_client.find_project(
-                    parsed_args.project,
-                    ignore_missing=False,
-                    domain_id=project_domain_id,
-                ).id
-            else:
-                project_id = identity_client.find_project(
-                    parsed_args.project, ignore_missing=False
-                ).id
-            kwargs['project_id'] = project_id
-        except sdk_exceptions.ForbiddenException:
-            kwargs['project_id'] = parsed_args.project
+        # client level. The resolver passes through the names of users and
+        # projects we are forbidden from looking up.
+        kwargs['trustor_user_id'] = resolver.find_user_id(
+            parsed_args.trustor, parsed_args.trustor_domain
+        )
+        kwargs['trustee_user_id'] = resolver.find_user_id(
+            parsed_args.trustee, parsed_args.trustee_domain
+        )
+        kwargs['project_id'] = resolver.find_project_id(
+            parsed_args.project, parsed_args.project_domain
+        )
 
         roles = []
         for role in parsed_args.roles:
@@ -333,45 +291,18 @@ class ListTrust(command.Lister):
                 }.values()
             )
         else:
+            resolver = self.app.client_manager.identity_resolver
             trustor = None
             if parsed_args.trustor:
-                try:
-                    if parsed_args.trustor_domain:
-                        trustor_domain_id = identity_client.find_domain(
-                            parsed_args.trustor_domain, ignore_missing=False
-                        ).id
-                        trustor_id = identity_client.find_user(
-                            parsed_args.trustor,
-                            ignore_missing=False,
-                            domain_id=trustor_domain_id,
-                        ).id
-                    else:
-                        trustor_id = identity_client.find_user(
-                            parsed_args.trustor, ignore_missing=False
-                        ).id
-                    trustor = trustor_id
-                except sdk_exceptions.ForbiddenException:
-                    trustor = parsed_args.trustor
+                trustor = resolver.find_user_id(
+                    parsed_args.trustor, parsed_args.trustor_domain
+                )
 
             trustee = None
             if parsed_args.trustee:
-                try:
-                    if parsed_args.trustee_domain:
-                        trustee_domain_id = identity_client.find_domain(
-                            parsed_args.trustee_domain, ignore_missing=False
-                        ).id
-                        trustee_id = identity_client.find_user(
-                            parsed_args.trustee,
-                            ignore_missing=False,
-                            domain_id=trustee_domain_id,
-                        ).id
-                    else:
-                        trustee_id = identity_client.find_user(
-                            parsed_args.trustee, ignore_missing=False
-                        ).id
-                    trustee = trustee_id
-                except sdk_exceptions.ForbiddenException:
-                    trustee = parsed_args.trustee
+                trustee = resolver.find_user_id(
+                    parsed_args.trustee, parsed_args.trustee_domain
+                )
 
             data = list(
                 identity_client.trusts(
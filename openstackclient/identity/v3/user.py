@@ -262,29 +262,19 @@ class CreateUser(command.ShowOne):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         kwargs: dict[str, Any] = {}
 
         domain_id = None
         if parsed_args.domain:
-            domain_id = identity_client.find_domain(
-                parsed_args.domain,
-                ignore_missing=False,
-            ).id
+            domain_id = resolver.find_domain_id(parsed_args.domain)
             kwargs['domain_id'] = domain_id
 
         if parsed_args.project:
-            project_domain_id = None
-            if parsed_args.project_domain:
-                project_domain_id = identity_client.find_domain(
-                    parsed_args.project_domain,
-                    ignore_missing=False,
-                ).id
-            kwargs['default_project_id'] = identity_client.find_project(
-                parsed_args.project,
-                ignore_missing=False,
-                domain_id=project_domain_id,
-            ).id
+            kwargs['default_project_id'] = resolver.find_project_id(
+                parsed_args.project, parsed_args.project_domain
+            )
 
         if parsed_args.description:
             kwargs['description'] = parsed_args.description
@@ -362,6 +352,7 @@ class DeleteUser(command.Command):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         domain = None
         if parsed_args.domain:
@@ -373,16 +364,12 @@ class DeleteUser(command.Command):
         for user in parsed_args.users:
             try:
                 if domain is not None:
-                    user_obj = identity_client.find_user(
-                        name_or_id=user,
-                        domain_id=domain.id,
-                        ignore_missing=False,
+                    user_id = resolver.resolve(
+                        'user', user, domain_id=domain.id
                     )
                 else:
-                    user_obj = identity_client.find_user(
-                        name_or_id=user, ignore_missing=False
-                    )
-                identity_client.delete_user(user_obj.id, ignore_missing=False)
+                    user_id = resolver.resolve('user', user)
+                identity_client.delete_user(user_id, ignore_missing=False)
             except Exception as e:
                 errors += 1
                 LOG.error(
@@ -464,21 +451,17 @@ class ListUser(command.Lister):
         identity_client = sdk_utils.ensure_service_version(
             self.app.client_manager.sdk_connection.identity, '3'
         )
+        resolver = self.app.client_manager.identity_resolver
 
         domain = None
         if parsed_args.domain:
-            domain = identity_client.find_domain(
-                name_or_id=parsed_args.domain,
-                ignore_missing=False,
-            ).id
+            domain = resolver.find_domain_id(parsed_args.domain)
 
         group = None
         if parsed_args.group:
-            group = identity_client.find_group(
-                name_or_id=parsed_args.group,
-                domain_id=parsed_args.domain,
-                ignore_missing=False,
-            ).id
+            group = resolver.resolve(
+                'group', parsed_args.group, domain_id=parsed_args.domain
+            )
 
         if parsed_args.is_enabled is not None:
             enabled = parsed_args.is_enabled
@@ -494,16 +477,11 @@ class ListUser(command.Lister):
         data: list[_user.User]
         if parsed_args.project:
             if domain is not None:
-                project = identity_client.find_project(
-                    name_or_id=parsed_args.project,
-                    domain_id=domain,
-                    ignore_missing=False,
-                ).id
+                project = resolver.resolve(
+                    'project', parsed_args.project, domain_id=domain
+                )
             else:
-                project = identity_client.find_project(
-                    name_or_id=parsed_args.project,
-                    ignore_missing=False,
-                ).id
+                project = resolver.resolve('project', parsed_args.project)
 
             # NOTE(stevemar): If a user has more than one role on a project
             # then they will have two entries in the returned data. Since we
@@ -662,13 +640,14 @@ class SetUser(command.Command):
             identity_client, 'user', parsed_args.user, parsed_args.domain
         )
         if parsed_args.domain:
-            domain = identity_client.find_domain(
-                name_or_id=parsed_args.domain,
-                ignore_missing=False,
+            domain_id = (
+                self.app.client_manager.identity_resolver.find_domain_id(
+                    parsed_args.domain
+                )
             )
             user = identity_client.find_user(
                 name_or_id=user_str,
-                domain_id=domain.id,
+                domain_id=domain_id,
                 ignore_missing=False,
             )
         else:
@@ -687,18 +666,10 @@ class SetUser(command.Command):
         if parsed_args.description:
             kwargs['description'] = parsed_args.description
         if parsed_args.project:
-            project_domain_id = None
-            if parsed_args.project_domain:
-                project_domain_id = identity_client.find_domain(
-                    name_or_id=parsed_args.project_domain,
-                    ignore_missing=False,
-                ).id
-            project_id = identity_client.find_project(
-                name_or_id=parsed_args.project,
-                ignore_missing=False,
-                domain_id=project_domain_id,
-            ).id
-            kwargs['default_project_id'] = project_id
+            resolver = self.app.client_manager.identity_resolver
+            kwargs['default_project_id'] = resolver.find_project_id(
+                parsed_args.project, parsed_args.project_domain
+            )
         kwargs['is_enabled'] = user.is_enabled
         if parsed_args.enable:
             kwargs['is_enabled'] = True
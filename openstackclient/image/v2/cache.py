@@ -18,17 +18,23 @@ from collections.abc import Iterable, Sequence
 import copy
 import datetime
 import logging
+import time
 from typing import Any
 
+from openstack import exceptions as sdk_exceptions
 from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient import command
+from openstackclient.common import transfer
 from openstackclient.i18n import _
 
 
 LOG = logging.getLogger(__name__)
 
+# The number of seconds between checks on the caches being warmed
+WARM_POLL_INTERVAL = 5
+
 
 def _format_image_cache(cached_images: dict[str, Any]) -> list[dict[str, Any]]:
     """Format image cache to make it more consistent with OSC operations."""
@@ -153,6 +159,224 @@ class QueueCachedImage(command.Command):
             raise exceptions.CommandError(msg)
 
 
+def _node_cache_url(node: str, *parts: str) -> str:
+    """Get the URL of the cache API of a single glance-api node"""
+    base = node.rstrip('/')
+    if not base.endswith('/v2'):
+        base += '/v2'
+    return '/'.join((base, 'cache', *parts))
+
+
+class WarmCachedImage(command.Lister):
+    _description = _(
+        "Queue image(s) for caching on each of several glance-api nodes and "
+        "wait until they are cached"
+    )
+
+    # the error to raise once the results have been shown, if any of the
+    # images were not cached
+    _failure: str | None = None
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            "images",
+            metavar="<image>",
+            nargs="+",
+            help=_("Image(s) to cache (name or ID)"),
+        )
+        parser.add_argument(
+            "--node",
+            metavar="<url>",
+            dest="nodes",
+            action="append",
+            required=True,
+            help=_(
+                "URL of a glance-api node to cache the images on, such as "
+                "http://192.0.2.10:9292, bypassing any load balancer "
+                "(repeat option to cache on multiple nodes)"
+            ),
+        )
+        parser.add_argument(
+            "--parallel",
+            metavar="<count>",
+            type=int,
+            default=10,
+            help=_("Number of requests to make at once (default: 10)"),
+        )
+        parser.add_argument(
+            "--timeout",
+            metavar="<seconds>",
+            type=int,
+            default=3600,
+            help=_(
+                "Number of seconds to wait for the images to be cached "
+                "(default: 3600)"
+            ),
+        )
+        return parser
+
+    def take_action(
+        self, parsed_args: argparse.Namespace
+    ) -> tuple[Sequence[str], Iterable[tuple[Any, ...]]]:
+        image_client = self.app.client_manager.image
+
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        images = {}
+        for name in parsed_args.images:
+            image = image_client.find_image(name, ignore_missing=False)
+            images[image.id] = image
+        nodes = list(dict.fromkeys(parsed_args.nodes))
+
+        def _get_cache(node: str) -> tuple[set[str], set[str]]:
+            response = image_client.get(_node_cache_url(node))
+            sdk_exceptions.raise_from_response(response)
+            data = response.json()
+            cached = {
+                image['image_id'] for image in data.get('cached_images', [])
+            }
+            return cached, set(data.get('queued_images', []))
+
+        def _queue(item: tuple[str, str]) -> None:
+            node, image_id = item
+            response = image_client.put(_node_cache_url(node, image_id))
+            sdk_exceptions.raise_from_response(response)
+
+        # the state of each image on each node, and when it was queued
+        states: dict[tuple[str, str], str] = {}
+        started: dict[tuple[str, str], float] = {}
+        timings: dict[tuple[str, str], float] = {}
+        errors: dict[tuple[str, str], Exception] = {}
+
+        def _check(pending: list[str]) -> None:
+            now = time.monotonic()
+            for node, result, error in transfer.run_concurrently(
+                _get_cache, pending, parsed_args.parallel
+            ):
+                for image_id in images:
+                    key = (node, image_id)
+                    if states.get(key) not in (None, 'queued'):
+                        continue
+                    if error is not None:
+                        states[key] = 'error'
+                        errors[key] = error
+                    elif image_id in result[0]:
+                        states[key] = 'cached'
+                        if key in started:
+                            timings[key] = now - started[key]
+
+        _check(nodes)
+
+        to_queue = [
+            (node, image_id)
+            for node in nodes
+            for image_id in images
+            if (node, image_id) not in states
+        ]
+        for key, _result, error in transfer.run_concurrently(
+            _queue, to_queue, parsed_args.parallel
+        ):
+            if error is not None:
+                states[key] = 'error'
+                errors[key] = error
+            else:
+                states[key] = 'queued'
+                started[key] = time.monotonic()
+
+        deadline = time.monotonic() + parsed_args.timeout
+        while True:
+            pending = [
+                node
+                for node in nodes
+                if any(states[(node, i)] == 'queued' for i in images)
+            ]
+            if not pending or time.monotonic() >= deadline:
+                break
+            time.sleep(WARM_POLL_INTERVAL)
+            _check(pending)
+
+        rows, failed = self._format_results(
+            nodes, images, states, timings, errors
+        )
+        self._failure = None
+        if failed:
+            self._failure = _(
+                "Failed to cache %(failed)s of %(total)s image(s) across "
+                "%(nodes)s node(s)"
+            ) % {
+                'failed': failed,
+                'total': len(nodes) * len(images),
+                'nodes': len(nodes),
+            }
+        return ('Node', 'Image ID', 'Image Name', 'State', 'Time (s)'), rows
+
+    def produce_output(
+        self,
+        parsed_args: argparse.Namespace,
+        column_names: Sequence[str],
+        data: Iterable[Sequence[Any]],
+    ) -> int:
+        # the table formatter only writes the table once it has every row,
+        # so fail after the results are shown rather than while they are
+        # produced
+        result = super().produce_output(parsed_args, column_names, data)
+        if self._failure:
+            raise exceptions.CommandError(self._failure)
+        return result
+
+    def _format_results(
+        self,
+        nodes: list[str],
+        images: dict[str, Any],
+        states: dict[tuple[str, str], str],
+        timings: dict[tuple[str, str], float],
+        errors: dict[tuple[str, str], Exception],
+    ) -> tuple[list[tuple[Any, ...]], int]:
+        """Get a row for each image on each node and the number not cached"""
+        rows = []
+        failed = 0
+        for node in nodes:
+            node_timings = []
+            for image_id, image in images.items():
+                key = (node, image_id)
+                state = states[key]
+                timing = timings.get(key)
+                if key in errors:
+                    msg = _(
+                        "Failed to cache image %(image)s on %(node)s: %(e)s"
+                    )
+                    LOG.error(
+                        msg,
+                        {'image': image_id, 'node': node, 'e': errors[key]},
+                    )
+                elif state != 'cached':
+                    msg = _(
+                        "Image %(image)s was not cached on %(node)s in time"
+                    )
+                    LOG.error(msg, {'image': image_id, 'node': node})
+                if state != 'cached':
+                    failed += 1
+                if timing is not None:
+                    node_timings.append(timing)
+                    timing = round(timing, 1)
+                rows.append((node, image_id, image.name, state, timing))
+
+            if node_timings:
+                LOG.info(
+                    _("Cached %(count)s image(s) on %(node)s in %(time).1fs"),
+                    {
+                        'count': len(node_timings),
+                        'node': node,
+                        'time': max(node_timings),
+                    },
+                )
+
+        return rows, failed
+
+
 class DeleteCachedImage(command.Command):
     _description = _("Delete image(s) from cache")
 
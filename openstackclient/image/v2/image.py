@@ -17,19 +17,22 @@
 
 import argparse
 from base64 import b64encode
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 import copy
+import hashlib
+import json
 import logging
 import os
 import sys
+import time
 from typing import Any
 import urllib.parse
 
+from keystoneauth1 import exceptions as ks_exceptions
 from openstack import exceptions as sdk_exceptions
 from openstack.image import image_signer
 from openstack.image.v2 import image as _image
 from openstack import utils as sdk_utils
-from osc_lib.api import utils as api_utils
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib import exceptions
@@ -38,6 +41,7 @@ from osc_lib import utils
 from openstackclient import command
 from openstackclient.common import pagination
 from openstackclient.common import progressbar
+from openstackclient.common import transfer
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
@@ -72,6 +76,27 @@ IMAGE_ATTRIBUTES_CUSTOM_NAMES = {
 }
 MEMBER_STATUS_CHOICES = ["accepted", "pending", "rejected", "all"]
 
+# The size of the ranges fetched by image save --parallel
+DOWNLOAD_RANGE_SIZE = 64 * 1024 * 1024
+# The algorithm used to hash uploads, which is the default multihash
+# algorithm of Glance
+UPLOAD_HASH_ALGO = 'sha512'
+# The image attributes which --property filters are passed to the server
+# for, as Glance matches them exactly as the client would
+SERVER_PROPERTY_FILTERS = ('id', 'name', 'owner', 'status')
+# The number of seconds between checks on the images being imported by
+# image import --wait
+IMPORT_POLL_INTERVAL = 5
+# The keys of each image in an image import --manifest, and the options they
+# override
+IMPORT_MANIFEST_KEYS = {
+    'image': 'image',
+    'method': 'import_method',
+    'uri': 'uri',
+    'stores': 'stores',
+    'all_stores': 'all_stores',
+}
+
 LOG = logging.getLogger(__name__)
 
 
@@ -164,6 +189,142 @@ def _parse_image_size(value: str) -> int:
     return size
 
 
+def _get_upload_source(
+    parsed_args: argparse.Namespace,
+) -> tuple[transfer.UploadSource, progressbar.ProgressReporter | None]:
+    """Open the file given with --file for upload
+
+    :returns: the source to upload and the reporter showing its progress,
+        if the command was run with --progress
+    """
+    progress = None
+    tracker = None
+    if parsed_args.progress:
+        progress = progressbar.ProgressReporter()
+        tracker = progress.start(
+            parsed_args.filename, os.path.getsize(parsed_args.filename)
+        )
+    source = transfer.UploadSource(
+        parsed_args.filename, (UPLOAD_HASH_ALGO,), tracker
+    )
+    return source, progress
+
+
+def _get_stream_source(fp: Any, size: int | None) -> transfer.StreamSource:
+    """Read image data passed via stdin ahead of its upload
+
+    :param fp: the stream the data is passed on
+    :param size: the size of the data given with --size, if any
+    """
+    if size is None:
+        # stdin redirected from a file still has a known size
+        size = sdk_utils.get_file_size(fp)
+    return transfer.StreamSource(fp, size, (UPLOAD_HASH_ALGO,))
+
+
+def _check_upload(
+    image: Any, source: transfer.UploadSource | transfer.StreamSource
+) -> str | None:
+    """Compare the hash of uploaded data with the one the server computed
+
+    :returns: an error message if the hashes differ
+    """
+    if not image.hash_value:
+        LOG.debug(
+            'Not verifying the data uploaded for image %s, the server '
+            'has not hashed it',
+            image.id,
+        )
+        return None
+    digest = source.hexdigests().get(image.hash_algo or '')
+    if digest is None:
+        LOG.warning(
+            _(
+                'Not verifying the data uploaded for image %(image)s, the '
+                'server hashed it with %(algo)s rather than %(expected)s'
+            ),
+            {
+                'image': image.id,
+                'algo': image.hash_algo,
+                'expected': UPLOAD_HASH_ALGO,
+            },
+        )
+        return None
+    if digest == image.hash_value:
+        return None
+    return _(
+        "The %(algo)s checksum of the data uploaded for image %(image)s "
+        "does not match, expected %(expected)s but the server computed "
+        "%(actual)s; the image has been deleted"
+    ) % {
+        'algo': image.hash_algo,
+        'image': image.id,
+        'expected': digest,
+        'actual': image.hash_value,
+    }
+
+
+def _match_property(attr: str, value: str) -> Callable[[Any], bool]:
+    """Get a predicate matching images with a given attribute or property
+
+    This matches as :func:`osc_lib.api.utils.simple_filter` does, but checks
+    a single image so that a listing can be filtered as it is streamed.
+    """
+
+    def _match(image: Any) -> bool:
+        if attr in image:
+            found = image[attr]
+        elif 'properties' in image and isinstance(image['properties'], dict):
+            found = image['properties'].get(attr)
+        else:
+            found = None
+        return bool(found) and found == value
+
+    return _match
+
+
+def _split_stores(value: str | None) -> list[str]:
+    return [store for store in (value or '').split(',') if store]
+
+
+def _import_finished(image: Any, was_importing: bool) -> bool:
+    """Check whether an image has finished importing
+
+    :param image: the image being imported
+    :param was_importing: whether the image has been seen in the
+        'importing' status since its import started
+    """
+    properties = image.properties or {}
+    if _split_stores(properties.get('os_glance_importing_to_stores')):
+        return False
+    if image.status in ('active', 'deactivated', 'killed', 'deleted'):
+        return True
+    if image.status == 'importing':
+        return False
+    # an import which fails returns the image to the status it was in
+    # before, which is only recorded against stores in multi-store clouds
+    return was_importing or bool(
+        _split_stores(properties.get('os_glance_failed_import'))
+    )
+
+
+def _get_import_stores(
+    image: Any, requested: list[str] | None
+) -> dict[str, str]:
+    """Get the status of each store an image was imported to"""
+    properties = image.properties or {}
+    stores = {store: 'failed' for store in requested or []}
+    for store in _split_stores(properties.get('stores')):
+        stores[store] = 'active'
+    for store in _split_stores(properties.get('os_glance_failed_import')):
+        stores[store] = 'failed'
+    for store in _split_stores(
+        properties.get('os_glance_importing_to_stores')
+    ):
+        stores[store] = 'importing'
+    return stores
+
+
 def get_data_from_stdin() -> Any:
     # distinguish cases where:
     # (1) stdin is not valid (as in cron jobs):
@@ -370,7 +531,8 @@ class CreateImage(command.ShowOne):
             type=_parse_image_size,
             help=_(
                 "Size of image data in bytes. Providing this can improve "
-                "upload performance."
+                "upload performance. Data passed via stdin must be exactly "
+                "this size."
             ),
         )
         source_group = parser.add_mutually_exclusive_group()
@@ -545,20 +707,16 @@ class CreateImage(command.ShowOne):
             msg = _("--size requires image data via --file or stdin")
             raise exceptions.CommandError(msg)
 
-        if parsed_args.progress and parsed_args.filename:
-            # NOTE(stephenfin): we only show a progress bar if the user
-            # requested it *and* we're reading from a file (not stdin)
-            filesize = os.path.getsize(parsed_args.filename)
-            if filesize is not None:
-                kwargs['validate_checksum'] = False
-                kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-            else:
-                kwargs['data'] = fp
-        elif parsed_args.filename:
-            kwargs['filename'] = parsed_args.filename
+        source: transfer.UploadSource | transfer.StreamSource | None = None
+        progress = None
+        if parsed_args.filename:
+            source, progress = _get_upload_source(parsed_args)
+            kwargs['validate_checksum'] = False
+            kwargs['data'] = source
         elif fp:
+            source = _get_stream_source(fp, parsed_args.size)
             kwargs['validate_checksum'] = False
-            kwargs['data'] = fp
+            kwargs['data'] = source
 
         # sign an image using a given local private key file
         if parsed_args.sign_key_path or parsed_args.sign_cert_id:
@@ -619,8 +777,16 @@ class CreateImage(command.ShowOne):
         # automatically when possible if it is not provided.
         if parsed_args.size is not None:
             kwargs['size'] = parsed_args.size
+        elif source is not None and source.size is not None:
+            kwargs['size'] = source.size
 
-        image = image_client.create_image(**kwargs)
+        try:
+            image = image_client.create_image(**kwargs)
+        finally:
+            if progress is not None:
+                progress.close()
+            if isinstance(source, transfer.UploadSource):
+                source.close()
 
         if parsed_args.filename:
             fp.close()
@@ -628,6 +794,13 @@ class CreateImage(command.ShowOne):
         # NOTE(pas-ha): create_image returns the image object as it was created
         # before the data was uploaded, need a refresh to show the final state
         image = image_client.get_image(image)
+
+        if source is not None:
+            mismatch = _check_upload(image, source)
+            if mismatch:
+                image_client.delete_image(image.id)
+                raise exceptions.CommandError(mismatch)
+
         return _format_image(image)
 
     def _take_action_volume(
@@ -977,23 +1150,36 @@ class ListImage(command.Lister):
             columns = ("ID", "Name", "Status")
             column_headers = columns
 
+        # Let the server filter on the attributes it can, and check the rest
+        # as the images are received rather than once they have all been
+        predicates = []
+        for attr, value in (parsed_args.property or {}).items():
+            if (
+                attr in SERVER_PROPERTY_FILTERS
+                and attr not in kwargs
+                and value
+                # avoid values the server would take as an operator
+                and ':' not in value
+            ):
+                kwargs[attr] = value
+            else:
+                predicates.append(_match_property(attr, value))
+
         # List of image data received
         if 'limit' in kwargs:
             # Disable automatic pagination in SDK
             kwargs['paginated'] = False
 
-        images = list(image_client.images(**kwargs))
-
-        if parsed_args.property:
-            for attr, value in parsed_args.property.items():
-                api_utils.simple_filter(
-                    images,
-                    attr=attr,
-                    value=value,
-                    property_field='properties',
-                )
+        images = image_client.images(**kwargs)
+        if predicates:
+            images = (
+                image
+                for image in images
+                if all(predicate(image) for predicate in predicates)
+            )
 
-        data = utils.sort_items(images, parsed_args.sort, str)
+        # only the images which matched are held in memory to be sorted
+        data = utils.sort_items(list(images), parsed_args.sort, str)
 
         return (
             column_headers,
@@ -1121,6 +1307,32 @@ class ShowProjectImage(command.ShowOne):
         return (display_columns, data)
 
 
+def _get_hashers(image: Any) -> dict[str, tuple[Any, str]]:
+    """Get the hashers needed to verify the data of an image
+
+    :returns: a dict mapping algorithm names to a hasher and the digest
+        expected for the image
+    """
+    hashers = {}
+    if image.hash_algo and image.hash_value:
+        try:
+            hashers[image.hash_algo] = (
+                hashlib.new(image.hash_algo),
+                image.hash_value,
+            )
+        except ValueError:
+            LOG.warning(
+                _("Unsupported hash algorithm %(algo)s for image %(image)s"),
+                {'algo': image.hash_algo, 'image': image.id},
+            )
+    if image.checksum:
+        hashers['md5'] = (
+            hashlib.md5(usedforsecurity=False),
+            image.checksum,
+        )
+    return hashers
+
+
 class SaveImage(command.Command):
     _description = _("Save an image locally")
 
@@ -1129,11 +1341,10 @@ class SaveImage(command.Command):
         parser.add_argument(
             "--chunk-size",
             type=int,
-            default=1024,
             metavar="<chunk-size>",
             help=_(
                 "Size in bytes to read from the wire and buffer at one "
-                "time (default: 1024)"
+                "time (default: start small and grow up to 8 MiB)"
             ),
         )
         parser.add_argument(
@@ -1142,6 +1353,35 @@ class SaveImage(command.Command):
             dest="filename",
             help=_("Downloaded image save filename (default: stdout)"),
         )
+        parser.add_argument(
+            "--sparse",
+            action="store_true",
+            help=_(
+                "Seek over blocks of zeros instead of writing them, "
+                "producing a sparse file. This saves disk space and write "
+                "I/O for raw images (requires --file)"
+            ),
+        )
+        parser.add_argument(
+            "--parallel",
+            metavar="<count>",
+            type=int,
+            default=1,
+            help=_(
+                "Download the image as this many concurrent ranges where "
+                "the image store supports it. An interrupted download "
+                "resumes from the ranges already saved when the command is "
+                "run again (requires --file, default: 1)"
+            ),
+        )
+        parser.add_argument(
+            "--progress",
+            action="store_true",
+            help=_(
+                "Show download progress on stderr, as a progress bar or as "
+                "JSON events if stderr is not a terminal"
+            ),
+        )
         parser.add_argument(
             "image",
             metavar="<image>",
@@ -1150,23 +1390,238 @@ class SaveImage(command.Command):
         return parser
 
     def take_action(self, parsed_args: argparse.Namespace) -> None:
+        if parsed_args.sparse and parsed_args.filename is None:
+            msg = _("--sparse requires --file")
+            raise exceptions.CommandError(msg)
+        if parsed_args.parallel < 1:
+            msg = _("--parallel must be at least 1")
+            raise exceptions.CommandError(msg)
+        if parsed_args.parallel > 1:
+            if parsed_args.filename is None:
+                msg = _("--parallel requires --file")
+                raise exceptions.CommandError(msg)
+            if parsed_args.sparse:
+                msg = _("--parallel cannot be used with --sparse")
+                raise exceptions.CommandError(msg)
+
         image_client = self.app.client_manager.image
         image = image_client.find_image(
             parsed_args.image,
             ignore_missing=False,
         )
 
-        output_file = parsed_args.filename
-        if output_file is None:
-            output_file = getattr(sys.stdout, "buffer", sys.stdout)
+        hashers = _get_hashers(image)
+        if not hashers:
+            LOG.warning(
+                _(
+                    "Unable to verify the integrity of image %s, it has no "
+                    "checksum"
+                ),
+                image.id,
+            )
 
-        image_client.download_image(
-            image.id,
-            stream=True,
-            output=output_file,
-            chunk_size=parsed_args.chunk_size,
+        progress = None
+        tracker = None
+        if parsed_args.progress:
+            progress = progressbar.ProgressReporter()
+            tracker = progress.start(image.name or image.id, image.size)
+        try:
+            self._save(image_client, image, hashers, parsed_args, tracker)
+        finally:
+            if progress is not None:
+                progress.close()
+
+    def _save(
+        self,
+        image_client: Any,
+        image: Any,
+        hashers: dict[str, tuple[Any, str]],
+        parsed_args: argparse.Namespace,
+        tracker: progressbar.Transfer | None,
+    ) -> None:
+        started = time.monotonic()
+        if (
+            parsed_args.parallel > 1
+            and (image.size or 0) > DOWNLOAD_RANGE_SIZE
+            and self._supports_ranges(image_client, image)
+        ):
+            size = self._save_ranged(
+                image_client, image, hashers, parsed_args, tracker
+            )
+            self._log_rate(size, started)
+            return
+
+        response = image_client.download_image(image.id, stream=True)
+        # the raw stream is read directly to avoid copying the data through
+        # small chunks, so have it undo any content encoding itself
+        response.raw.decode_content = True
+        try:
+            if parsed_args.filename is None:
+                output = getattr(sys.stdout, "buffer", sys.stdout)
+                size = self._copy(
+                    response, output, hashers, parsed_args, tracker
+                )
+            else:
+                with open(parsed_args.filename, 'wb') as output:
+                    size = self._copy(
+                        response, output, hashers, parsed_args, tracker
+                    )
+        finally:
+            response.close()
+        if tracker is not None:
+            tracker.finish()
+        self._log_rate(size, started)
+
+        mismatch = self._check_hashes(image, hashers)
+        if mismatch:
+            if parsed_args.filename is not None:
+                os.unlink(parsed_args.filename)
+            raise exceptions.CommandError(mismatch)
+
+    @staticmethod
+    def _log_rate(size: int, started: float) -> None:
+        elapsed = max(time.monotonic() - started, 1e-6)
+        LOG.info(
+            _(
+                "Downloaded %(size)d bytes in %(elapsed).1fs "
+                "(%(rate).1f MiB/s)"
+            ),
+            {
+                'size': size,
+                'elapsed': elapsed,
+                'rate': size / elapsed / 1024**2,
+            },
+        )
+
+    @staticmethod
+    def _check_hashes(
+        image: Any, hashers: dict[str, tuple[Any, str]]
+    ) -> str | None:
+        for algo, (hasher, expected) in hashers.items():
+            if hasher.hexdigest() != expected:
+                return _(
+                    "The %(algo)s checksum of the data downloaded for image "
+                    "%(image)s does not match, expected %(expected)s but got "
+                    "%(actual)s"
+                ) % {
+                    'algo': algo,
+                    'image': image.id,
+                    'expected': expected,
+                    'actual': hasher.hexdigest(),
+                }
+        return None
+
+    @staticmethod
+    def _get_range(image_client: Any, image: Any, start: int, end: int) -> Any:
+        url = sdk_utils.urljoin(_image.Image.base_path, image.id, 'file')
+        return image_client.get(
+            url, headers={'Range': f'bytes={start}-{end}'}, stream=True
         )
 
+    def _supports_ranges(self, image_client: Any, image: Any) -> bool:
+        # Glance only honours ranges for images in stores which can seek,
+        # otherwise it either ignores the header or rejects the request
+        try:
+            response = self._get_range(image_client, image, 0, 0)
+        except ks_exceptions.RequestedRangeNotSatisfiable:
+            response = None
+        else:
+            response.close()
+        if response is None or response.status_code != 206:
+            LOG.info(
+                _(
+                    "The store of image %s does not support range requests, "
+                    "downloading it sequentially"
+                ),
+                image.id,
+            )
+            return False
+        return True
+
+    def _save_ranged(
+        self,
+        image_client: Any,
+        image: Any,
+        hashers: dict[str, tuple[Any, str]],
+        parsed_args: argparse.Namespace,
+        tracker: progressbar.Transfer | None = None,
+    ) -> int:
+        download = transfer.RangedDownload(
+            parsed_args.filename,
+            image.size,
+            DOWNLOAD_RANGE_SIZE,
+            {
+                'image': image.id,
+                'checksum': image.hash_value or image.checksum,
+            },
+        )
+
+        def _fetch(start: int, end: int) -> Iterable[bytes]:
+            response = self._get_range(image_client, image, start, end)
+            if response.status_code != 206:
+                response.close()
+                msg = _("The image store ignored the range request")
+                raise exceptions.CommandError(msg)
+            return response.iter_content(transfer.MIN_BUFFER_SIZE)
+
+        transfer.grow_connection_pool(
+            getattr(image_client, 'session', None), parsed_args.parallel
+        )
+        try:
+            download.run(_fetch, parsed_args.parallel, tracker)
+        except Exception as e:
+            msg = _(
+                "Failed to download image %(image)s, run the command again "
+                "to resume: %(e)s"
+            ) % {'image': image.id, 'e': e}
+            raise exceptions.CommandError(msg)
+
+        # the ranges arrive out of order, so hash the data once it is all
+        # on disk
+        with open(download.part_path, 'rb') as data:
+            transfer.copy(
+                data,
+                lambda buffer: None,
+                hashers=[hasher for hasher, _expected in hashers.values()],
+            )
+        mismatch = self._check_hashes(image, hashers)
+        if mismatch:
+            download.discard()
+            raise exceptions.CommandError(mismatch)
+
+        download.commit()
+        if tracker is not None:
+            tracker.finish()
+        return int(image.size)
+
+    def _copy(
+        self,
+        response: Any,
+        output: Any,
+        hashers: dict[str, tuple[Any, str]],
+        parsed_args: argparse.Namespace,
+        tracker: progressbar.Transfer | None = None,
+    ) -> int:
+        writer = None
+        if parsed_args.sparse:
+            writer = transfer.SparseWriter(output)
+        write = writer.write if writer else output.write
+
+        def _write_tracked(data: memoryview) -> None:
+            write(data)
+            if tracker is not None:
+                tracker.update(len(data))
+
+        size = transfer.copy(
+            response.raw,
+            write if tracker is None else _write_tracked,
+            hashers=[hasher for hasher, _expected in hashers.values()],
+            buffer_size=parsed_args.chunk_size,
+        )
+        if writer:
+            writer.finish()
+        return size
+
 
 class SetImage(command.Command):
     _description = _("Set image properties")
@@ -1644,7 +2099,8 @@ class StageImage(command.Command):
             type=_parse_image_size,
             help=_(
                 'Size of image data in bytes. Providing this can improve '
-                'upload performance.'
+                'upload performance. Data passed via stdin must be exactly '
+                'this size.'
             ),
         )
         parser.add_argument(
@@ -1689,28 +2145,42 @@ class StageImage(command.Command):
 
         kwargs: dict[str, Any] = {}
 
-        if parsed_args.progress and parsed_args.filename:
-            # NOTE(stephenfin): we only show a progress bar if the user
-            # requested it *and* we're reading from a file (not stdin)
-            filesize = os.path.getsize(parsed_args.filename)
-            if filesize is not None:
-                kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-            else:
-                kwargs['data'] = fp
-        elif parsed_args.filename:
-            kwargs['filename'] = parsed_args.filename
+        source: transfer.UploadSource | transfer.StreamSource | None = None
+        progress = None
+        if parsed_args.filename:
+            fp.close()
+            source, progress = _get_upload_source(parsed_args)
+            kwargs['data'] = source
         elif fp:
-            kwargs['data'] = fp
+            source = _get_stream_source(fp, parsed_args.size)
+            kwargs['data'] = source
 
         # Pass size only when uploading data. The SDK calculates size
         # automatically when possible if it is not provided.
         if parsed_args.size is not None:
             kwargs['size'] = parsed_args.size
+        elif source is not None and source.size is not None:
+            kwargs['size'] = source.size
 
-        image_client.stage_image(image, **kwargs)
+        try:
+            image_client.stage_image(image, **kwargs)
+        finally:
+            if progress is not None:
+                progress.close()
+            if isinstance(source, transfer.UploadSource):
+                source.close()
+
+        digest = source.hexdigests().get(UPLOAD_HASH_ALGO) if source else None
+        if digest:
+            # staged data is only hashed by the server once it is imported,
+            # so log the hash for comparison with the imported image
+            LOG.info(
+                _("Staged data for image %(image)s with %(algo)s %(hash)s"),
+                {'image': image.id, 'algo': UPLOAD_HASH_ALGO, 'hash': digest},
+            )
 
 
-class ImportImage(command.ShowOne):
+class ImportImage(command.Lister):
     _description = _(
         "Initiate the image import process.\n"
         "This requires support for the interoperable image import process, "
@@ -1718,13 +2188,31 @@ class ImportImage(command.ShowOne):
         "(Glance 16.0.0 (Queens))"
     )
 
+    # the error to raise once the results have been shown, if any of the
+    # imports failed
+    _failure: str | None = None
+
     def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
         parser = super().get_parser(prog_name)
 
         parser.add_argument(
-            'image',
+            'images',
             metavar='<image>',
-            help=_('Image to initiate import process for (name or ID)'),
+            nargs='*',
+            help=_(
+                'Image(s) to initiate import process for (name or ID) '
+                '(repeat option to import multiple images)'
+            ),
+        )
+        parser.add_argument(
+            '--manifest',
+            metavar='<file>',
+            help=_(
+                "JSON file listing images to import, as a list of objects "
+                "with an 'image' key and optional 'method', 'uri', 'stores' "
+                "and 'all_stores' keys which override the options given for "
+                "that image"
+            ),
         )
         parser.add_argument(
             '--method',
@@ -1822,18 +2310,45 @@ class ImportImage(command.ShowOne):
                 'Only usable with --stores or --all-stores'
             ),
         )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=10,
+            help=_('Number of imports to start at once (default: 10)'),
+        )
         parser.add_argument(
             '--wait',
             action='store_true',
-            help=_('Wait for operation to complete'),
+            help=_(
+                'Wait for operation to complete, checking on all the images '
+                'together'
+            ),
+        )
+        parser.add_argument(
+            '--timeout',
+            metavar='<seconds>',
+            type=int,
+            default=3600,
+            help=_(
+                'Number of seconds to wait for the imports to finish with '
+                '--wait, after which those still running are reported as '
+                'errors (default: 3600)'
+            ),
         )
         return parser
 
     def take_action(
         self, parsed_args: argparse.Namespace
-    ) -> tuple[Sequence[str], Iterable[Any]]:
+    ) -> tuple[Sequence[str], Iterable[tuple[Any, ...]]]:
         image_client = self.app.client_manager.image
 
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        entries = self._get_entries(parsed_args)
+
         try:
             import_info = image_client.get_import_info()
         except sdk_exceptions.ResourceNotFound:
@@ -1844,7 +2359,148 @@ class ImportImage(command.ShowOne):
 
         import_methods = import_info.import_methods['value']
 
-        if parsed_args.import_method not in import_methods:
+        # check every image before starting any import, so that a mistake
+        # in one does not leave the others half done
+        images = []
+        for entry in entries:
+            self._check_options(entry, import_methods)
+            image = image_client.find_image(entry.image, ignore_missing=False)
+            self._check_image(entry, image)
+            images.append((entry, image))
+
+        def _import(item: tuple[argparse.Namespace, Any]) -> None:
+            entry, image = item
+            image_client.import_image(
+                image,
+                method=entry.import_method,
+                uri=entry.uri,
+                remote_region=entry.remote_region,
+                remote_image_id=entry.remote_image,
+                remote_service_interface=entry.remote_service_interface,
+                stores=entry.stores,
+                all_stores=entry.all_stores,
+                all_stores_must_succeed=not entry.allow_failure,
+            )
+
+        errors = {}
+        for (_entry, image), _result, error in transfer.run_concurrently(
+            _import, images, parsed_args.parallel
+        ):
+            if error is not None:
+                errors[image.id] = error
+
+        final: dict[str, Any | None] = {}
+        if parsed_args.wait:
+            started = [
+                image for _entry, image in images if image.id not in errors
+            ]
+            final = self._wait_for_imports(
+                image_client, started, parsed_args.timeout
+            )
+            for image in started:
+                if image.id not in final:
+                    errors[image.id] = exceptions.CommandError(
+                        _(
+                            "Timed out after %s seconds waiting for the "
+                            "import to finish"
+                        )
+                        % parsed_args.timeout
+                    )
+
+        rows, failed = self._format_results(images, errors, final)
+        self._failure = None
+        if failed:
+            self._failure = _(
+                "Failed to import %(failed)s of %(total)s image(s)"
+            ) % {'failed': failed, 'total': len(images)}
+        return ('ID', 'Name', 'Method', 'Store', 'Status'), rows
+
+    def produce_output(
+        self,
+        parsed_args: argparse.Namespace,
+        column_names: Sequence[str],
+        data: Iterable[Sequence[Any]],
+    ) -> int:
+        # the table formatter only writes the table once it has every row,
+        # so fail after the results are shown rather than while they are
+        # produced
+        result = super().produce_output(parsed_args, column_names, data)
+        if self._failure:
+            raise exceptions.CommandError(self._failure)
+        return result
+
+    def _get_entries(
+        self, parsed_args: argparse.Namespace
+    ) -> list[argparse.Namespace]:
+        """Get the options to import each image with"""
+        entries = []
+        for name in parsed_args.images:
+            entry = copy.copy(parsed_args)
+            entry.image = name
+            entries.append(entry)
+
+        if parsed_args.manifest:
+            try:
+                with open(parsed_args.manifest) as fh:
+                    manifest = json.load(fh)
+            except (OSError, ValueError) as e:
+                msg = _("Failed to read manifest %(file)s: %(e)s")
+                raise exceptions.CommandError(
+                    msg % {'file': parsed_args.manifest, 'e': e}
+                )
+            if not isinstance(manifest, list):
+                msg = _("The manifest must be a list of images to import")
+                raise exceptions.CommandError(msg)
+
+            for item in manifest:
+                if not isinstance(item, dict) or 'image' not in item:
+                    msg = _(
+                        "Each image in the manifest must be an object with "
+                        "an 'image' key, not %(item)r"
+                    )
+                    raise exceptions.CommandError(msg % {'item': item})
+                unknown = set(item) - set(IMPORT_MANIFEST_KEYS)
+                if unknown:
+                    msg = _(
+                        "Unknown keys %(keys)s for image %(image)s in the "
+                        "manifest. Supported: %(supported)s"
+                    )
+                    raise exceptions.CommandError(
+                        msg
+                        % {
+                            'keys': ', '.join(sorted(unknown)),
+                            'image': item['image'],
+                            'supported': ', '.join(IMPORT_MANIFEST_KEYS),
+                        }
+                    )
+                if item.get('stores') and item.get('all_stores'):
+                    msg = _(
+                        "Image %(image)s in the manifest cannot have both "
+                        "'stores' and 'all_stores'"
+                    )
+                    raise exceptions.CommandError(
+                        msg % {'image': item['image']}
+                    )
+
+                entry = copy.copy(parsed_args)
+                if 'stores' in item:
+                    entry.all_stores = False
+                if 'all_stores' in item:
+                    entry.stores = None
+                for key, value in item.items():
+                    setattr(entry, IMPORT_MANIFEST_KEYS[key], value)
+                entries.append(entry)
+
+        if not entries:
+            msg = _("At least one image or a --manifest is required")
+            raise exceptions.CommandError(msg)
+
+        return entries
+
+    def _check_options(
+        self, entry: argparse.Namespace, import_methods: list[str]
+    ) -> None:
+        if entry.import_method not in import_methods:
             msg = _(
                 "The '%(method)s' import method is not supported by this "
                 "deployment. Supported: %(supported)s"
@@ -1852,73 +2508,70 @@ class ImportImage(command.ShowOne):
             raise exceptions.CommandError(
                 msg
                 % {
-                    'method': parsed_args.import_method,
+                    'method': entry.import_method,
                     'supported': ', '.join(import_methods),
                 },
             )
 
-        if parsed_args.import_method == 'web-download':
-            if not parsed_args.uri:
+        if entry.import_method == 'web-download':
+            if not entry.uri:
                 msg = _(
                     "The '--uri' option is required when using "
                     "'--method=web-download'"
                 )
                 raise exceptions.CommandError(msg)
-            _parsed = urllib.parse.urlparse(parsed_args.uri)
+            _parsed = urllib.parse.urlparse(entry.uri)
             if not all({_parsed.scheme, _parsed.netloc}):
                 msg = _("'%(uri)s' is not a valid url")
                 raise exceptions.CommandError(
-                    msg % {'uri': parsed_args.uri},
+                    msg % {'uri': entry.uri},
                 )
         else:
-            if parsed_args.uri:
+            if entry.uri:
                 msg = _(
                     "The '--uri' option is only supported when using "
                     "'--method=web-download'"
                 )
                 raise exceptions.CommandError(msg)
 
-        if parsed_args.import_method == 'glance-download':
-            if not (parsed_args.remote_region and parsed_args.remote_image):
+        if entry.import_method == 'glance-download':
+            if not (entry.remote_region and entry.remote_image):
                 msg = _(
                     "The '--remote-region' and '--remote-image' options are "
                     "required when using '--method=web-download'"
                 )
                 raise exceptions.CommandError(msg)
         else:
-            if parsed_args.remote_region:
+            if entry.remote_region:
                 msg = _(
                     "The '--remote-region' option is only supported when "
                     "using '--method=glance-download'"
                 )
                 raise exceptions.CommandError(msg)
 
-            if parsed_args.remote_image:
+            if entry.remote_image:
                 msg = _(
                     "The '--remote-image' option is only supported when using "
                     "'--method=glance-download'"
                 )
                 raise exceptions.CommandError(msg)
 
-            if parsed_args.remote_service_interface:
+            if entry.remote_service_interface:
                 msg = _(
                     "The '--remote-service-interface' option is only "
                     "supported when using '--method=glance-download'"
                 )
                 raise exceptions.CommandError(msg)
 
-        if parsed_args.import_method == 'copy-image':
-            if not (parsed_args.stores or parsed_args.all_stores):
+        if entry.import_method == 'copy-image':
+            if not (entry.stores or entry.all_stores):
                 msg = _(
                     "The '--stores' or '--all-stores' options are required "
                     "when using '--method=copy-image'"
                 )
                 raise exceptions.CommandError(msg)
 
-        image = image_client.find_image(
-            parsed_args.image, ignore_missing=False
-        )
-
+    def _check_image(self, entry: argparse.Namespace, image: Any) -> None:
         if not image.container_format and not image.disk_format:
             msg = _(
                 "The 'container_format' and 'disk_format' properties "
@@ -1926,21 +2579,21 @@ class ImportImage(command.ShowOne):
             )
             raise exceptions.CommandError(msg)
 
-        if parsed_args.import_method == 'glance-direct':
+        if entry.import_method == 'glance-direct':
             if image.status != 'uploading':
                 msg = _(
                     "The 'glance-direct' import method can only be used with "
                     "an image in status 'uploading'"
                 )
                 raise exceptions.CommandError(msg)
-        elif parsed_args.import_method == 'web-download':
+        elif entry.import_method == 'web-download':
             if image.status != 'queued':
                 msg = _(
                     "The 'web-download' import method can only be used with "
                     "an image in status 'queued'"
                 )
                 raise exceptions.CommandError(msg)
-        elif parsed_args.import_method == 'copy-image':
+        elif entry.import_method == 'copy-image':
             if image.status != 'active':
                 msg = _(
                     "The 'copy-image' import method can only be used with "
@@ -1948,21 +2601,108 @@ class ImportImage(command.ShowOne):
                 )
                 raise exceptions.CommandError(msg)
 
-        image_client.import_image(
-            image,
-            method=parsed_args.import_method,
-            uri=parsed_args.uri,
-            remote_region=parsed_args.remote_region,
-            remote_image_id=parsed_args.remote_image,
-            remote_service_interface=parsed_args.remote_service_interface,
-            stores=parsed_args.stores,
-            all_stores=parsed_args.all_stores,
-            all_stores_must_succeed=not parsed_args.allow_failure,
-        )
+    def _wait_for_imports(
+        self, image_client: Any, images: list[Any], timeout: int
+    ) -> dict[str, Any | None]:
+        """Wait for the imports of several images to finish
+
+        All the images are checked with a single listing filtered by ID
+        each cycle, rather than polling each image in turn.
+
+        :param timeout: the number of seconds to wait for
+        :returns: the images once they have finished importing, or None for
+            those deleted while they were imported, by ID. Images whose
+            imports had not finished in time are left out.
+        """
+        pending = {image.id: image for image in images}
+        importing: set[str] = set()
+        final: dict[str, Any | None] = {}
+        deadline = time.monotonic() + timeout
+        while pending and time.monotonic() < deadline:
+            time.sleep(IMPORT_POLL_INTERVAL)
+            found = {
+                image.id: image
+                for image in image_client.images(id='in:' + ','.join(pending))
+            }
+            for image_id in list(pending):
+                image = found.get(image_id)
+                if image is None:
+                    # hidden images are not listed by default
+                    try:
+                        image = image_client.get_image(image_id)
+                    except sdk_exceptions.ResourceNotFound:
+                        final[image_id] = None
+                        del pending[image_id]
+                        continue
+
+                if image.status == 'importing':
+                    importing.add(image_id)
+                if _import_finished(image, image_id in importing):
+                    LOG.info(
+                        _("Import of image %(image)s finished: %(status)s"),
+                        {'image': image_id, 'status': image.status},
+                    )
+                    final[image_id] = image
+                    del pending[image_id]
+        return final
+
+    def _format_results(
+        self,
+        images: list[tuple[argparse.Namespace, Any]],
+        errors: dict[str, Exception],
+        final: dict[str, Any | None],
+    ) -> tuple[list[tuple[Any, ...]], int]:
+        """Get a row for each store of each image and the number that failed"""
+        rows = []
+        failed = 0
+        for entry, image in images:
+            method = entry.import_method
+            error = errors.get(image.id)
+            if error is not None:
+                failed += 1
+                LOG.error(
+                    _("Failed to import image %(image)s: %(e)s"),
+                    {'image': image.id, 'e': error},
+                )
+                rows.append((image.id, image.name, method, '', 'error'))
+                continue
+
+            if image.id not in final:
+                # not waiting, so the imports have only been started
+                for store in entry.stores or ['']:
+                    rows.append(
+                        (image.id, image.name, method, store, 'importing')
+                    )
+                continue
+
+            result = final[image.id]
+            if result is None:
+                failed += 1
+                LOG.error(
+                    _("Image %(image)s was deleted during its import"),
+                    {'image': image.id},
+                )
+                rows.append((image.id, image.name, method, '', 'deleted'))
+                continue
 
-        info = _format_image(image)
-        col_headers, col_data = zip(*sorted(info.items()))
-        return col_headers, col_data
+            stores = _get_import_stores(result, entry.stores)
+            if result.status not in ('active', 'deactivated') or any(
+                status != 'active' for status in stores.values()
+            ):
+                failed += 1
+                LOG.error(
+                    _(
+                        "Failed to import image %(image)s, its status is "
+                        "%(status)s"
+                    ),
+                    {'image': image.id, 'status': result.status},
+                )
+            if not stores:
+                rows.append((image.id, image.name, method, '', result.status))
+            for store, status in stores.items():
+                rows.append((image.id, image.name, method, store, status))
+
+        return rows, failed
 
 
 class StoresInfo(command.Lister):
@@ -22,6 +22,7 @@ from typing import Any
 
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
+from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient import command
@@ -107,17 +108,22 @@ class DeleteContainer(command.Command):
         return parser
 
     def take_action(self, parsed_args: argparse.Namespace) -> None:
+        object_store = self.app.client_manager.object_store
         for container in parsed_args.containers:
             if parsed_args.recursive:
-                objs = self.app.client_manager.object_store.object_list(
-                    container=container
-                )
-                for obj in objs:
-                    self.app.client_manager.object_store.object_delete(
-                        container=container,
-                        object=obj['name'],
-                    )
-            self.app.client_manager.object_store.container_delete(
+                failures = object_store.object_delete_all(container=container)
+                if failures:
+                    for name, reason in failures:
+                        LOG.error(
+                            _("Failed to delete object '%(object)s': %(e)s"),
+                            {'object': name, 'e': reason},
+                        )
+                    msg = _(
+                        "Failed to delete %(count)s object(s) from container "
+                        "%(container)s"
+                    ) % {'count': len(failures), 'container': container}
+                    raise exceptions.CommandError(msg)
+            object_store.container_delete(
                 container=container,
             )
 
@@ -170,10 +176,13 @@ class ListContainer(command.Lister):
             kwargs['end_marker'] = parsed_args.end_marker
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
-        if parsed_args.all:
-            kwargs['full_listing'] = True
 
-        data = self.app.client_manager.object_store.container_list(**kwargs)
+        object_store = self.app.client_manager.object_store
+        if parsed_args.all:
+            # stream the listing so that output starts with the first page
+            data = object_store.container_list_iter(prefetch=True, **kwargs)
+        else:
+            data = object_store.container_list(**kwargs)
 
         return (
             columns,
@@ -198,12 +207,51 @@ class SaveContainer(command.Command):
             metavar='<container>',
             help=_('Container to save'),
         )
+        parser.add_argument(
+            '--prefix',
+            metavar='<prefix>',
+            help=_('Only save objects whose names start with <prefix>'),
+        )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=10,
+            help=_('Number of objects to save at once (default: 10)'),
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help=_(
+                'Skip objects whose local copy already matches the size and '
+                'checksum of the object, so that repeated runs only download '
+                'objects which have changed'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args: argparse.Namespace) -> None:
-        self.app.client_manager.object_store.container_save(
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        failures = self.app.client_manager.object_store.container_save(
             container=parsed_args.container,
+            prefix=parsed_args.prefix,
+            concurrency=parsed_args.parallel,
+            sync=parsed_args.sync,
         )
+        if failures:
+            for name, reason in failures:
+                LOG.error(
+                    _("Failed to save object '%(object)s': %(e)s"),
+                    {'object': name, 'e': reason},
+                )
+            msg = _(
+                "Failed to save %(count)s object(s) from container "
+                "%(container)s"
+            ) % {'count': len(failures), 'container': parsed_args.container}
+            raise exceptions.CommandError(msg)
 
 
 class SetContainer(command.Command):
@@ -16,8 +16,11 @@
 """Object v1 action implementations"""
 
 import argparse
+import hashlib
 import logging
-from collections.abc import Iterable, Sequence
+import os
+import re
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Any
 
 from osc_lib.cli import format_columns
@@ -26,16 +29,71 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient import command
+from openstackclient.common import cache
 from openstackclient.common import pagination
+from openstackclient.common import progressbar
 from openstackclient.i18n import _
 
 
 LOG = logging.getLogger(__name__)
 
+_SIZE_UNITS = {'': 1, 'k': 1024, 'm': 1024**2, 'g': 1024**3, 't': 1024**4}
+
+
+def _parse_size(value: str) -> int:
+    """Parse a size in bytes with an optional K, M, G or T suffix"""
+    match = re.fullmatch(r'(\d+)([kmgt]?)', value.strip().lower())
+    if not match or not int(match.group(1)):
+        raise argparse.ArgumentTypeError(
+            _(
+                "'%(value)s' is not a valid size (use a positive integer "
+                "optionally followed by K, M, G or T)"
+            )
+            % {'value': value}
+        )
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2)]
+
+
+def _walk(path: str) -> Iterator[str]:
+    """Yield the files found under a path, or the path itself if a file"""
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    for root, dirs, files in os.walk(path):
+        # walk in a stable order so that repeated uploads behave the same
+        dirs.sort()
+        for name in sorted(files):
+            yield os.path.join(root, name)
+
+
+def _get_trans_id(error: Exception | None) -> str | None:
+    """Get the transaction ID of the request that caused an error, if any"""
+    while error is not None:
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.headers.get('X-Trans-Id')
+        cause = error.__cause__
+        error = cause if isinstance(cause, Exception) else None
+    return None
+
+
+def _get_progress(
+    parsed_args: argparse.Namespace,
+) -> progressbar.ProgressReporter | None:
+    """Get a reporter for the transfers of a command run with --progress"""
+    if not parsed_args.progress:
+        return None
+    return progressbar.ProgressReporter()
+
 
 class CreateObject(command.Lister):
     _description = _("Upload object to container")
 
+    # the error to raise once the results have been shown, if any of the
+    # uploads failed
+    _failure: str | None = None
+
     def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
         parser = super().get_parser(prog_name)
         parser.add_argument(
@@ -47,7 +105,7 @@ class CreateObject(command.Lister):
             'objects',
             metavar='<filename>',
             nargs="+",
-            help=_('Local filename(s) to upload'),
+            help=_('Local filename(s) or directories to upload'),
         )
         parser.add_argument(
             '--name',
@@ -57,48 +115,222 @@ class CreateObject(command.Lister):
                 'Can only be used when uploading a single object'
             ),
         )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=1,
+            help=_(
+                'Number of objects to upload at once (default: 1). '
+                'Directories given as <filename> are uploaded recursively, '
+                'using the path of each file as its object name'
+            ),
+        )
+        parser.add_argument(
+            '--segment-size',
+            metavar='<size>',
+            type=_parse_size,
+            help=_(
+                'Upload files larger than <size> as Static Large Objects '
+                'made of segments of this size, with up to --parallel '
+                'segments uploaded at once. Accepts a K, M, G or T suffix'
+            ),
+        )
+        parser.add_argument(
+            '--segment-container',
+            metavar='<container>',
+            help=_(
+                'Container to store segments in '
+                '(default: <container>_segments)'
+            ),
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help=_(
+                'Skip segments which a previous upload of the same file '
+                'already stored with a matching checksum'
+            ),
+        )
+        parser.add_argument(
+            '--progress',
+            action='store_true',
+            help=_(
+                'Show upload progress on stderr, as a progress bar or as '
+                'JSON events if stderr is not a terminal'
+            ),
+        )
         return parser
 
     def take_action(
         self, parsed_args: argparse.Namespace
     ) -> tuple[Sequence[str], Iterable[tuple[Any, ...]]]:
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        columns = ("object", "container", "etag", "x-trans-id")
+        self._failure = None
+        object_store = self.app.client_manager.object_store
+        progress = _get_progress(parsed_args)
+
         if parsed_args.name:
-            if len(parsed_args.objects) > 1:
+            if len(parsed_args.objects) > 1 or os.path.isdir(
+                parsed_args.objects[0]
+            ):
                 msg = _(
                     'Attempting to upload multiple objects and '
                     'using --name is not permitted'
                 )
                 raise exceptions.CommandError(msg)
-        results = []
-        for obj in parsed_args.objects:
-            if len(obj) > 1024:
-                LOG.warning(
-                    _(
-                        'Object name is %s characters long, default limit'
-                        ' is 1024'
-                    ),
-                    len(obj),
-                )
-            data = self.app.client_manager.object_store.object_create(
-                container=parsed_args.container,
-                object=obj,
-                name=parsed_args.name,
+            try:
+                if self._is_segmented(parsed_args, parsed_args.objects[0]):
+                    data = self._create_segmented(
+                        parsed_args,
+                        parsed_args.objects[0],
+                        parsed_args.name,
+                        progress,
+                    )
+                else:
+                    data = object_store.object_create(
+                        container=parsed_args.container,
+                        object=parsed_args.objects[0],
+                        name=parsed_args.name,
+                        progress=progress,
+                    )
+            finally:
+                if progress is not None:
+                    progress.close()
+            return (
+                columns,
+                [utils.get_dict_properties(data, columns, formatters={})],
             )
-            results.append(data)
 
-        columns = ("object", "container", "etag")
-        return (
-            columns,
-            (
-                utils.get_dict_properties(
-                    s,
-                    columns,
-                    formatters={},
-                )
-                for s in results
-            ),
+        results = self._upload(parsed_args, progress)
+        rows, failed = self._format_results(results, columns, progress)
+        if failed:
+            self._failure = _(
+                "Failed to upload %(failed)s object(s) to container "
+                "%(container)s"
+            ) % {'failed': failed, 'container': parsed_args.container}
+        return columns, rows
+
+    def produce_output(
+        self,
+        parsed_args: argparse.Namespace,
+        column_names: Sequence[str],
+        data: Iterable[Sequence[Any]],
+    ) -> int:
+        # the table formatter only writes the table once it has every row,
+        # so fail after the results are shown rather than while they are
+        # produced
+        result = super().produce_output(parsed_args, column_names, data)
+        if self._failure:
+            raise exceptions.CommandError(self._failure)
+        return result
+
+    def _is_segmented(
+        self, parsed_args: argparse.Namespace, path: str
+    ) -> bool:
+        return bool(parsed_args.segment_size) and (
+            os.path.isfile(path)
+            and os.path.getsize(path) > parsed_args.segment_size
         )
 
+    def _create_segmented(
+        self,
+        parsed_args: argparse.Namespace,
+        path: str,
+        name: str | None = None,
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> dict[str, Any]:
+        return self.app.client_manager.object_store.object_create_segmented(
+            container=parsed_args.container,
+            object=path,
+            name=name,
+            segment_size=parsed_args.segment_size,
+            segment_container=parsed_args.segment_container,
+            concurrency=parsed_args.parallel,
+            resume=parsed_args.resume,
+            progress=progress,
+        )
+
+    def _upload(
+        self,
+        parsed_args: argparse.Namespace,
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any] | None, Exception | None]]:
+        # large files are uploaded one at a time once the rest are done,
+        # with their segments spread over the workers instead
+        large = []
+
+        def _small() -> Iterator[str]:
+            for path in self._expand_objects(parsed_args.objects):
+                if self._is_segmented(parsed_args, path):
+                    large.append(path)
+                else:
+                    yield path
+
+        yield from self.app.client_manager.object_store.object_create_many(
+            container=parsed_args.container,
+            objects=_small(),
+            concurrency=parsed_args.parallel,
+            progress=progress,
+        )
+
+        for path in large:
+            try:
+                data = self._create_segmented(
+                    parsed_args, path, progress=progress
+                )
+            except Exception as e:
+                yield path, None, e
+            else:
+                yield path, data, None
+
+    def _expand_objects(self, objects: list[str]) -> Iterator[str]:
+        for obj in objects:
+            for path in _walk(obj):
+                if len(path) > 1024:
+                    LOG.warning(
+                        _(
+                            'Object name is %s characters long, default '
+                            'limit is 1024'
+                        ),
+                        len(path),
+                    )
+                yield path
+
+    def _format_results(
+        self,
+        results: Iterable[tuple[str, dict[str, Any] | None, Exception | None]],
+        columns: Sequence[str],
+        progress: progressbar.ProgressReporter | None = None,
+    ) -> tuple[list[tuple[Any, ...]], int]:
+        """Get a row for each uploaded object and the number that failed"""
+        rows = []
+        failed = 0
+        try:
+            for obj, data, error in results:
+                if data is None:
+                    failed += 1
+                    msg = _("Failed to upload object '%(object)s': %(e)s")
+                    trans_id = _get_trans_id(error)
+                    if trans_id:
+                        msg += ' (x-trans-id: %(trans_id)s)'
+                    LOG.error(
+                        msg,
+                        {'object': obj, 'e': error, 'trans_id': trans_id},
+                    )
+                    continue
+                rows.append(
+                    utils.get_dict_properties(data, columns, formatters={})
+                )
+        finally:
+            if progress is not None:
+                progress.close()
+        return rows, failed
+
 
 class DeleteObject(command.Command):
     _description = _("Delete object from container")
@@ -186,12 +418,17 @@ class ListObject(command.Lister):
             kwargs['end_marker'] = parsed_args.end_marker
         if parsed_args.limit:
             kwargs['limit'] = parsed_args.limit
-        if parsed_args.all:
-            kwargs['full_listing'] = True
 
-        data = self.app.client_manager.object_store.object_list(
-            container=parsed_args.container, **kwargs
-        )
+        object_store = self.app.client_manager.object_store
+        if parsed_args.all:
+            # stream the listing so that output starts with the first page
+            data = object_store.object_list_iter(
+                container=parsed_args.container, prefetch=True, **kwargs
+            )
+        else:
+            data = object_store.object_list(
+                container=parsed_args.container, **kwargs
+            )
 
         return (
             columns,
@@ -229,14 +466,73 @@ class SaveObject(command.Command):
             metavar="<object>",
             help=_("Object to save"),
         )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=1,
+            help=_(
+                'Number of ranges of the object to download at once '
+                '(default: 1). Interrupted downloads of more than one range '
+                'resume from the ranges which are missing'
+            ),
+        )
+        parser.add_argument(
+            '--range-size',
+            metavar='<size>',
+            type=_parse_size,
+            help=_(
+                'Size of the ranges to download when using --parallel '
+                '(default: 64M). Accepts a K, M, G or T suffix'
+            ),
+        )
+        parser.add_argument(
+            '--progress',
+            action='store_true',
+            help=_(
+                'Show download progress on stderr, as a progress bar or as '
+                'JSON events if stderr is not a terminal'
+            ),
+        )
         return parser
 
     def take_action(self, parsed_args: argparse.Namespace) -> None:
-        self.app.client_manager.object_store.object_save(
-            container=parsed_args.container,
-            object=parsed_args.object,
-            file=parsed_args.file,
-        )
+        object_store = self.app.client_manager.object_store
+
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+
+        ranged = parsed_args.parallel > 1 or bool(parsed_args.range_size)
+        if ranged and parsed_args.file == '-':
+            msg = _('Cannot download ranges of an object to stdout')
+            raise exceptions.CommandError(msg)
+
+        progress = _get_progress(parsed_args)
+        try:
+            if not ranged:
+                object_store.object_save(
+                    container=parsed_args.container,
+                    object=parsed_args.object,
+                    file=parsed_args.file,
+                    progress=progress,
+                )
+                return
+
+            kwargs = {}
+            if parsed_args.range_size:
+                kwargs['range_size'] = parsed_args.range_size
+            object_store.object_save_ranged(
+                container=parsed_args.container,
+                object=parsed_args.object,
+                file=parsed_args.file,
+                concurrency=parsed_args.parallel,
+                progress=progress,
+                **kwargs,
+            )
+        finally:
+            if progress is not None:
+                progress.close()
 
 
 class SetObject(command.Command):
@@ -305,6 +601,143 @@ class ShowObject(command.ShowOne):
         return col_headers, col_data
 
 
+class SyncObject(command.Lister):
+    _description = _(
+        "Upload the files in a directory which are new or have changed"
+    )
+
+    # the error to raise once the results have been shown, if any of the
+    # files failed to sync
+    _failure: str | None = None
+
+    def get_parser(self, prog_name: str) -> argparse.ArgumentParser:
+        parser = super().get_parser(prog_name)
+        parser.add_argument(
+            'directory',
+            metavar='<directory>',
+            help=_('Local directory to upload'),
+        )
+        parser.add_argument(
+            'container',
+            metavar='<container>',
+            help=_('Container to upload to'),
+        )
+        parser.add_argument(
+            '--prefix',
+            metavar='<prefix>',
+            default='',
+            help=_(
+                'Prefix to add to the path of each file relative to '
+                '<directory> to get its object name'
+            ),
+        )
+        parser.add_argument(
+            '--parallel',
+            metavar='<count>',
+            type=int,
+            default=10,
+            help=_('Number of files to hash and upload at once (default: 10)'),
+        )
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help=_(
+                'Delete objects starting with the prefix which have no '
+                'matching local file'
+            ),
+        )
+        parser.add_argument(
+            '--index',
+            metavar='<file>',
+            help=_(
+                'File recording the size, modification time and checksum of '
+                'each local file so that unchanged files are not hashed '
+                'again (default: a file in the cache directory specific to '
+                '<directory>)'
+            ),
+        )
+        return parser
+
+    def take_action(
+        self, parsed_args: argparse.Namespace
+    ) -> tuple[Sequence[str], Iterable[tuple[Any, ...]]]:
+        if parsed_args.parallel < 1:
+            msg = _('--parallel must be at least 1')
+            raise exceptions.CommandError(msg)
+        if not os.path.isdir(parsed_args.directory):
+            msg = _('%s is not a directory') % parsed_args.directory
+            raise exceptions.CommandError(msg)
+
+        index_path = parsed_args.index
+        if not index_path:
+            digest = hashlib.sha256(
+                os.path.abspath(parsed_args.directory).encode('utf-8')
+            ).hexdigest()[:16]
+            index_path = self.app.client_manager.get_cache_file(
+                f'object-sync-{digest}'
+            )
+        index = cache.FileCache(index_path)
+
+        results = self.app.client_manager.object_store.object_sync(
+            directory=parsed_args.directory,
+            container=parsed_args.container,
+            prefix=parsed_args.prefix,
+            index=index,
+            concurrency=parsed_args.parallel,
+            delete=parsed_args.delete,
+        )
+        rows, failed = self._format_results(results, index)
+        self._failure = None
+        if failed:
+            self._failure = _(
+                "Failed to sync %(failed)s object(s) with container "
+                "%(container)s"
+            ) % {'failed': failed, 'container': parsed_args.container}
+        return ('Object', 'Action'), rows
+
+    def produce_output(
+        self,
+        parsed_args: argparse.Namespace,
+        column_names: Sequence[str],
+        data: Iterable[Sequence[Any]],
+    ) -> int:
+        # the table formatter only writes the table once it has every row,
+        # so fail after the results are shown rather than while they are
+        # produced
+        result = super().produce_output(parsed_args, column_names, data)
+        if self._failure:
+            raise exceptions.CommandError(self._failure)
+        return result
+
+    def _format_results(
+        self,
+        results: Iterable[tuple[str, str | None, Exception | None]],
+        index: cache.FileCache,
+    ) -> tuple[list[tuple[Any, ...]], int]:
+        """Get a row for each object changed and the number that failed"""
+        rows = []
+        failed = 0
+        unchanged = 0
+        try:
+            for name, action, error in results:
+                if error is not None:
+                    failed += 1
+                    LOG.error(
+                        _("Failed to sync object '%(object)s': %(e)s"),
+                        {'object': name, 'e': error},
+                    )
+                elif action is None:
+                    unchanged += 1
+                else:
+                    rows.append((name, action))
+        finally:
+            # keep the checksums computed so far even if the sync failed
+            index.save()
+
+        LOG.info(_('%d object(s) were already up to date'), unchanged)
+        return rows, failed
+
+
 class UnsetObject(command.Command):
     _description = _("Unset object properties")
 
@@ -21,6 +21,7 @@ import sys
 from typing import Any
 import warnings
 
+from cliff import command as cliff_command
 from osc_lib.api import auth
 from osc_lib.command import commandmanager
 from osc_lib import shell
@@ -198,6 +199,12 @@ class OpenStackShell(shell.OpenStackShell):
         # }
         self.command_manager.add_command_group('openstack.extension')
 
+    def prepare_to_run_command(self, cmd: cliff_command.Command) -> None:
+        # NOTE: identity lookups are only memoized for the lifetime of a
+        # single command, since the interactive shell may run many
+        self.client_manager.reset_identity_resolver()
+        super().prepare_to_run_command(cmd)
+
     def initialize_app(self, argv: list[str]) -> None:
         super().initialize_app(argv)
 
@@ -18,7 +18,7 @@ from openstackclient.tests.functional.object.v1 import common
 
 BASIC_LIST_HEADERS = ['Name']
 CONTAINER_FIELDS = ['account', 'container', 'x-trans-id']
-OBJECT_FIELDS = ['object', 'container', 'etag']
+OBJECT_FIELDS = ['object', 'container', 'etag', 'x-trans-id']
 
 
 class ObjectTests(common.ObjectStoreTests):
@@ -13,18 +13,28 @@
 
 """Object Store v1 API Library Tests"""
 
+import hashlib
+import io
+import json
+import os
+import re
 from unittest import mock
 
+import fixtures
 from keystoneauth1 import session
+from osc_lib import exceptions
 from requests_mock.contrib import fixture
 
 from openstackclient.api import object_store_v1 as object_store
+from openstackclient.common import cache
+from openstackclient.common import progressbar
 from openstackclient.tests.unit import utils
 
 
 FAKE_ACCOUNT = 'q12we34r'
 FAKE_AUTH = '11223344556677889900'
 FAKE_URL = 'http://gopher.com/v1/' + FAKE_ACCOUNT
+FAKE_INFO_URL = 'http://gopher.com/info'
 
 FAKE_CONTAINER = 'rainbarrel'
 FAKE_OBJECT = 'spigot'
@@ -58,6 +68,29 @@ class TestObjectAPIv1(utils.TestCase):
         self.requests_mock = self.useFixture(fixture.Fixture())
 
 
+class TestInfo(TestObjectAPIv1):
+    def test_info(self):
+        self.requests_mock.register_uri(
+            'GET', FAKE_INFO_URL, json={'swift': {}}, status_code=200
+        )
+        self.assertEqual({'swift': {}}, self.api.info())
+
+    def test_info_no_account(self):
+        # radosgw's endpoints have no account
+        self.api.endpoint = 'http://gopher.com/swift/v1'
+        self.requests_mock.register_uri(
+            'GET',
+            'http://gopher.com/swift/info',
+            json={'swift': {}},
+            status_code=200,
+        )
+        self.assertEqual({'swift': {}}, self.api.info())
+
+    def test_info_unavailable(self):
+        self.requests_mock.register_uri('GET', FAKE_INFO_URL, status_code=404)
+        self.assertEqual({}, self.api.info())
+
+
 class TestContainer(TestObjectAPIv1):
     def setUp(self):
         super().setUp()
@@ -156,6 +189,122 @@ class TestContainer(TestObjectAPIv1):
         )
         self.assertEqual(LIST_CONTAINER_RESP, ret)
 
+    def _register_save(self):
+        cwd = os.getcwd()
+        os.chdir(self.useFixture(fixtures.TempDir()).path)
+        self.addCleanup(os.chdir, cwd)
+
+        listing = [
+            {
+                'name': 'fred',
+                'bytes': 4,
+                'hash': hashlib.md5(b'yabb').hexdigest(),
+            },
+            {
+                'name': 'dir/wilma',
+                'bytes': 4,
+                'hash': hashlib.md5(b'dabb').hexdigest(),
+            },
+        ]
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz',
+            json=listing,
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=dir%2Fwilma',
+            json=[],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/fred',
+            content=b'yabb',
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/dir/wilma',
+            content=b'dabb',
+            status_code=200,
+        )
+
+    def test_container_save(self):
+        self._register_save()
+
+        ret = self.api.container_save(container='qaz', prefix='d')
+
+        self.assertEqual([], ret)
+        self.assertEqual(
+            'd', self.requests_mock.request_history[0].qs['prefix'][0]
+        )
+        for name, content in (('fred', b'yabb'), ('dir/wilma', b'dabb')):
+            with open(name, 'rb') as fh:
+                self.assertEqual(content, fh.read())
+
+    def test_container_save_sync(self):
+        self._register_save()
+        with open('fred', 'wb') as fh:
+            fh.write(b'yabb')
+        os.makedirs('dir')
+        with open('dir/wilma', 'wb') as fh:
+            fh.write(b'doo!')
+
+        ret = self.api.container_save(container='qaz', sync=True)
+
+        self.assertEqual([], ret)
+        saved = [
+            r.path
+            for r in self.requests_mock.request_history
+            if '/qaz/' in r.path
+        ]
+        self.assertEqual(['/v1/q12we34r/qaz/dir/wilma'], saved)
+        with open('dir/wilma', 'rb') as fh:
+            self.assertEqual(b'dabb', fh.read())
+
+    def test_container_save_failure(self):
+        self._register_save()
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/fred',
+            status_code=500,
+        )
+
+        ret = self.api.container_save(container='qaz')
+
+        self.assertEqual(['fred'], [name for name, _ in ret])
+
+    def test_container_list_iter(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '?limit=1&format=json',
+            json=[LIST_CONTAINER_RESP[0]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '?marker=qaz&limit=1&format=json',
+            json=[LIST_CONTAINER_RESP[1]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '?marker=fred&limit=1&format=json',
+            json=[],
+            status_code=200,
+        )
+
+        ret = self.api.container_list_iter(limit=1)
+
+        # nothing is fetched until the listing is consumed
+        self.assertEqual(0, self.requests_mock.call_count)
+        self.assertEqual(LIST_CONTAINER_RESP[0], next(ret))
+        self.assertEqual(1, self.requests_mock.call_count)
+        self.assertEqual([LIST_CONTAINER_RESP[1]], list(ret))
+        self.assertEqual(3, self.requests_mock.call_count)
+
     def test_container_show(self):
         headers = {
             'X-Container-Meta-Owner': FAKE_ACCOUNT,
@@ -220,6 +369,172 @@ class TestObject(TestObjectAPIv1):
         self.base_object_create('111\n222\n333\n')
         self.base_object_create(bytes([0x31, 0x00, 0x0D, 0x0A, 0x7F, 0xFF]))
 
+    def test_object_create_many(self):
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/fred',
+            headers={'Etag': 'abc'},
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/wilma',
+            status_code=503,
+        )
+
+        with mock.patch('builtins.open', mock.mock_open(read_data=b'x')):
+            ret = sorted(
+                self.api.object_create_many(
+                    container='qaz',
+                    objects=['fred', 'wilma'],
+                    concurrency=12,
+                ),
+                key=lambda r: r[0],
+            )
+
+        self.assertEqual('fred', ret[0][0])
+        self.assertEqual('abc', ret[0][1]['etag'])
+        self.assertIsNone(ret[0][2])
+        self.assertEqual('wilma', ret[1][0])
+        self.assertIsNone(ret[1][1])
+        self.assertIsNotNone(ret[1][2])
+        # the connection pool is grown to hold a connection per worker
+        adapter = self.api.session.session.get_adapter(FAKE_URL)
+        self.assertEqual(12, adapter._pool_maxsize)
+
+    def _make_file(self, contents):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'fred')
+        with open(path, 'wb') as fh:
+            fh.write(contents)
+        return path
+
+    def _register_segmented(self, max_segments=1000):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_INFO_URL,
+            json={'slo': {'max_manifest_segments': max_segments}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz_segments',
+            status_code=201,
+        )
+        self.segments = {}
+
+        def _put_segment(request, context):
+            # the body streams from the local file so read it while open
+            self.segments[request.path] = (
+                request.headers['ETag'],
+                request.body.read(),
+            )
+            context.status_code = 201
+            return ''
+
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz_segments/.*'),
+            text=_put_segment,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            FAKE_URL + '/qaz/big?multipart-manifest=put',
+            headers={'Etag': '"manifest"'},
+            status_code=201,
+        )
+
+    def test_object_create_segmented(self):
+        path = self._make_file(b'0123456789')
+        self._register_segmented()
+
+        ret = self.api.object_create_segmented(
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+        )
+
+        self.assertEqual('big', ret['object'])
+        self.assertEqual('"manifest"', ret['etag'])
+        segments = [self.segments[p] for p in sorted(self.segments)]
+        self.assertEqual(
+            [
+                (hashlib.md5(b).hexdigest(), b)
+                for b in (b'0123', b'4567', b'89')
+            ],
+            segments,
+        )
+        manifest = self.requests_mock.last_request.json()
+        self.assertEqual([4, 4, 2], [s['size_bytes'] for s in manifest])
+        self.assertEqual(
+            [etag for etag, _ in segments], [s['etag'] for s in manifest]
+        )
+        self.assertTrue(manifest[0]['path'].startswith('/qaz_segments/big/'))
+
+    def test_object_create_segmented_resume(self):
+        path = self._make_file(b'0123456789')
+        self._register_segmented()
+        self.requests_mock.register_uri(
+            'HEAD',
+            re.compile(FAKE_URL + '/qaz_segments/.*'),
+            status_code=404,
+        )
+        self.requests_mock.register_uri(
+            'HEAD',
+            re.compile(FAKE_URL + '/qaz_segments/.*/00000000$'),
+            headers={'Etag': hashlib.md5(b'0123').hexdigest()},
+            status_code=200,
+        )
+
+        self.api.object_create_segmented(
+            container='qaz',
+            object=path,
+            name='big',
+            segment_size=4,
+            resume=True,
+        )
+
+        uploaded = sorted(p.rsplit('/', 1)[-1] for p in self.segments)
+        self.assertEqual(['00000001', '00000002'], uploaded)
+        manifest = self.requests_mock.last_request.json()
+        self.assertEqual(3, len(manifest))
+
+    def test_object_create_segmented_progress(self):
+        path = self._make_file(b'0123456789')
+        self._register_segmented()
+        events = io.StringIO()
+
+        with progressbar.ProgressReporter(
+            stream=io.StringIO(), events=events
+        ) as progress:
+            self.api.object_create_segmented(
+                container='qaz',
+                object=path,
+                name='big',
+                segment_size=4,
+                progress=progress,
+            )
+
+        lines = [json.loads(line) for line in events.getvalue().splitlines()]
+        self.assertEqual(
+            [('start', 0), ('finish', 10)],
+            [(e['event'], e['bytes']) for e in (lines[0], lines[-1])],
+        )
+        self.assertEqual('big', lines[0]['name'])
+        self.assertEqual(10, lines[0]['total'])
+
+    def test_object_create_segmented_too_many_segments(self):
+        path = self._make_file(b'0123456789')
+        self._register_segmented(max_segments=2)
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.api.object_create_segmented,
+            container='qaz',
+            object=path,
+            segment_size=4,
+        )
+
     def test_object_delete(self):
         self.requests_mock.register_uri(
             'DELETE',
@@ -232,6 +547,128 @@ class TestObject(TestObjectAPIv1):
         )
         self.assertIsNone(ret)
 
+    def _register_listing(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz',
+            json=LIST_OBJECT_RESP,
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=wilma',
+            json=[],
+            status_code=200,
+        )
+
+    def test_object_delete_all_bulk(self):
+        self._register_listing()
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_INFO_URL,
+            json={'bulk_delete': {'max_deletes_per_request': 1}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'POST',
+            FAKE_URL + '?bulk-delete=true',
+            json={
+                'Number Deleted': 1,
+                'Response Status': '200 OK',
+                'Errors': [],
+            },
+            status_code=200,
+        )
+
+        ret = self.api.object_delete_all(container='qaz')
+
+        self.assertEqual([], ret)
+        bodies = sorted(
+            r.body
+            for r in self.requests_mock.request_history
+            if r.method == 'POST'
+        )
+        self.assertEqual([b'qaz/fred', b'qaz/wilma'], bodies)
+
+    def test_object_delete_all_bulk_errors(self):
+        self._register_listing()
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_INFO_URL,
+            json={'bulk_delete': {'max_deletes_per_request': 10000}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'POST',
+            FAKE_URL + '?bulk-delete=true',
+            json={
+                'Number Deleted': 1,
+                'Response Status': '400 Bad Request',
+                'Errors': [['/qaz/wilma', '409 Conflict']],
+            },
+            status_code=200,
+        )
+
+        ret = self.api.object_delete_all(container='qaz')
+
+        self.assertEqual([('wilma', '409 Conflict')], ret)
+        post = self.requests_mock.request_history[-1]
+        self.assertEqual(b'qaz/fred\nqaz/wilma', post.body)
+        self.assertEqual('text/plain', post.headers['Content-Type'])
+
+    def test_object_delete_all_no_bulk(self):
+        self._register_listing()
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_INFO_URL,
+            json={'swift': {'version': '2.30.0'}},
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/fred',
+            status_code=204,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/wilma',
+            status_code=404,
+        )
+
+        ret = self.api.object_delete_all(container='qaz')
+
+        self.assertEqual([], ret)
+        deleted = sorted(
+            r.path
+            for r in self.requests_mock.request_history
+            if r.method == 'DELETE'
+        )
+        self.assertEqual(
+            ['/v1/q12we34r/qaz/fred', '/v1/q12we34r/qaz/wilma'], deleted
+        )
+
+    def test_object_delete_all_no_info(self):
+        self._register_listing()
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_INFO_URL,
+            status_code=404,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/fred',
+            status_code=204,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/wilma',
+            status_code=409,
+        )
+
+        ret = self.api.object_delete_all(container='qaz')
+
+        self.assertEqual(['wilma'], [name for name, _ in ret])
+
     def test_object_list_no_options(self):
         self.requests_mock.register_uri(
             'GET',
@@ -313,6 +750,316 @@ class TestObject(TestObjectAPIv1):
     #         )
     #         self.assertEqual(resp, data)
 
+    def _register_ranged(self, content, headers=None):
+        self.ranges = []
+
+        def _get(request, context):
+            start, end = request.headers['Range'][6:].split('-')
+            self.ranges.append(int(start))
+            context.status_code = 206
+            return content[int(start) : int(end) + 1]
+
+        self.requests_mock.register_uri(
+            'HEAD',
+            FAKE_URL + '/qaz/big',
+            headers=dict(
+                {
+                    'Content-Length': str(len(content)),
+                    'Etag': f'"{hashlib.md5(content).hexdigest()}"',
+                },
+                **(headers or {}),
+            ),
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/big',
+            content=_get,
+        )
+
+    def test_object_save_ranged(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        self._register_ranged(b'0123456789')
+
+        self.api.object_save_ranged(
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+            concurrency=3,
+        )
+
+        with open(path, 'rb') as fh:
+            self.assertEqual(b'0123456789', fh.read())
+        self.assertEqual([0, 4, 8], sorted(self.ranges))
+        self.assertFalse(os.path.exists(path + '.part'))
+        self.assertFalse(os.path.exists(path + '.part.json'))
+        self.assertEqual(
+            hashlib.md5(b'0123456789').hexdigest(),
+            self.requests_mock.last_request.headers['If-Match'],
+        )
+
+    def test_object_save_ranged_resume(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        content = b'0123456789'
+        self._register_ranged(content)
+        with open(path + '.part', 'wb') as fh:
+            fh.write(b'0123\0\0\0\0\0\0')
+        with open(path + '.part.json', 'w') as fh:
+            json.dump(
+                {
+                    'etag': hashlib.md5(content).hexdigest(),
+                    'size': 10,
+                    'range_size': 4,
+                    'done': [0],
+                },
+                fh,
+            )
+
+        self.api.object_save_ranged(
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+        )
+
+        with open(path, 'rb') as fh:
+            self.assertEqual(content, fh.read())
+        self.assertEqual([4, 8], sorted(self.ranges))
+
+    def test_object_save_ranged_progress(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        content = b'0123456789'
+        self._register_ranged(content)
+        with open(path + '.part', 'wb') as fh:
+            fh.write(b'0123\0\0\0\0\0\0')
+        with open(path + '.part.json', 'w') as fh:
+            json.dump(
+                {
+                    'etag': hashlib.md5(content).hexdigest(),
+                    'size': 10,
+                    'range_size': 4,
+                    'done': [0],
+                },
+                fh,
+            )
+        progress = mock.Mock()
+
+        self.api.object_save_ranged(
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+            progress=progress,
+        )
+
+        progress.start.assert_called_once_with('big', 10)
+        tracker = progress.start.return_value
+        tracker.skip.assert_called_once_with(4)
+        self.assertEqual(
+            6, sum(c.args[0] for c in tracker.update.call_args_list)
+        )
+        tracker.finish.assert_called_once_with()
+
+    def test_object_save_ranged_checksum_mismatch(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        self._register_ranged(b'0123456789', headers={'Etag': '"bad"'})
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.api.object_save_ranged,
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+        )
+        self.assertEqual([], os.listdir(os.path.dirname(path)))
+
+    def test_object_save_ranged_slo(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        self._register_ranged(
+            b'0123456789',
+            headers={'Etag': '"manifest"', 'X-Static-Large-Object': 'True'},
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/big?multipart-manifest=get',
+            json=[
+                {'hash': hashlib.md5(b'012345').hexdigest(), 'bytes': 6},
+                {'hash': hashlib.md5(b'6789').hexdigest(), 'bytes': 4},
+            ],
+        )
+
+        self.api.object_save_ranged(
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+        )
+
+        with open(path, 'rb') as fh:
+            self.assertEqual(b'0123456789', fh.read())
+        # the ranges are not pinned to the ETag of the manifest
+        self.assertNotIn(
+            'If-Match', self.requests_mock.request_history[1].headers
+        )
+
+    def test_object_save_ranged_small(self):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'big')
+        self._register_ranged(b'0123')
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz/big',
+            content=b'0123',
+        )
+
+        self.api.object_save_ranged(
+            container='qaz',
+            object='big',
+            file=path,
+            range_size=4,
+        )
+
+        with open(path, 'rb') as fh:
+            self.assertEqual(b'0123', fh.read())
+        self.assertNotIn('Range', self.requests_mock.last_request.headers)
+
+    def test_object_list_iter_prefetch(self):
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?delimiter=%2F',
+            json=[{'subdir': 'dir/'}, LIST_OBJECT_RESP[0]],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?delimiter=%2F&marker=fred',
+            json=[LIST_OBJECT_RESP[1], {'subdir': 'zed/'}],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?delimiter=%2F&marker=zed%2F',
+            json=[],
+            status_code=200,
+        )
+
+        ret = list(
+            self.api.object_list_iter(
+                container='qaz', delimiter='/', prefetch=True
+            )
+        )
+
+        self.assertEqual(
+            [
+                {'subdir': 'dir/'},
+                LIST_OBJECT_RESP[0],
+                LIST_OBJECT_RESP[1],
+                {'subdir': 'zed/'},
+            ],
+            ret,
+        )
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def _register_sync(self):
+        directory = self.useFixture(fixtures.TempDir()).path
+        os.makedirs(os.path.join(directory, 'sub'))
+        for name, content in (('a', b'aaaa'), ('sub/b', b'bb')):
+            with open(os.path.join(directory, name), 'wb') as fh:
+                fh.write(content)
+
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz',
+            json=[
+                {
+                    'name': 'a',
+                    'bytes': 4,
+                    'hash': hashlib.md5(b'aaaa').hexdigest(),
+                },
+                {'name': 'orphan', 'bytes': 1, 'hash': 'x'},
+            ],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'GET',
+            FAKE_URL + '/qaz?marker=orphan',
+            json=[],
+            status_code=200,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(FAKE_URL + '/qaz/.*'),
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'DELETE',
+            FAKE_URL + '/qaz/orphan',
+            status_code=204,
+        )
+        index = cache.FileCache(os.path.join(directory, 'index.json'))
+        return directory, index
+
+    def test_object_sync(self):
+        directory, index = self._register_sync()
+        # write the index inside the directory to check it is not uploaded
+        index.set('gone', [0, 0, 'x'])
+        index.save()
+
+        ret = sorted(
+            self.api.object_sync(
+                directory=directory,
+                container='qaz',
+                index=index,
+                delete=True,
+            )
+        )
+
+        self.assertEqual(
+            [
+                ('a', None, None),
+                ('orphan', 'deleted', None),
+                ('sub/b', 'uploaded', None),
+            ],
+            ret,
+        )
+        self.assertEqual(
+            ['/v1/q12we34r/qaz/sub/b'],
+            [
+                r.path
+                for r in self.requests_mock.request_history
+                if r.method == 'PUT'
+            ],
+        )
+        self.assertEqual(hashlib.md5(b'bb').hexdigest(), index.get('sub/b')[2])
+        # the file recorded in the index no longer exists
+        self.assertNotIn('gone', index)
+
+    def test_object_sync_uses_index(self):
+        directory, index = self._register_sync()
+        stat = os.stat(os.path.join(directory, 'a'))
+        # a stale checksum is trusted while the size and mtime match
+        index.set('a', [stat.st_size, stat.st_mtime_ns, 'stale'])
+
+        ret = sorted(
+            self.api.object_sync(
+                directory=directory,
+                container='qaz',
+                prefix='',
+                index=index,
+            )
+        )
+
+        self.assertEqual(
+            [('a', 'uploaded', None), ('sub/b', 'uploaded', None)], ret
+        )
+        self.assertFalse(
+            any(
+                r.method == 'DELETE'
+                for r in self.requests_mock.request_history
+            )
+        )
+
     def test_object_show(self):
         headers = {
             'content-type': 'text/alpha',
@@ -0,0 +1,81 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+import time
+from unittest import mock
+
+import fixtures
+
+from openstackclient.common import cache
+from openstackclient.tests.unit import utils
+
+
+class TestFileCache(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'sub', 'cache.json'
+        )
+
+    def test_missing_file(self):
+        file_cache = cache.FileCache(self.path)
+        self.assertEqual(0, len(file_cache))
+        self.assertIsNone(file_cache.get('foo'))
+
+    def test_round_trip(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.set('foo', 'bar')
+        file_cache.update({'baz': {'qux': 1}})
+        file_cache.save()
+
+        file_cache = cache.FileCache(self.path)
+        self.assertEqual('bar', file_cache.get('foo'))
+        self.assertEqual({'qux': 1}, file_cache.get('baz'))
+        self.assertIn('foo', file_cache)
+
+    def test_expired_entries(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.set('foo', 'bar')
+        file_cache.save()
+
+        with mock.patch.object(time, 'time', return_value=time.time() + 60):
+            file_cache = cache.FileCache(self.path, max_age=30)
+
+        self.assertNotIn('foo', file_cache)
+
+    def test_corrupt_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as fh:
+            fh.write('{not json')
+
+        file_cache = cache.FileCache(self.path)
+        self.assertEqual(0, len(file_cache))
+
+    def test_save_unchanged(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.save()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_retain(self):
+        file_cache = cache.FileCache(self.path)
+        file_cache.update({'foo': 1, 'bar': 2})
+        file_cache.save()
+
+        file_cache = cache.FileCache(self.path)
+        file_cache.retain(['foo', 'baz'])
+        file_cache.save()
+
+        file_cache = cache.FileCache(self.path)
+        self.assertIn('foo', file_cache)
+        self.assertNotIn('bar', file_cache)
@@ -12,7 +12,9 @@
 #
 
 import io
+import json
 import sys
+from unittest import mock
 
 from openstackclient.common import progressbar
 from openstackclient.tests.unit import utils
@@ -30,7 +32,10 @@ class TestProgressBarWrapper(utils.TestCase):
             chunk = file_obj.read(chunksize)
             while chunk:
                 chunk = file_obj.read(chunksize)
-            self.assertEqual('[%s>] 100%%\n' % ('=' * 29), output.getvalue())
+            self.assertRegex(
+                output.getvalue(),
+                r'^\[%s>\] 100%% [\d.]+ [KMGT]?i?B/s *\n$' % ('=' * 29),
+            )
         finally:
             sys.stdout = saved_stdout
 
@@ -38,17 +43,132 @@ class TestProgressBarWrapper(utils.TestCase):
         size = 98304
         file_obj = io.StringIO('X' * size)
         saved_stdout = sys.stdout
+        saved_stderr = sys.stderr
         try:
             sys.stdout = output = FakeNoTTYStdout()
+            sys.stderr = events = io.StringIO()
             file_obj = progressbar.VerboseFileWrapper(file_obj, size)
             chunksize = 1024
             chunk = file_obj.read(chunksize)
             while chunk:
                 chunk = file_obj.read(chunksize)
-            # If stdout is not a tty progress bar should do nothing.
+            # If stdout is not a tty no progress bar is drawn on it, and
+            # events are written to stderr instead.
             self.assertEqual('', output.getvalue())
+            lines = [
+                json.loads(line) for line in events.getvalue().splitlines()
+            ]
+            self.assertEqual('start', lines[0]['event'])
+            self.assertEqual('finish', lines[-1]['event'])
+            self.assertEqual(size, lines[-1]['bytes'])
         finally:
             sys.stdout = saved_stdout
+            sys.stderr = saved_stderr
+
+
+class TestProgressReporter(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.now = 0.0
+
+    def _clock(self):
+        return self.now
+
+    def test_redraw_throttled(self):
+        output = mock.Mock(wraps=FakeTTYStdout())
+        output.isatty.return_value = True
+        reporter = progressbar.ProgressReporter(
+            stream=output, interval=1.0, clock=self._clock
+        )
+        transfer = reporter.start('image', 4 * 1024**2)
+
+        for _count in range(100):
+            transfer.update(1024)
+        self.assertEqual(1, output.write.call_count)
+
+        self.now = 1.0
+        transfer.update(1024**2 - 100 * 1024)
+        self.assertEqual(2, output.write.call_count)
+        self.assertIn(
+            '25% 1.0 MiB/s ETA 0:00:03', output.write.call_args.args[0]
+        )
+
+    def test_multiple_transfers(self):
+        output = FakeTTYStdout()
+        with progressbar.ProgressReporter(
+            stream=output, clock=self._clock
+        ) as reporter:
+            first = reporter.start('first', 1024)
+            second = reporter.start('second', 1024)
+            self.now = 2.0
+            first.update(1024)
+            first.finish()
+            second.update(512)
+
+        self.assertEqual(
+            '[{:<30}] 75% (1/2) 768.0 B/s ETA 0:00:00\n'.format(
+                '=' * 22 + '>'
+            ),
+            output.getvalue(),
+        )
+
+    def test_resumed_transfer(self):
+        output = FakeTTYStdout()
+        reporter = progressbar.ProgressReporter(
+            stream=output, clock=self._clock
+        )
+        transfer = reporter.start('object', 4096)
+        transfer.skip(2048)
+        self.now = 1.0
+        transfer.update(1024)
+
+        # only the bytes transferred in this run count towards the rate
+        self.assertIn('75% 1.0 KiB/s ETA 0:00:01', output.getvalue())
+
+    def test_events(self):
+        events = io.StringIO()
+        reporter = progressbar.ProgressReporter(
+            stream=FakeNoTTYStdout(),
+            events=events,
+            interval=5.0,
+            clock=self._clock,
+        )
+        transfer = reporter.start('image', 4096)
+        self.now = 1.0
+        transfer.update(1024)
+        self.now = 6.0
+        transfer.update(1024)
+        transfer.finish()
+
+        self.assertEqual(
+            [
+                {
+                    'event': 'start',
+                    'name': 'image',
+                    'bytes': 0,
+                    'total': 4096,
+                    'rate': 0,
+                    'eta': None,
+                },
+                {
+                    'event': 'progress',
+                    'name': 'image',
+                    'bytes': 2048,
+                    'total': 4096,
+                    'rate': 341,
+                    'eta': 6,
+                },
+                {
+                    'event': 'finish',
+                    'name': 'image',
+                    'bytes': 2048,
+                    'total': 4096,
+                    'rate': 341,
+                    'eta': 6,
+                },
+            ],
+            [json.loads(line) for line in events.getvalue().splitlines()],
+        )
 
 
 class FakeTTYStdout(io.StringIO):
@@ -10,11 +10,19 @@
 #   License for the specific language governing permissions and limitations
 #   under the License.
 
+import io
+import json
+import os
+import time
 from unittest import mock
 
+import fixtures
+from openstack.compute.v2 import server as _server
 from openstack.identity.v3 import project as _project
 from openstack.test import fakes as sdk_fakes
+from osc_lib import exceptions
 
+from openstackclient.common import cleanup_plan
 from openstackclient.common import project_cleanup
 from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
 from openstackclient.tests.unit import utils as test_utils
@@ -31,6 +39,19 @@ class TestProjectCleanup(
         self.identity_sdk_client.find_project.return_value = self.project
         self.app.client_manager.sdk_connection.connect_as_project.return_value = self.app.client_manager.sdk_connection
 
+        self.server = sdk_fakes.generate_fake_resource(_server.Server)
+        self.compute_sdk_client = (
+            self.app.client_manager.sdk_connection.compute
+        )
+
+        def _project_cleanup(dry_run, status_queue, **kwargs):
+            if dry_run:
+                status_queue.put(self.server)
+
+        self.app.client_manager.sdk_connection.project_cleanup.side_effect = (
+            _project_cleanup
+        )
+
     def test_project_no_options(self):
         arglist = []
         verifylist = []
@@ -55,7 +76,7 @@ class TestProjectCleanup(
         verifylist = [
             ('dry_run', False),
             ('auth_project', False),
-            ('project', self.project.id),
+            ('project', [self.project.id]),
             ('created_before', '2200-01-01'),
             ('updated_before', '2200-01-02'),
         ]
@@ -70,22 +91,14 @@ class TestProjectCleanup(
         )
         filters = {'created_at': '2200-01-01', 'updated_at': '2200-01-02'}
 
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters=filters,
-                skip_resources=None,
-            ),
-            mock.call(
-                dry_run=False,
-                status_queue=mock.ANY,
-                filters=filters,
-                skip_resources=None,
-            ),
-        ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters=filters,
+            skip_resources=None,
+        )
+        self.compute_sdk_client.delete_server.assert_called_once_with(
+            self.server
         )
 
         self.assertIsNone(result)
@@ -99,7 +112,7 @@ class TestProjectCleanup(
         verifylist = [
             ('dry_run', False),
             ('auth_project', False),
-            ('project', self.project.id),
+            ('project', [self.project.id]),
             ('auto_approve', True),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -110,22 +123,14 @@ class TestProjectCleanup(
         self.app.client_manager.sdk_connection.connect_as_project.assert_called_with(
             self.project
         )
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-            mock.call(
-                dry_run=False,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-        ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters={},
+            skip_resources=None,
+        )
+        self.compute_sdk_client.delete_server.assert_called_once_with(
+            self.server
         )
 
         self.assertIsNone(result)
@@ -138,7 +143,7 @@ class TestProjectCleanup(
         verifylist = [
             ('dry_run', False),
             ('auth_project', False),
-            ('project', self.project.id),
+            ('project', [self.project.id]),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         result = None
@@ -149,22 +154,14 @@ class TestProjectCleanup(
         self.app.client_manager.sdk_connection.connect_as_project.assert_called_with(
             self.project
         )
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-            mock.call(
-                dry_run=False,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-        ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters={},
+            skip_resources=None,
+        )
+        self.compute_sdk_client.delete_server.assert_called_once_with(
+            self.server
         )
 
         self.assertIsNone(result)
@@ -177,28 +174,24 @@ class TestProjectCleanup(
         verifylist = [
             ('dry_run', False),
             ('auth_project', False),
-            ('project', self.project.id),
+            ('project', [self.project.id]),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         result = None
 
-        with mock.patch('getpass.getpass', return_value='y'):
+        with mock.patch('getpass.getpass', return_value='n'):
             result = self.cmd.take_action(parsed_args)
 
         self.app.client_manager.sdk_connection.connect_as_project.assert_called_with(
             self.project
         )
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-        ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters={},
+            skip_resources=None,
         )
+        self.compute_sdk_client.delete_server.assert_not_called()
 
         self.assertIsNone(result)
 
@@ -211,7 +204,7 @@ class TestProjectCleanup(
         verifylist = [
             ('dry_run', True),
             ('auth_project', False),
-            ('project', self.project.id),
+            ('project', [self.project.id]),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
         result = None
@@ -227,6 +220,7 @@ class TestProjectCleanup(
             filters={},
             skip_resources=None,
         )
+        self.compute_sdk_client.delete_server.assert_not_called()
 
         self.assertIsNone(result)
 
@@ -248,22 +242,14 @@ class TestProjectCleanup(
             result = self.cmd.take_action(parsed_args)
 
         self.app.client_manager.sdk_connection.connect_as_project.assert_not_called()
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-            mock.call(
-                dry_run=False,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=None,
-            ),
-        ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters={},
+            skip_resources=None,
+        )
+        self.compute_sdk_client.delete_server.assert_called_once_with(
+            self.server
         )
 
         self.assertIsNone(result)
@@ -287,22 +273,374 @@ class TestProjectCleanup(
             self.project
         )
 
-        calls = [
-            mock.call(
-                dry_run=True,
-                status_queue=mock.ANY,
-                filters={},
-                skip_resources=[skip_resource],
+        self.app.client_manager.sdk_connection.project_cleanup.assert_called_once_with(
+            dry_run=True,
+            status_queue=mock.ANY,
+            filters={},
+            skip_resources=[skip_resource],
+        )
+        self.compute_sdk_client.delete_server.assert_called_once_with(
+            self.server
+        )
+
+        self.assertIsNone(result)
+
+    def test_project_cleanup_delete_failure(self):
+        self.compute_sdk_client.delete_server.side_effect = Exception('boom')
+        arglist = [
+            '--project',
+            self.project.id,
+            '--auto-approve',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.assertEqual('1 of 1 resources failed to delete', str(exc))
+
+    def test_project_cleanup_progress(self):
+        self.app.stderr = io.StringIO()
+        arglist = [
+            '--project',
+            self.project.id,
+            '--auto-approve',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.cmd.take_action(parsed_args)
+
+        self.assertRegex(
+            self.app.stderr.getvalue(),
+            rf'^\[1/1\] Deleted Server {self.server.id} \([0-9.]+/s\)\n$',
+        )
+
+    def test_project_cleanup_plan_out(self):
+        plan_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'plan.json'
+        )
+        arglist = [
+            '--dry-run',
+            '--project',
+            self.project.id,
+            '--plan-out',
+            plan_file,
+        ]
+        verifylist = [('plan_out', plan_file)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        with open(plan_file) as fh:
+            plan = json.load(fh)
+        self.assertEqual(self.project.id, plan['project_id'])
+        self.assertEqual(
+            ['openstack.compute.v2.server.Server'],
+            [r['resource'] for r in plan['resources']],
+        )
+        self.assertEqual(self.server.id, plan['resources'][0]['attrs']['id'])
+        self.compute_sdk_client.delete_server.assert_not_called()
+
+    def _write_plan(self, project_id, created_at):
+        plan_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'plan.json'
+        )
+        plan = cleanup_plan.CleanupPlan(
+            project_id, [self.server], created_at=created_at
+        )
+        plan.save(plan_file)
+        return plan_file
+
+    def test_project_cleanup_plan_in(self):
+        plan_file = self._write_plan(self.project.id, time.time())
+        arglist = [
+            '--project',
+            self.project.id,
+            '--plan-in',
+            plan_file,
+            '--auto-approve',
+        ]
+        verifylist = [('plan_in', plan_file)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.app.client_manager.sdk_connection.project_cleanup.assert_not_called()
+        self.compute_sdk_client.delete_server.assert_called_once_with(mock.ANY)
+        deleted = self.compute_sdk_client.delete_server.call_args.args[0]
+        self.assertIsInstance(deleted, _server.Server)
+        self.assertEqual(self.server.id, deleted.id)
+
+    def test_project_cleanup_plan_in_stale(self):
+        plan_file = self._write_plan(self.project.id, time.time() - 7200)
+        arglist = [
+            '--project',
+            self.project.id,
+            '--plan-in',
+            plan_file,
+            '--plan-max-age',
+            '3600',
+            '--auto-approve',
+        ]
+        verifylist = [('plan_in', plan_file), ('plan_max_age', 3600)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.compute_sdk_client.delete_server.assert_not_called()
+
+    def test_project_cleanup_plan_in_other_project(self):
+        plan_file = self._write_plan('other-project', time.time())
+        arglist = [
+            '--project',
+            self.project.id,
+            '--plan-in',
+            plan_file,
+            '--auto-approve',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.compute_sdk_client.delete_server.assert_not_called()
+
+    def test_project_cleanup_journal_resume(self):
+        journal_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'journal'
+        )
+        self.compute_sdk_client.delete_server.side_effect = Exception('boom')
+        arglist = [
+            '--project',
+            self.project.id,
+            '--journal',
+            journal_file,
+            '--auto-approve',
+        ]
+        verifylist = [('journal', journal_file)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        sdk_connection = self.app.client_manager.sdk_connection
+        sdk_connection.project_cleanup.reset_mock()
+        self.compute_sdk_client.delete_server.reset_mock(side_effect=True)
+        self.useFixture(
+            fixtures.MockPatchObject(cleanup_plan, 'RETRY_DELAY', 0)
+        )
+
+        self.cmd.take_action(parsed_args)
+
+        # the resources are taken from the journal rather than searched for
+        sdk_connection.project_cleanup.assert_not_called()
+        self.compute_sdk_client.delete_server.assert_called_once_with(mock.ANY)
+        deleted = self.compute_sdk_client.delete_server.call_args.args[0]
+        self.assertEqual(self.server.id, deleted.id)
+        journal = cleanup_plan.CleanupJournal(journal_file)
+        self.assertEqual(
+            'deleted', journal.get_state(self.project.id, self.server)
+        )
+
+    def test_project_cleanup_journal_stale(self):
+        journal_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'journal'
+        )
+        journal = cleanup_plan.CleanupJournal(journal_file)
+        journal.record_plan(
+            cleanup_plan.CleanupPlan(
+                self.project.id, [self.server], time.time() - 7200
+            )
+        )
+        journal.close()
+        arglist = [
+            '--project',
+            self.project.id,
+            '--journal',
+            journal_file,
+            '--plan-max-age',
+            '3600',
+            '--auto-approve',
+        ]
+        verifylist = [('journal', journal_file), ('plan_max_age', 3600)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        # the journaled plan is too old so the resources are searched again
+        sdk_connection = self.app.client_manager.sdk_connection
+        sdk_connection.project_cleanup.assert_called_once()
+        self.compute_sdk_client.delete_server.assert_called_once_with(mock.ANY)
+        journal = cleanup_plan.CleanupJournal(journal_file)
+        self.assertLess(journal.plans[self.project.id].age, 3600)
+
+
+class TestProjectCleanupMultiple(
+    identity_fakes.FakeClientMixin, test_utils.TestCommand
+):
+    def setUp(self):
+        super().setUp()
+        self.cmd = project_cleanup.ProjectCleanup(self.app, None)
+
+        self.projects = [
+            sdk_fakes.generate_fake_resource(_project.Project)
+            for _ in range(2)
+        ]
+        self.servers = {}
+        self.connections = {}
+        for project in self.projects:
+            server = sdk_fakes.generate_fake_resource(_server.Server)
+            self.servers[project.id] = server
+            self.connections[project.id] = self._make_connection(server)
+
+        projects_by_id = {p.id: p for p in self.projects}
+        self.identity_sdk_client.find_project.side_effect = (
+            lambda name_or_id, ignore_missing: projects_by_id[name_or_id]
+        )
+        self.identity_sdk_client.projects.return_value = self.projects
+        self.app.client_manager.sdk_connection.connect_as_project.side_effect = (
+            lambda project: self.connections[project.id]
+        )
+
+    def _make_connection(self, server):
+        connection = mock.Mock()
+
+        def _project_cleanup(dry_run, status_queue, **kwargs):
+            status_queue.put(server)
+
+        connection.project_cleanup.side_effect = _project_cleanup
+        return connection
+
+    def _assert_deleted(self):
+        for project in self.projects:
+            compute = self.connections[project.id].compute
+            compute.delete_server.assert_called_once_with(
+                self.servers[project.id]
+            )
+
+    def test_project_cleanup_multiple_projects(self):
+        arglist = [
+            '--project',
+            self.projects[0].id,
+            '--project',
+            self.projects[1].id,
+            '--project',
+            self.projects[0].id,
+            '--auto-approve',
+        ]
+        verifylist = [
+            (
+                'project',
+                [
+                    self.projects[0].id,
+                    self.projects[1].id,
+                    self.projects[0].id,
+                ],
             ),
-            mock.call(
-                dry_run=False,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self._assert_deleted()
+        sdk_connection = self.app.client_manager.sdk_connection
+        for project in self.projects:
+            # the HTTP connection pool is shared between projects
+            self.assertIs(
+                sdk_connection.session.session,
+                self.connections[project.id].session.session,
+            )
+            self.connections[
+                project.id
+            ].project_cleanup.assert_called_once_with(
+                dry_run=True,
                 status_queue=mock.ANY,
                 filters={},
-                skip_resources=[skip_resource],
-            ),
+                skip_resources=None,
+            )
+        output = self.app.stdout.make_string()
+        for project in self.projects:
+            self.assertIn(self.servers[project.id].id, output)
+            self.assertRegex(output, rf'\| {project.id} +\| +1 \| +0 \|')
+
+    def test_project_cleanup_projects_tagged(self):
+        arglist = [
+            '--projects-tagged',
+            'ci',
+            '--projects-tagged',
+            'nightly',
+            '--auto-approve',
         ]
-        self.app.client_manager.sdk_connection.project_cleanup.assert_has_calls(
-            calls
+        verifylist = [('projects_tagged', ['ci', 'nightly'])]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.identity_sdk_client.projects.assert_called_once_with(
+            tags='ci,nightly'
         )
+        self._assert_deleted()
 
-        self.assertIsNone(result)
+    def test_project_cleanup_projects_disabled(self):
+        arglist = [
+            '--projects-disabled',
+            '--dry-run',
+        ]
+        verifylist = [('projects_disabled', True), ('dry_run', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.identity_sdk_client.projects.assert_called_once_with(
+            is_enabled=False
+        )
+        for project in self.projects:
+            compute = self.connections[project.id].compute
+            compute.delete_server.assert_not_called()
+
+    def test_project_cleanup_no_projects(self):
+        self.identity_sdk_client.projects.return_value = []
+        arglist = [
+            '--projects-disabled',
+            '--auto-approve',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertIsNone(self.cmd.take_action(parsed_args))
+
+    def test_project_cleanup_discovery_failure(self):
+        self.connections[
+            self.projects[0].id
+        ].project_cleanup.side_effect = Exception('boom')
+        arglist = [
+            '--projects-disabled',
+            '--auto-approve',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.assertEqual(
+            'Failed to search resources of 1 project(s)', str(exc)
+        )
+        compute = self.connections[self.projects[1].id].compute
+        compute.delete_server.assert_called_once_with(
+            self.servers[self.projects[1].id]
+        )
+
+    def test_project_cleanup_plan_multiple_projects(self):
+        arglist = [
+            '--projects-disabled',
+            '--plan-out',
+            'plan.json',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        for project in self.projects:
+            self.connections[project.id].project_cleanup.assert_not_called()
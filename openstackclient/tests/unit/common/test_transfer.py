@@ -0,0 +1,356 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import hashlib
+import io
+import os
+from unittest import mock
+
+import fixtures
+from osc_lib import exceptions
+
+from openstackclient.common import transfer
+from openstackclient.tests.unit import utils
+
+
+class TestCopy(utils.TestCase):
+    def test_copy(self):
+        data = bytes(range(256)) * 4096
+        source = mock.Mock(wraps=io.BytesIO(data))
+        output = io.BytesIO()
+        md5 = hashlib.md5()
+        sha = hashlib.sha256()
+
+        size = transfer.copy(source, output.write, hashers=[md5, sha])
+
+        self.assertEqual(len(data), size)
+        self.assertEqual(data, output.getvalue())
+        self.assertEqual(hashlib.md5(data).hexdigest(), md5.hexdigest())
+        self.assertEqual(hashlib.sha256(data).hexdigest(), sha.hexdigest())
+        # reads grow while they fill the buffer
+        sizes = [len(c.args[0]) for c in source.readinto.call_args_list]
+        self.assertEqual(transfer.MIN_BUFFER_SIZE, sizes[0])
+        self.assertEqual(sorted(sizes), sizes)
+        self.assertGreater(sizes[-1], sizes[0])
+
+    def test_copy_buffer_size(self):
+        data = b'x' * 10000
+        source = mock.Mock(wraps=io.BytesIO(data))
+        output = io.BytesIO()
+
+        transfer.copy(source, output.write, buffer_size=1024)
+
+        self.assertEqual(data, output.getvalue())
+        self.assertEqual(
+            {1024},
+            {len(c.args[0]) for c in source.readinto.call_args_list},
+        )
+
+    def test_copy_read_error(self):
+        source = mock.Mock()
+        source.readinto.side_effect = OSError('connection reset')
+
+        self.assertRaises(OSError, transfer.copy, source, io.BytesIO().write)
+
+    def test_copy_write_error(self):
+        source = io.BytesIO(b'x' * transfer.MAX_BUFFER_SIZE * 2)
+        write = mock.Mock(side_effect=OSError('disk full'))
+
+        self.assertRaises(OSError, transfer.copy, source, write)
+
+
+class TestSparseWriter(utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'sparse'
+        )
+
+    def _write(self, *chunks):
+        with open(self.path, 'wb') as fh:
+            writer = transfer.SparseWriter(fh, block_size=8)
+            with mock.patch.object(fh, 'write', wraps=fh.write) as write:
+                for chunk in chunks:
+                    writer.write(memoryview(chunk))
+                writer.finish()
+        with open(self.path, 'rb') as fh:
+            return fh.read(), [bytes(c.args[0]) for c in write.call_args_list]
+
+    def test_write(self):
+        data, writes = self._write(
+            b'\0' * 16 + b'abcdefgh' + b'\0' * 8 + b'ij' + b'\0' * 6
+        )
+
+        self.assertEqual(
+            b'\0' * 16 + b'abcdefgh' + b'\0' * 8 + b'ij' + b'\0' * 6, data
+        )
+        # the zero blocks are skipped and the data ones written
+        self.assertEqual([b'abcdefgh', b'ij\0\0\0\0\0\0'], writes)
+
+    def test_write_unaligned(self):
+        data, writes = self._write(b'abc', b'\0' * 13, b'de', b'\0' * 10)
+
+        self.assertEqual(b'abc' + b'\0' * 13 + b'de' + b'\0' * 10, data)
+        # zeros only filling part of a block are skipped as well
+        self.assertEqual([b'abc', b'de'], writes)
+
+    def test_write_trailing_hole(self):
+        data, writes = self._write(b'abcdefgh', b'\0' * 24)
+
+        self.assertEqual(b'abcdefgh' + b'\0' * 24, data)
+        self.assertEqual([b'abcdefgh'], writes)
+
+
+class TestRangedDownload(utils.TestCase):
+    data = bytes(range(256)) * 40
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'file'
+        )
+        self.fetched = []
+
+    def _fetch(self, start, end):
+        self.fetched.append(start)
+        return [self.data[start : end + 1]]
+
+    def test_run(self):
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'abc'}
+        )
+
+        download.run(self._fetch, 2)
+        download.commit()
+
+        self.assertEqual([0, 4096, 8192], sorted(self.fetched))
+        with open(self.path, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+        self.assertFalse(os.path.exists(download.part_path))
+        self.assertFalse(os.path.exists(download.state_path))
+
+    def test_run_resume(self):
+        def _fail(start, end):
+            if start == 4096:
+                raise OSError('connection reset')
+            return self._fetch(start, end)
+
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'abc'}
+        )
+        self.assertRaises(OSError, download.run, _fail, 1)
+        self.assertEqual([0, 8192], self.fetched)
+
+        self.fetched = []
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'abc'}
+        )
+        download.run(self._fetch, 1)
+        download.commit()
+
+        self.assertEqual([4096], self.fetched)
+        with open(self.path, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+
+    def test_run_stale_progress(self):
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'old'}
+        )
+        download.run(self._fetch, 1)
+
+        self.fetched = []
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'new'}
+        )
+        download.run(self._fetch, 1)
+
+        self.assertEqual([0, 4096, 8192], self.fetched)
+
+    def test_run_short_read(self):
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'abc'}
+        )
+
+        self.assertRaises(
+            exceptions.CommandError,
+            download.run,
+            lambda start, end: [b'short'],
+            1,
+        )
+
+    def test_discard(self):
+        download = transfer.RangedDownload(
+            self.path, len(self.data), 4096, {'etag': 'abc'}
+        )
+        download.run(self._fetch, 1)
+
+        download.discard()
+
+        self.assertEqual([], os.listdir(os.path.dirname(self.path)))
+
+
+class TestReadAhead(utils.TestCase):
+    def test_read_ahead(self):
+        data = bytes(range(256)) * 100
+        sha = hashlib.sha256()
+
+        chunks = [
+            chunk.tobytes()
+            for chunk in transfer.read_ahead(
+                io.BytesIO(data), [sha], buffer_size=1000, count=2
+            )
+        ]
+
+        self.assertEqual(data, b''.join(chunks))
+        self.assertEqual(26, len(chunks))
+        self.assertEqual(hashlib.sha256(data).hexdigest(), sha.hexdigest())
+
+    def test_read_ahead_error(self):
+        source = mock.Mock()
+        source.readinto.side_effect = OSError('broken pipe')
+
+        self.assertRaises(OSError, list, transfer.read_ahead(source))
+
+    def test_read_ahead_stop(self):
+        source = io.BytesIO(b'x' * 10000)
+        chunks = transfer.read_ahead(source, buffer_size=1000, count=2)
+
+        next(chunks)
+        chunks.close()
+
+        # the reader stops with the buffers it had already filled
+        self.assertLess(source.tell(), 10000)
+
+
+class TestStreamSource(utils.TestCase):
+    data = bytes(range(256)) * 100
+
+    def test_iter(self):
+        source = transfer.StreamSource(
+            io.BytesIO(self.data), len(self.data), ('sha512',), 1000
+        )
+
+        self.assertEqual(len(self.data), len(source))
+        self.assertEqual(
+            self.data, b''.join(chunk.tobytes() for chunk in source)
+        )
+        self.assertEqual(
+            hashlib.sha512(self.data).hexdigest(),
+            source.hexdigests()['sha512'],
+        )
+
+    def test_iter_unsized(self):
+        source = transfer.StreamSource(io.BytesIO(self.data))
+
+        self.assertTrue(source)
+        self.assertRaises(TypeError, len, source)
+        self.assertEqual(
+            self.data, b''.join(chunk.tobytes() for chunk in source)
+        )
+
+    def test_iter_again(self):
+        source = transfer.StreamSource(io.BytesIO(self.data))
+        list(source)
+
+        self.assertRaises(exceptions.CommandError, list, source)
+
+    def test_iter_too_large(self):
+        source = transfer.StreamSource(
+            io.BytesIO(self.data), len(self.data) - 1, buffer_size=1000
+        )
+
+        exc = self.assertRaises(exceptions.CommandError, list, source)
+        self.assertIn('larger', str(exc))
+
+    def test_iter_too_small(self):
+        source = transfer.StreamSource(
+            io.BytesIO(self.data), len(self.data) + 1
+        )
+
+        exc = self.assertRaises(exceptions.CommandError, list, source)
+        self.assertIn('short', str(exc))
+
+
+class TestUploadSource(utils.TestCase):
+    data = bytes(range(256)) * 1000
+
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'file'
+        )
+        with open(self.path, 'wb') as fh:
+            fh.write(self.data)
+
+    def test_iter_mapped(self):
+        progress = mock.Mock()
+        with transfer.UploadSource(
+            self.path, ('sha512',), progress, chunk_size=4096
+        ) as source:
+            self.assertEqual(len(self.data), len(source))
+            sent = []
+            for chunk in source:
+                sent.append(chunk.tobytes())
+
+        self.assertEqual(self.data, b''.join(sent))
+        self.assertEqual(-(-len(self.data) // 4096), len(sent))
+        self.assertEqual(
+            hashlib.sha512(self.data).hexdigest(),
+            source.hexdigests()['sha512'],
+        )
+        self.assertEqual(
+            len(self.data),
+            sum(c.args[0] for c in progress.update.call_args_list),
+        )
+        progress.finish.assert_called_once_with()
+
+    def test_iter_read(self):
+        with mock.patch.object(
+            transfer.mmap, 'mmap', side_effect=OSError('not mappable')
+        ):
+            with transfer.UploadSource(
+                self.path, ('sha512',), chunk_size=4096
+            ) as source:
+                sent = [chunk.tobytes() for chunk in source]
+
+        self.assertEqual(self.data, b''.join(sent))
+        self.assertEqual(
+            hashlib.sha512(self.data).hexdigest(),
+            source.hexdigests()['sha512'],
+        )
+
+    def test_iter_again(self):
+        with transfer.UploadSource(
+            self.path, ('md5',), chunk_size=4096
+        ) as source:
+            # a retried request starts the hash again
+            next(iter(source))
+            sent = b''.join(chunk.tobytes() for chunk in source)
+
+        self.assertEqual(self.data, sent)
+        self.assertEqual(
+            hashlib.md5(self.data).hexdigest(), source.hexdigests()['md5']
+        )
+
+    def test_empty_file(self):
+        with open(self.path, 'wb'):
+            pass
+
+        with transfer.UploadSource(self.path, ('sha512',)) as source:
+            self.assertTrue(source)
+            self.assertEqual(0, len(source))
+            self.assertEqual([], list(source))
+
+        self.assertEqual(
+            hashlib.sha512().hexdigest(), source.hexdigests()['sha512']
+        )
@@ -14,6 +14,7 @@
 #
 from unittest import mock
 
+import fixtures
 from openstack.compute.v2 import flavor as _flavor
 from openstack import exceptions as sdk_exceptions
 from openstack.identity.v3 import project as _project
@@ -727,6 +728,76 @@ class TestFlavorList(compute_fakes.TestCompute):
         self.assertEqual(self.columns_long, columns)
         self.assertCountEqual(self.data_long, tuple(data))
 
+    def test_flavor_list_long_embedded_extra_specs(self):
+        self.set_compute_api_version('2.61')
+
+        # the server sent an empty set of extra specs; don't fetch them again
+        flavor_ = _flavor.Flavor(id='empty', extra_specs={})
+        self.compute_client.flavors.side_effect = [[flavor_], []]
+
+        parsed_args = self.check_parser(self.cmd, ['--long'], [])
+        self.cmd.take_action(parsed_args)
+
+        self.compute_client.fetch_flavor_extra_specs.assert_not_called()
+
+    def test_flavor_list_long_withheld_extra_specs(self):
+        self.set_compute_api_version('2.61')
+
+        # policy stopped the server sending the extra specs of this flavor
+        flavor_ = _flavor.Flavor.existing(id='withheld')
+        self.compute_client.flavors.side_effect = [[flavor_], []]
+
+        parsed_args = self.check_parser(self.cmd, ['--long'], [])
+        self.cmd.take_action(parsed_args)
+
+        self.compute_client.fetch_flavor_extra_specs.assert_called_once_with(
+            flavor_
+        )
+
+    def test_flavor_list_long_concurrent_extra_specs(self):
+        flavors = [_flavor.Flavor(id=f'flavor-{i}') for i in range(20)]
+        self.compute_client.flavors.side_effect = [flavors, []]
+
+        parsed_args = self.check_parser(self.cmd, ['--long'], [])
+        self.cmd.take_action(parsed_args)
+
+        self.compute_client.fetch_flavor_extra_specs.assert_has_calls(
+            [mock.call(f) for f in flavors], any_order=True
+        )
+        self.assertEqual(
+            20, self.compute_client.fetch_flavor_extra_specs.call_count
+        )
+
+    def test_flavor_list_long_cache_properties(self):
+        self.app.client_manager.cache_path = self.useFixture(
+            fixtures.TempDir()
+        ).path
+
+        def _fetch_extra_specs(f):
+            f.extra_specs = {'foo': 'bar'}
+            return f
+
+        self.compute_client.fetch_flavor_extra_specs.side_effect = (
+            _fetch_extra_specs
+        )
+
+        arglist = ['--long', '--cache-properties']
+        verifylist = [('long', True), ('cache_properties', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        for _ in range(2):
+            flavor_ = _flavor.Flavor(id='flavor')
+            self.compute_client.flavors.side_effect = [[flavor_], []]
+
+            _, data = self.cmd.take_action(parsed_args)
+
+            self.assertEqual(
+                format_columns.DictColumn({'foo': 'bar'}), next(iter(data))[-1]
+            )
+
+        # the second listing is served from the cache
+        self.compute_client.fetch_flavor_extra_specs.assert_called_once()
+
     def test_flavor_list_min_disk_min_ram(self):
         arglist = [
             '--min-disk',
@@ -19,6 +19,7 @@ import tempfile
 from unittest import mock
 import uuid
 
+import fixtures
 import iso8601
 from openstack.block_storage.v3 import snapshot as _snapshot
 from openstack.block_storage.v3 import volume as _volume
@@ -3728,6 +3729,127 @@ class TestServerCreate(TestServer):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist(), data)
 
+    def test_server_create_image_property_server_filter(self):
+        image = image_fakes.create_one_image(
+            {'name': 'cirros', 'hypervisor_type': 'qemu'}
+        )
+        self.image_client.images.return_value = [image]
+
+        arglist = [
+            '--image-property',
+            'name=cirros',
+            '--image-property',
+            'hypervisor_type=qemu',
+            '--flavor',
+            self.flavor.id,
+            self.server.name,
+        ]
+        verifylist = [
+            (
+                'image_properties',
+                {'name': 'cirros', 'hypervisor_type': 'qemu'},
+            ),
+            ('flavor', self.flavor.id),
+            ('server_name', self.server.name),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        # only the name can be matched by the image service
+        self.image_client.images.assert_called_once_with(name='cirros')
+        self.assertEqual(
+            image.id,
+            self.compute_client.create_server.call_args.kwargs['image_id'],
+        )
+
+    def test_server_create_image_property_cached(self):
+        self.app.client_manager.cache_path = self.useFixture(
+            fixtures.TempDir()
+        ).path
+        image = image_fakes.create_one_image(
+            {'visibility': 'public', 'hypervisor_type': 'qemu'}
+        )
+        other_image = image_fakes.create_one_image(
+            {'visibility': 'public', 'hypervisor_type': 'xen'}
+        )
+        self.image_client.images.return_value = [other_image, image]
+        self.image_client.get_image.return_value = image
+
+        arglist = [
+            '--image-property',
+            'hypervisor_type=qemu',
+            '--cache-image-properties',
+            '--flavor',
+            self.flavor.id,
+            self.server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'hypervisor_type': 'qemu'}),
+            ('cache_image_properties', True),
+            ('flavor', self.flavor.id),
+            ('server_name', self.server.name),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        for _ in range(2):
+            self.cmd.take_action(parsed_args)
+
+        # the second boot is served from the cached index
+        self.image_client.images.assert_called_once_with(visibility='public')
+        self.image_client.get_image.assert_any_call(image.id)
+        self.assertEqual(
+            image.id,
+            self.compute_client.create_server.call_args.kwargs['image_id'],
+        )
+
+    def test_server_create_image_property_cached_stale(self):
+        self.app.client_manager.cache_path = self.useFixture(
+            fixtures.TempDir()
+        ).path
+        stale_image = image_fakes.create_one_image(
+            {'visibility': 'public', 'hypervisor_type': 'qemu'}
+        )
+        image = image_fakes.create_one_image(
+            {'visibility': 'private', 'hypervisor_type': 'qemu'}
+        )
+        self.image_client.images.side_effect = [[stale_image], [image]]
+
+        def _get_image(image_id):
+            if image_id == stale_image.id:
+                raise sdk_exceptions.ResourceNotFound()
+            return image
+
+        self.image_client.get_image.side_effect = _get_image
+
+        arglist = [
+            '--image-property',
+            'hypervisor_type=qemu',
+            '--cache-image-properties',
+            '--flavor',
+            self.flavor.id,
+            self.server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'hypervisor_type': 'qemu'}),
+            ('cache_image_properties', True),
+            ('flavor', self.flavor.id),
+            ('server_name', self.server.name),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        # the image in the index was deleted so all images are searched
+        self.image_client.images.assert_has_calls(
+            [mock.call(visibility='public'), mock.call()]
+        )
+        self.image_client.get_image.assert_any_call(stale_image.id)
+        self.assertEqual(
+            image.id,
+            self.compute_client.create_server.call_args.kwargs['image_id'],
+        )
+
     def test_server_create_no_boot_device(self):
         block_device = f'uuid={self.volume.id},source_type=volume,boot_index=1'
         arglist = [
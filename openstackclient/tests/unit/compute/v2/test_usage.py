@@ -12,11 +12,14 @@
 #
 
 import datetime
+import os
 from unittest import mock
 
+import fixtures
 from openstack.compute.v2 import usage as _usage
 from openstack.identity.v3 import project as _project
 from openstack.test import fakes as sdk_fakes
+from osc_lib import exceptions
 
 from openstackclient.compute.v2 import usage as usage_cmds
 from openstackclient.tests.unit.compute.v2 import fakes as compute_fakes
@@ -27,11 +30,11 @@ class TestUsageList(compute_fakes.TestCompute):
         super().setUp()
 
         self.project = sdk_fakes.generate_fake_resource(_project.Project)
-        self.identity_sdk_client.projects.return_value = [self.project]
+        self.identity_sdk_client.get_project.return_value = self.project
 
         self.usages = [
             sdk_fakes.generate_fake_resource(
-                _usage.Usage, project_id=self.project.name
+                _usage.Usage, project_id=self.project.id
             )
         ]
         self.columns = (
@@ -67,7 +70,10 @@ class TestUsageList(compute_fakes.TestCompute):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.identity_sdk_client.projects.assert_called_once()
+        self.identity_sdk_client.get_project.assert_called_once_with(
+            self.project.id
+        )
+        self.identity_sdk_client.projects.assert_not_called()
 
         self.assertCountEqual(self.columns, columns)
         self.assertCountEqual(tuple(self.data), tuple(data))
@@ -88,7 +94,10 @@ class TestUsageList(compute_fakes.TestCompute):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.identity_sdk_client.projects.assert_called_once()
+        self.identity_sdk_client.get_project.assert_called_once_with(
+            self.project.id
+        )
+        self.identity_sdk_client.projects.assert_not_called()
         self.compute_client.usages.assert_called_with(
             start=datetime.datetime(2016, 11, 11, 0, 0),
             end=datetime.datetime(2016, 12, 20, 0, 0),
@@ -109,13 +118,180 @@ class TestUsageList(compute_fakes.TestCompute):
 
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.identity_sdk_client.projects.assert_called_once()
+        self.identity_sdk_client.get_project.assert_called_once_with(
+            self.project.id
+        )
+        self.identity_sdk_client.projects.assert_not_called()
         self.compute_client.usages.assert_has_calls(
             [mock.call(start=mock.ANY, end=mock.ANY, detailed=True)]
         )
         self.assertCountEqual(self.columns, columns)
         self.assertCountEqual(tuple(self.data), tuple(data))
 
+    def test_usage_list_shard_interval(self):
+        def _make_usage(hours, servers):
+            return _usage.Usage(
+                project_id=self.project.id,
+                total_hours=hours,
+                total_memory_mb_usage=hours * 512,
+                total_vcpus_usage=hours * 2,
+                total_local_gb_usage=hours * 10,
+                server_usages=[
+                    {'instance_id': server, 'hours': hours / len(servers)}
+                    for server in servers
+                ],
+            )
+
+        self.compute_client.usages.side_effect = [
+            [_make_usage(0.1, ['a'])],
+            [_make_usage(0.2, ['a', 'b'])],
+            [_make_usage(0.3, ['b'])],
+        ]
+
+        arglist = [
+            '--start',
+            '2016-11-01',
+            '--end',
+            '2016-11-06',
+            '--shard-interval',
+            '2',
+        ]
+        verifylist = [('shard_interval', 2)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        _, data = self.cmd.take_action(parsed_args)
+        data = list(data)
+
+        self.compute_client.usages.assert_has_calls(
+            [
+                mock.call(
+                    start=datetime.datetime(2016, 11, 1),
+                    end=datetime.datetime(2016, 11, 3),
+                    detailed=True,
+                ),
+                mock.call(
+                    start=datetime.datetime(2016, 11, 3),
+                    end=datetime.datetime(2016, 11, 5),
+                    detailed=True,
+                ),
+                mock.call(
+                    start=datetime.datetime(2016, 11, 5),
+                    end=datetime.datetime(2016, 11, 6),
+                    detailed=True,
+                ),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(1, len(data))
+        # servers spanning several windows are only counted once
+        self.assertEqual('2', data[0][1].human_readable())
+        self.assertEqual('307.20', data[0][2].human_readable())
+        self.assertEqual('1.20', data[0][3].human_readable())
+        self.assertEqual('6.00', data[0][4].human_readable())
+
+    def test_usage_list_shard_interval_invalid(self):
+        arglist = ['--shard-interval', '0']
+        verifylist = [('shard_interval', 0)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+    def test_usage_list_many_projects(self):
+        projects = list(
+            sdk_fakes.generate_fake_resources(_project.Project, 101)
+        )
+        self.identity_sdk_client.projects.return_value = projects
+        self.compute_client.usages.return_value = [
+            sdk_fakes.generate_fake_resource(
+                _usage.Usage, project_id=project.id
+            )
+            for project in projects
+        ]
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        _, data = self.cmd.take_action(parsed_args)
+        data = list(data)
+
+        # listing every project is cheaper than fetching each individually
+        self.identity_sdk_client.projects.assert_called_once_with()
+        self.identity_sdk_client.get_project.assert_not_called()
+        self.assertEqual(
+            [project.name for project in projects],
+            [row[0].human_readable() for row in data],
+        )
+
+    def test_usage_list_cache_project_names(self):
+        self.app.client_manager.cache_path = self.useFixture(
+            fixtures.TempDir()
+        ).path
+
+        arglist = ['--cache-project-names']
+        verifylist = [('cache_project_names', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        _, data = self.cmd.take_action(parsed_args)
+        self.assertEqual(
+            self.project.name, next(iter(data))[0].human_readable()
+        )
+        self.identity_sdk_client.get_project.assert_called_once_with(
+            self.project.id
+        )
+        self.assertTrue(
+            os.path.exists(
+                self.app.client_manager.get_cache_file('project-names')
+            )
+        )
+
+        # a second invocation is served entirely from the cache
+        self.identity_sdk_client.get_project.reset_mock()
+        self.app.client_manager.reset_identity_resolver()
+
+        _, data = self.cmd.take_action(parsed_args)
+        self.assertEqual(
+            self.project.name, next(iter(data))[0].human_readable()
+        )
+        self.identity_sdk_client.get_project.assert_not_called()
+
+
+class TestMergeUsageShards(compute_fakes.TestCompute):
+    def test_merge_exact(self):
+        # many small windows must add up to the same total as one big one
+        shards = [
+            [
+                _usage.Usage(
+                    project_id='project',
+                    total_hours=0.1,
+                    total_memory_mb_usage=0.1,
+                    total_vcpus_usage=0.1,
+                    total_local_gb_usage=0.1,
+                    server_usages=[{'instance_id': 'a', 'hours': 0.1}],
+                )
+            ]
+            for _ in range(10)
+        ]
+
+        (usage,) = usage_cmds._merge_usage_shards(shards)
+
+        self.assertEqual(1.0, usage.total_hours)
+        self.assertEqual(1.0, usage.total_memory_mb_usage)
+        self.assertEqual(1, len(usage.server_usages))
+        self.assertEqual(1.0, usage.server_usages[0].hours)
+
+    def test_shard_range(self):
+        start = datetime.datetime(2016, 1, 1)
+        end = datetime.datetime(2016, 1, 4, 12)
+
+        self.assertEqual(
+            [
+                (start, datetime.datetime(2016, 1, 3)),
+                (datetime.datetime(2016, 1, 3), end),
+            ],
+            usage_cmds._shard_range(start, end, datetime.timedelta(days=2)),
+        )
+
 
 class TestUsageShow(compute_fakes.TestCompute):
     # Return value of self.usage_mock.list().
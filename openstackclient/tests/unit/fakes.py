@@ -16,6 +16,7 @@
 # version once our min version is bumped to 4.3.0
 
 import json
+import os
 from unittest import mock
 
 from keystoneauth1 import fixture
@@ -29,6 +30,8 @@ from osc_lib.tests.fakes import (
 )
 import requests
 
+from openstackclient.identity import common as identity_common
+
 __all__ = [
     'AUTH_TOKEN',
     'AUTH_URL',
@@ -86,6 +89,12 @@ class FakeClientManager(BaseFakeClientManager):
         super().__init__()
 
         self.sdk_connection = mock.Mock()
+        # don't share identity lookups with earlier tests
+        identity_common.reset_identity_resolvers()
+
+        # Tests exercising persistent caches must point this at a temporary
+        # directory
+        self.cache_path = None
 
         self.network_endpoint_enabled = True
         self.compute_endpoint_enabled = True
@@ -114,6 +123,18 @@ class FakeClientManager(BaseFakeClientManager):
 
         return config
 
+    @property
+    def identity_resolver(self):
+        return identity_common.get_identity_resolver(
+            self.sdk_connection.identity
+        )
+
+    def reset_identity_resolver(self):
+        identity_common.reset_identity_resolvers()
+
+    def get_cache_file(self, name):
+        return os.path.join(self.cache_path, f'{name}.json')
+
     def is_network_endpoint_enabled(self):
         return self.network_endpoint_enabled
 
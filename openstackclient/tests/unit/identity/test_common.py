@@ -53,13 +53,15 @@ class TestFindSDKId(test_utils.TestCase):
             sdk_exc.ResourceNotFound,
         ]
 
-        self.assertRaises(
+        exc = self.assertRaises(
             exceptions.CommandError,
             common._find_sdk_id,
             self.identity_sdk_client.find_user,
             name_or_id=self.user.id,
             validate_actor_existence=True,
+            resource_type='user',
         )
+        self.assertEqual(f'No user found for {self.user.id}', str(exc))
 
     def test_find_sdk_id_not_found_no_validate(self):
         self.identity_sdk_client.find_user.side_effect = [
@@ -98,3 +100,146 @@ class TestFindSDKId(test_utils.TestCase):
         )
 
         self.assertEqual(self.user.id, result)
+
+
+class TestIdentityResolver(test_utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = sdk_fakes.generate_fake_resource(
+            _user.User, name='test-user'
+        )
+        self.identity_sdk_client = mock.Mock()
+        self.identity_sdk_client.api_version = '3'
+        self.identity_sdk_client.find_user.return_value = self.user
+        self.resolver = common.IdentityResolver(self.identity_sdk_client)
+
+    def test_resolve_memoized(self):
+        for _ in range(3):
+            result = self.resolver.resolve('user', self.user.name)
+            self.assertEqual(self.user.id, result)
+
+        self.identity_sdk_client.find_user.assert_called_once_with(
+            name_or_id=self.user.name, ignore_missing=False
+        )
+
+    def test_resolve_memoized_per_domain(self):
+        self.resolver.resolve('user', self.user.name, domain_id='foo')
+        self.resolver.resolve('user', self.user.name, domain_id='bar')
+        self.resolver.resolve('user', self.user.name, domain_id='foo')
+
+        self.identity_sdk_client.find_user.assert_has_calls(
+            [
+                mock.call(
+                    name_or_id=self.user.name,
+                    ignore_missing=False,
+                    domain_id='foo',
+                ),
+                mock.call(
+                    name_or_id=self.user.name,
+                    ignore_missing=False,
+                    domain_id='bar',
+                ),
+            ]
+        )
+        self.assertEqual(2, self.identity_sdk_client.find_user.call_count)
+
+    def test_resolve_id_no_validate(self):
+        result = self.resolver.resolve(
+            'user', self.user.id, validate_actor_existence=False
+        )
+
+        self.assertEqual(self.user.id, result)
+        self.identity_sdk_client.find_user.assert_not_called()
+
+    def test_resolve_id_validate(self):
+        result = self.resolver.resolve('user', self.user.id)
+
+        self.assertEqual(self.user.id, result)
+        self.identity_sdk_client.find_user.assert_called_once_with(
+            name_or_id=self.user.id, ignore_missing=False
+        )
+
+    def test_resolve_not_found_no_validate_not_memoized(self):
+        self.identity_sdk_client.find_user.side_effect = [
+            sdk_exc.ResourceNotFound,
+            sdk_exc.ResourceNotFound,
+        ]
+
+        result = self.resolver.resolve(
+            'user', 'unknown', validate_actor_existence=False
+        )
+        self.assertEqual('unknown', result)
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.resolver.resolve,
+            'user',
+            'unknown',
+        )
+
+    def test_resolve_many(self):
+        domain = mock.Mock(id='domain-id')
+        self.identity_sdk_client.find_domain.return_value = domain
+
+        result = self.resolver.resolve_many(
+            [
+                ('domain', 'test-domain', {}),
+                ('user', self.user.name, {}),
+                ('domain', 'test-domain', {}),
+            ]
+        )
+
+        self.assertEqual(['domain-id', self.user.id, 'domain-id'], result)
+        self.identity_sdk_client.find_domain.assert_called_once_with(
+            name_or_id='test-domain', ignore_missing=False
+        )
+        self.identity_sdk_client.find_user.assert_called_once_with(
+            name_or_id=self.user.name, ignore_missing=False
+        )
+
+    def test_resolve_many_error(self):
+        self.identity_sdk_client.find_domain.side_effect = (
+            sdk_exc.ResourceNotFound
+        )
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.resolver.resolve_many,
+            [
+                ('domain', 'test-domain', {}),
+                ('user', self.user.name, {}),
+            ],
+        )
+
+    def test_find_user_id_with_domain(self):
+        domain = mock.Mock(id='domain-id')
+        self.identity_sdk_client.find_domain.return_value = domain
+
+        self.resolver.find_user_id(self.user.name, 'test-domain')
+        self.resolver.find_user_id(self.user.name, 'test-domain')
+
+        self.identity_sdk_client.find_domain.assert_called_once_with(
+            name_or_id='test-domain', ignore_missing=False
+        )
+        self.identity_sdk_client.find_user.assert_called_once_with(
+            name_or_id=self.user.name,
+            ignore_missing=False,
+            domain_id='domain-id',
+        )
+
+    def test_find_id_sdk_shares_resolver(self):
+        self.addCleanup(common.reset_identity_resolvers)
+        resolver = common.get_identity_resolver(self.identity_sdk_client)
+
+        common.find_user_id_sdk(self.identity_sdk_client, self.user.name)
+        resolver.find_user_id(self.user.name)
+
+        self.identity_sdk_client.find_user.assert_called_once_with(
+            name_or_id=self.user.name, ignore_missing=False
+        )
+
+        # the next command starts with a new resolver
+        common.reset_identity_resolvers()
+        self.assertIsNot(
+            resolver, common.get_identity_resolver(self.identity_sdk_client)
+        )
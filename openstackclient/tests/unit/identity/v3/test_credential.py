@@ -85,6 +85,21 @@ class TestCredentialCreate(identity_fakes.TestIdentity):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, data)
 
+    def test_credential_create_user_not_found(self):
+        self.identity_sdk_client.find_user.side_effect = (
+            sdk_exceptions.ResourceNotFound
+        )
+        arglist = ['unknown_user', self.credential.blob]
+        verifylist = [('user', 'unknown_user')]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.assertEqual('No user found for unknown_user', str(exc))
+        self.identity_sdk_client.create_credential.assert_not_called()
+
     def test_credential_create_with_options(self):
         arglist = [
             self.credential.user_id,
@@ -252,7 +267,7 @@ class TestCredentialList(identity_fakes.TestIdentity):
             'type': self.credential.type,
         }
         self.identity_sdk_client.find_user.assert_called_with(
-            self.credential.user_id, domain_id=None, ignore_missing=False
+            name_or_id=self.credential.user_id, ignore_missing=False
         )
         self.identity_sdk_client.credentials.assert_called_with(**kwargs)
 
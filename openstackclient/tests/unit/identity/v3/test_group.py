@@ -111,8 +111,13 @@ class TestGroupCheckUser(identity_fakes.TestIdentity):
     def setUp(self):
         super().setUp()
 
-        self.group = sdk_fakes.generate_fake_resource(_group.Group)
-        self.user = sdk_fakes.generate_fake_resource(_user.User)
+        # names must not look like IDs or they will be used verbatim
+        self.group = sdk_fakes.generate_fake_resource(
+            _group.Group, name='test-group'
+        )
+        self.user = sdk_fakes.generate_fake_resource(
+            _user.User, name='test-user'
+        )
 
         self.identity_sdk_client.find_group.return_value = self.group
         self.identity_sdk_client.find_user.return_value = self.user
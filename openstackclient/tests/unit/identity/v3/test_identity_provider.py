@@ -38,7 +38,9 @@ class TestIdentityProviderCreate(identity_fakes.TestFederatedIdentity):
     def setUp(self):
         super().setUp()
 
-        self.domain = sdk_fakes.generate_fake_resource(_domain.Domain)
+        self.domain = sdk_fakes.generate_fake_resource(
+            _domain.Domain, name='test-domain'
+        )
         self.idp = sdk_fakes.generate_fake_resource(
             _identity_provider.IdentityProvider,
             domain_id=self.domain.id,
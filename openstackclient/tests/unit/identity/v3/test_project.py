@@ -1822,7 +1822,11 @@ class TestProjectShow(identity_fakes.TestIdentity):
     def test_project_show_with_domain(self):
         project = sdk_fakes.generate_fake_resource(
             _project.Project,
-            **dict(self.project_kwargs_no_options, domain_id=self.domain.id),
+            **dict(
+                self.project_kwargs_no_options,
+                domain_id=self.domain.id,
+                name='test-project',
+            ),
         )
         self.identity_sdk_client.find_domain.return_value = self.domain
         self.identity_sdk_client.find_project.return_value = project
@@ -771,10 +771,16 @@ class TestRoleRemove(identity_fakes.TestIdentity):
     def _is_inheritance_testcase(self):
         return False
 
-    user = sdk_fakes.generate_fake_resource(_user.User)
-    group = sdk_fakes.generate_fake_resource(_group.Group)
-    domain = sdk_fakes.generate_fake_resource(_domain.Domain)
-    project = sdk_fakes.generate_fake_resource(_project.Project)
+    # RemoveRole does not validate the existence of actors so names must not
+    # look like IDs or they will be used verbatim
+    user = sdk_fakes.generate_fake_resource(_user.User, name='test-user')
+    group = sdk_fakes.generate_fake_resource(_group.Group, name='test-group')
+    domain = sdk_fakes.generate_fake_resource(
+        _domain.Domain, name='test-domain'
+    )
+    project = sdk_fakes.generate_fake_resource(
+        _project.Project, name='test-project'
+    )
     system = sdk_fakes.generate_fake_resource(_system.System)
 
     def setUp(self):
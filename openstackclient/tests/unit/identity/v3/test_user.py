@@ -310,7 +310,7 @@ class TestUserCreate(identity_fakes.TestIdentity):
         }
         self.identity_sdk_client.create_user.assert_called_once_with(**kwargs)
         self.identity_sdk_client.find_domain.assert_called_once_with(
-            self.project.domain_id, ignore_missing=False
+            name_or_id=self.project.domain_id, ignore_missing=False
         )
 
         self.assertEqual(self.columns, columns)
@@ -1316,12 +1316,8 @@ class TestUserSet(identity_fakes.TestIdentity):
         self.identity_sdk_client.find_domain.assert_not_called()
 
         # Set expected values
-        kwargs = {
-            'ignore_missing': False,
-            'domain_id': None,
-        }
         self.identity_sdk_client.find_project.assert_called_once_with(
-            name_or_id=self.project.id, **kwargs
+            name_or_id=self.project.id, ignore_missing=False
         )
 
         self.assertIsNone(result)
@@ -13,6 +13,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+from unittest import mock
 from unittest.mock import call
 
 from openstack import exceptions as sdk_exceptions
@@ -105,6 +106,135 @@ class TestQueueCache(fakes.TestImagev2):
         self.image_client.queue_image.assert_has_calls(calls)
 
 
+@mock.patch.object(cache, 'WARM_POLL_INTERVAL', 0)
+class TestCacheWarm(fakes.TestImagev2):
+    nodes = ['http://192.0.2.10:9292', 'http://192.0.2.11:9292/v2/']
+
+    def setUp(self):
+        super().setUp()
+
+        self.images = fakes.create_images(count=2)
+        self.image_client.find_image.side_effect = self.images
+        self.image_client.put.return_value = mock.Mock(status_code=202)
+        self.cmd = cache.WarmCachedImage(self.app, None)
+
+    def _set_caches(self, *states):
+        """Set the states each node reports on successive cache listings"""
+        responses = {
+            cache._node_cache_url(node): iter(node_states)
+            for node, node_states in zip(self.nodes, states)
+        }
+
+        def _get(url):
+            cached, queued = next(responses[url])
+            return mock.Mock(
+                status_code=200,
+                json=mock.Mock(
+                    return_value={
+                        'cached_images': [
+                            {'image_id': self.images[i].id} for i in cached
+                        ],
+                        'queued_images': [self.images[i].id for i in queued],
+                    }
+                ),
+            )
+
+        self.image_client.get.side_effect = _get
+
+    def _parse(self, *extra):
+        arglist = [image.id for image in self.images]
+        for node in self.nodes:
+            arglist.extend(['--node', node])
+        arglist.extend(extra)
+        verifylist = [
+            ('images', [image.id for image in self.images]),
+            ('nodes', self.nodes),
+        ]
+        return self.check_parser(self.cmd, arglist, verifylist)
+
+    def test_node_cache_url(self):
+        self.assertEqual(
+            'http://192.0.2.10:9292/v2/cache',
+            cache._node_cache_url('http://192.0.2.10:9292/'),
+        )
+        self.assertEqual(
+            'http://192.0.2.10:9292/v2/cache/image-id',
+            cache._node_cache_url('http://192.0.2.10:9292/v2', 'image-id'),
+        )
+
+    def test_cache_warm(self):
+        first, second = self.images
+        self._set_caches(
+            # the first node already has the first image
+            [([0], []), ([0, 1], [])],
+            [([], []), ([0], [1]), ([0, 1], [])],
+        )
+        parsed_args = self._parse()
+
+        columns, data = self.cmd.take_action(parsed_args)
+        rows = list(data)
+
+        self.assertEqual(
+            ('Node', 'Image ID', 'Image Name', 'State', 'Time (s)'), columns
+        )
+        self.assertEqual(
+            [
+                (self.nodes[0], first.id, first.name, 'cached', None),
+                (self.nodes[0], second.id, second.name, 'cached'),
+                (self.nodes[1], first.id, first.name, 'cached'),
+                (self.nodes[1], second.id, second.name, 'cached'),
+            ],
+            [row if row[4] is None else row[:4] for row in rows],
+        )
+        self.image_client.put.assert_has_calls(
+            [
+                call('http://192.0.2.10:9292/v2/cache/' + second.id),
+                call('http://192.0.2.11:9292/v2/cache/' + first.id),
+                call('http://192.0.2.11:9292/v2/cache/' + second.id),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(3, self.image_client.put.call_count)
+        # each node is only checked until all the images are cached on it
+        self.assertEqual(5, self.image_client.get.call_count)
+
+    def test_cache_warm_queue_failed(self):
+        self._set_caches([([0, 1], [])], [([], []), ([0], [])])
+        self.image_client.put.side_effect = [
+            mock.Mock(status_code=202),
+            sdk_exceptions.HttpException('cache disabled'),
+        ]
+        parsed_args = self._parse('--parallel', '1')
+
+        # the results are shown before the command fails
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.run, parsed_args
+        )
+
+        self.assertEqual(
+            'Failed to cache 1 of 4 image(s) across 2 node(s)', str(exc)
+        )
+        output = self.app.stdout.make_string()
+        self.assertRegex(
+            output, rf'192\.0\.2\.11:9292/v2/ +\| {self.images[1].id} .* error'
+        )
+        self.assertEqual(3, output.count(' cached '))
+
+    def test_cache_warm_timeout(self):
+        self._set_caches([([0, 1], [])], [([], [])])
+        parsed_args = self._parse('--timeout', '0')
+
+        _columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            ['cached', 'cached', 'queued', 'queued'], [row[3] for row in data]
+        )
+        self.assertEqual(
+            'Failed to cache 2 of 4 image(s) across 2 node(s)',
+            self.cmd._failure,
+        )
+
+
 class TestCacheDelete(fakes.TestImagev2):
     def setUp(self):
         super().setUp()
@@ -13,10 +13,15 @@
 #   under the License.
 
 import copy
+import hashlib
 import io
+import json
+import os
 import tempfile
 from unittest import mock
 
+import fixtures
+from keystoneauth1 import exceptions as ks_exceptions
 from openstack.block_storage.v2 import volume as _volume
 from openstack import exceptions as sdk_exceptions
 from openstack.identity.v3 import domain as _domain
@@ -229,8 +234,13 @@ class TestImageCreate(image_fakes.TestImagev2, volume_fakes.TestVolume):
             Alpha='1',
             Beta='2',
             tags=self.new_image.tags,
-            filename=imagefile.name,
+            data=mock.ANY,
+            validate_checksum=False,
+            size=1,
         )
+        source = self.image_client.create_image.call_args.kwargs['data']
+        self.assertIsInstance(source, _image.transfer.UploadSource)
+        self.assertEqual(imagefile.name, source.path)
         self.image_client.get_image.assert_called_once_with(self.new_image)
 
         self.assertEqual(self.expected_columns, columns)
@@ -289,7 +299,8 @@ class TestImageCreate(image_fakes.TestImagev2, volume_fakes.TestVolume):
             Alpha='1',
             Beta='2',
             tags=self.new_image.tags,
-            filename=imagefile.name,
+            data=mock.ANY,
+            validate_checksum=False,
             size=2048,
         )
         self.image_client.get_image.assert_called_once_with(self.new_image)
@@ -297,6 +308,91 @@ class TestImageCreate(image_fakes.TestImagev2, volume_fakes.TestVolume):
         self.assertEqual(self.expected_columns, columns)
         self.assertCountEqual(self.expected_data, data)
 
+    def _create_uploaded_image(
+        self, data, hash_value, *args, hash_algo='sha512'
+    ):
+        path = os.path.join(self.useFixture(fixtures.TempDir()).path, 'img')
+        with open(path, 'wb') as fh:
+            fh.write(data)
+
+        def _create_image(**kwargs):
+            # consume the source as the upload would, each chunk is only
+            # valid until the next one is requested
+            for chunk in kwargs['data']:
+                chunk.tobytes()
+            return self.new_image
+
+        self.image_client.create_image.side_effect = _create_image
+        self.image_client.get_image.return_value = (
+            image_fakes.create_one_image(
+                {
+                    'id': self.new_image.id,
+                    'hash_algo': hash_algo,
+                    'hash_value': hash_value,
+                }
+            )
+        )
+        arglist = ['--file', path, *args, self.new_image.name]
+        return self.check_parser(self.cmd, arglist, [])
+
+    def test_image_create_file_verified(self):
+        data = b'image data' * 1024
+        parsed_args = self._create_uploaded_image(
+            data, hashlib.sha512(data).hexdigest()
+        )
+
+        self.cmd.take_action(parsed_args)
+
+        self.image_client.delete_image.assert_not_called()
+
+    def test_image_create_file_progress(self):
+        data = b'image data' * 1024
+        parsed_args = self._create_uploaded_image(
+            data, hashlib.sha512(data).hexdigest(), '--progress'
+        )
+
+        # progress is kept out of the command's output
+        stdout = io.StringIO()
+        events = io.StringIO()
+        with (
+            mock.patch('sys.stdout', stdout),
+            mock.patch('sys.stderr', events),
+        ):
+            self.cmd.take_action(parsed_args)
+
+        self.assertEqual('', stdout.getvalue())
+        lines = [json.loads(line) for line in events.getvalue().splitlines()]
+        self.assertEqual('start', lines[0]['event'])
+        self.assertEqual('finish', lines[-1]['event'])
+        self.assertEqual(len(data), lines[-1]['bytes'])
+
+    def test_image_create_file_other_algorithm(self):
+        data = b'image data'
+        parsed_args = self._create_uploaded_image(
+            data, hashlib.sha256(b'other data').hexdigest(), hash_algo='sha256'
+        )
+
+        with mock.patch.object(_image.LOG, 'warning') as mock_warning:
+            self.cmd.take_action(parsed_args)
+
+        # the upload cannot be verified, which is reported
+        mock_warning.assert_called_once()
+        self.image_client.delete_image.assert_not_called()
+
+    def test_image_create_file_checksum_mismatch(self):
+        parsed_args = self._create_uploaded_image(
+            b'image data', hashlib.sha512(b'other data').hexdigest()
+        )
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.assertIn('sha512', str(exc))
+        self.image_client.delete_image.assert_called_once_with(
+            self.new_image.id
+        )
+
     @mock.patch('sys.stdin', side_effect=[None])
     def test_image_create_size_requires_upload(self, raw_input):
         arglist = [
@@ -353,10 +449,38 @@ class TestImageCreate(image_fakes.TestImagev2, volume_fakes.TestVolume):
             allow_duplicates=True,
             container_format=_image.DEFAULT_CONTAINER_FORMAT,
             disk_format=_image.DEFAULT_DISK_FORMAT,
-            data=fake_stdin,
+            data=mock.ANY,
             validate_checksum=False,
             size=2048,
         )
+        source = self.image_client.create_image.call_args.kwargs['data']
+        self.assertIsInstance(source, _image.transfer.StreamSource)
+        self.assertIs(fake_stdin, source.stream)
+        self.assertEqual(2048, len(source))
+
+    @mock.patch('openstackclient.image.v2.image.get_data_from_stdin')
+    def test_image_create_stdin_pipe(self, mock_get_data_from_stdin):
+        # a pipe cannot be seeked to find its size
+        fake_stdin = mock.Mock(spec=['readinto'])
+        mock_get_data_from_stdin.return_value = fake_stdin
+
+        arglist = [self.new_image.name]
+        verifylist = [('name', self.new_image.name)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.image_client.create_image.assert_called_with(
+            name=self.new_image.name,
+            allow_duplicates=True,
+            container_format=_image.DEFAULT_CONTAINER_FORMAT,
+            disk_format=_image.DEFAULT_DISK_FORMAT,
+            data=mock.ANY,
+            validate_checksum=False,
+        )
+        source = self.image_client.create_image.call_args.kwargs['data']
+        self.assertIs(fake_stdin, source.stream)
+        self.assertRaises(TypeError, len, source)
 
     @mock.patch('openstackclient.image.v2.image.get_data_from_stdin')
     def test_image_create__progress_ignore_with_stdin(
@@ -383,9 +507,12 @@ class TestImageCreate(image_fakes.TestImagev2, volume_fakes.TestVolume):
             allow_duplicates=True,
             container_format=_image.DEFAULT_CONTAINER_FORMAT,
             disk_format=_image.DEFAULT_DISK_FORMAT,
-            data=fake_stdin,
+            data=mock.ANY,
             validate_checksum=False,
+            size=len(b'some fake data'),
         )
+        source = self.image_client.create_image.call_args.kwargs['data']
+        self.assertIs(fake_stdin, source.stream)
         self.image_client.get_image.assert_called_once_with(self.new_image)
 
         self.assertEqual(self.expected_columns, columns)
@@ -958,16 +1085,23 @@ class TestImageList(image_fakes.TestImagev2):
         )
         self.assertCountEqual(datalist, tuple(data))
 
-    @mock.patch('osc_lib.api.utils.simple_filter')
-    def test_image_list_property_option(self, sf_mock):
-        sf_mock.return_value = [copy.deepcopy(self._image)]
+    def test_image_list_property_option(self):
+        images = [
+            image_fakes.create_one_image({'a': '1', 'os_distro': 'ubuntu'}),
+            image_fakes.create_one_image({'a': '2', 'os_distro': 'ubuntu'}),
+            image_fakes.create_one_image({'os_distro': 'ubuntu'}),
+            image_fakes.create_one_image({'a': '1', 'os_distro': 'centos'}),
+        ]
+        self.image_client.images.side_effect = [iter(images)]
 
         arglist = [
             '--property',
             'a=1',
+            '--property',
+            'os_distro=ubuntu',
         ]
         verifylist = [
-            ('property', {'a': '1'}),
+            ('property', {'a': '1', 'os_distro': 'ubuntu'}),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
@@ -976,15 +1110,44 @@ class TestImageList(image_fakes.TestImagev2):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
         self.image_client.images.assert_called_with()
-        sf_mock.assert_called_with(
-            [self._image],
-            attr='a',
-            value='1',
-            property_field='properties',
-        )
 
         self.assertEqual(self.columns, columns)
-        self.assertCountEqual(self.datalist, tuple(data))
+        self.assertEqual([(images[0].id, images[0].name, None)], list(data))
+
+    def test_image_list_property_option_server_side(self):
+        arglist = [
+            '--property',
+            'status=active',
+            '--property',
+            'owner=project-id',
+            '--property',
+            'a=1',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        _columns, data = self.cmd.take_action(parsed_args)
+
+        self.image_client.images.assert_called_with(
+            status='active', owner='project-id'
+        )
+        # the remaining property is still checked by the client
+        self.assertEqual([], list(data))
+
+    def test_image_list_property_option_not_server_side(self):
+        arglist = [
+            '--status',
+            'queued',
+            '--property',
+            'status=active',
+            '--property',
+            'name=in:a,b',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        _columns, data = self.cmd.take_action(parsed_args)
+
+        self.image_client.images.assert_called_with(status='queued')
+        self.assertEqual([], list(data))
 
     @mock.patch('osc_lib.utils.sort_items')
     def test_image_list_sort_option(self, si_mock):
@@ -2133,8 +2296,12 @@ class TestImageStage(image_fakes.TestImagev2):
 
         self.image_client.stage_image.assert_called_once_with(
             self.image,
-            filename=imagefile.name,
+            data=mock.ANY,
+            size=1,
         )
+        source = self.image_client.stage_image.call_args.kwargs['data']
+        self.assertIsInstance(source, _image.transfer.UploadSource)
+        self.assertEqual(imagefile.name, source.path)
 
     @mock.patch('openstackclient.image.v2.image.get_data_from_stdin')
     def test_stage_image__from_stdin(self, mock_get_data_from_stdin):
@@ -2153,8 +2320,12 @@ class TestImageStage(image_fakes.TestImagev2):
 
         self.image_client.stage_image.assert_called_once_with(
             self.image,
-            data=fake_stdin,
+            data=mock.ANY,
+            size=len(fake_stdin.getvalue()),
         )
+        source = self.image_client.stage_image.call_args.kwargs['data']
+        self.assertIsInstance(source, _image.transfer.StreamSource)
+        self.assertIs(fake_stdin, source.stream)
 
     def test_stage_image__with_size(self):
         imagefile = tempfile.NamedTemporaryFile(delete=False)
@@ -2179,7 +2350,7 @@ class TestImageStage(image_fakes.TestImagev2):
 
         self.image_client.stage_image.assert_called_once_with(
             self.image,
-            filename=imagefile.name,
+            data=mock.ANY,
             size=2048,
         )
 
@@ -2226,7 +2397,7 @@ class TestImageImport(image_fakes.TestImagev2):
             self.image.name,
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
@@ -2254,7 +2425,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'https://example.com/',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'web-download'),
             ('uri', 'https://example.com/'),
         ]
@@ -2283,7 +2454,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'web-download',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'web-download'),
             ('uri', None),
         ]
@@ -2308,7 +2479,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'https://example.com/',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'glance-direct'),
             ('uri', 'https://example.com/'),
         ]
@@ -2333,7 +2504,7 @@ class TestImageImport(image_fakes.TestImagev2):
         ]
 
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'web-download'),
             ('uri', 'invalid:1234'),
         ]
@@ -2363,7 +2534,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'https://example.com/',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'web-download'),
             ('uri', 'https://example.com/'),
         ]
@@ -2392,7 +2563,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'fast',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'copy-image'),
             ('stores', ['fast']),
         ]
@@ -2423,7 +2594,7 @@ class TestImageImport(image_fakes.TestImagev2):
             '--disallow-failure',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'copy-image'),
             ('stores', ['fast']),
             ('allow_failure', False),
@@ -2457,7 +2628,7 @@ class TestImageImport(image_fakes.TestImagev2):
             'private',
         ]
         verifylist = [
-            ('image', self.image.name),
+            ('images', [self.image.name]),
             ('import_method', 'glance-download'),
             ('remote_region', 'eu/dublin'),
             ('remote_image', 'remote-image-id'),
@@ -2480,23 +2651,316 @@ class TestImageImport(image_fakes.TestImagev2):
         )
 
 
+@mock.patch.object(_image, 'IMPORT_POLL_INTERVAL', 0)
+class TestImageImportMultiple(image_fakes.TestImagev2):
+    import_info = image_fakes.create_one_import_info()
+
+    def setUp(self):
+        super().setUp()
+
+        self.images = [
+            image_fakes.create_one_image(
+                {
+                    'container_format': 'bare',
+                    'disk_format': 'qcow2',
+                    'status': 'active',
+                    'stores': 'default',
+                }
+            )
+            for _count in range(2)
+        ]
+        self.image_client.find_image.side_effect = self.images
+        self.image_client.get_import_info.return_value = self.import_info
+
+        self.cmd = _image.ImportImage(self.app, None)
+
+    def _imported(self, image, **properties):
+        attrs = {'id': image.id, 'name': image.name, 'status': 'active'}
+        attrs.update(properties)
+        return image_fakes.create_one_image(attrs)
+
+    def test_import_images_wait(self):
+        first, second = self.images
+        self.image_client.images.side_effect = [
+            [
+                self._imported(
+                    first,
+                    stores='default',
+                    os_glance_importing_to_stores='fast',
+                ),
+                self._imported(second, stores='default,fast'),
+            ],
+            [self._imported(first, stores='default,fast')],
+        ]
+        arglist = [
+            first.name,
+            second.name,
+            '--method',
+            'copy-image',
+            '--store',
+            'fast',
+            '--wait',
+        ]
+        verifylist = [
+            ('images', [first.name, second.name]),
+            ('stores', ['fast']),
+            ('wait', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('ID', 'Name', 'Method', 'Store', 'Status'), columns)
+        self.assertEqual(
+            [
+                (first.id, first.name, 'copy-image', 'fast', 'active'),
+                (first.id, first.name, 'copy-image', 'default', 'active'),
+                (second.id, second.name, 'copy-image', 'fast', 'active'),
+                (second.id, second.name, 'copy-image', 'default', 'active'),
+            ],
+            list(data),
+        )
+        self.assertEqual(2, self.image_client.import_image.call_count)
+        # a single listing checks on all the images still being imported
+        self.image_client.images.assert_has_calls(
+            [
+                mock.call(id=f'in:{first.id},{second.id}'),
+                mock.call(id=f'in:{first.id}'),
+            ]
+        )
+        self.image_client.get_image.assert_not_called()
+
+    def test_import_images_wait_failed(self):
+        first, second = self.images
+        self.image_client.images.return_value = [
+            self._imported(first, stores='default,fast'),
+            self._imported(
+                second, stores='default', os_glance_failed_import='fast'
+            ),
+        ]
+        arglist = [
+            first.name,
+            second.name,
+            '--method',
+            'copy-image',
+            '--store',
+            'fast',
+            '--wait',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        # the results are shown before the command fails
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.run, parsed_args
+        )
+
+        self.assertEqual('Failed to import 1 of 2 image(s)', str(exc))
+        output = self.app.stdout.make_string()
+        self.assertIn(first.id, output)
+        self.assertRegex(output, rf'{second.id} .* fast +\| failed')
+
+    def test_import_images_wait_timeout(self):
+        first, second = self.images
+        # the import of the second image failed before any listing saw it
+        # importing, so it never looks finished
+        self.image_client.images.return_value = [
+            self._imported(first, stores='default,fast'),
+            self._imported(second, status='uploading'),
+        ]
+        arglist = [
+            first.name,
+            second.name,
+            '--method',
+            'copy-image',
+            '--store',
+            'fast',
+            '--wait',
+            '--timeout',
+            '1',
+        ]
+        verifylist = [('wait', True), ('timeout', 1)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch.object(
+            _image.time, 'monotonic', side_effect=[0, 0, 0, 2]
+        ):
+            exc = self.assertRaises(
+                exceptions.CommandError, self.cmd.run, parsed_args
+            )
+
+        self.assertEqual('Failed to import 1 of 2 image(s)', str(exc))
+        self.assertEqual(2, self.image_client.images.call_count)
+        output = self.app.stdout.make_string()
+        self.assertRegex(output, rf'{first.id} .* fast +\| active')
+        self.assertRegex(output, rf'{second.id} .* +\| error')
+
+    def test_import_images_start_failed(self):
+        first, second = self.images
+        self.image_client.import_image.side_effect = [
+            None,
+            sdk_exceptions.ConflictException('already importing'),
+        ]
+        arglist = [
+            first.name,
+            second.name,
+            '--method',
+            'copy-image',
+            '--all-stores',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        _columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertCountEqual(
+            [
+                (first.id, first.name, 'copy-image', '', 'importing'),
+                (second.id, second.name, 'copy-image', '', 'error'),
+            ],
+            data,
+        )
+        self.assertEqual('Failed to import 1 of 2 image(s)', self.cmd._failure)
+        self.image_client.images.assert_not_called()
+
+    def test_import_images_manifest(self):
+        first, second = self.images
+        first.status = 'queued'
+        manifest = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'manifest.json'
+        )
+        with open(manifest, 'w') as fh:
+            json.dump(
+                [
+                    {
+                        'image': first.name,
+                        'method': 'web-download',
+                        'uri': 'https://example.com/image.qcow2',
+                    },
+                    {'image': second.name, 'stores': ['fast', 'slow']},
+                ],
+                fh,
+            )
+        arglist = [
+            '--manifest',
+            manifest,
+            '--method',
+            'copy-image',
+            '--all-stores',
+        ]
+        verifylist = [
+            ('images', []),
+            ('manifest', manifest),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        _columns, data = self.cmd.take_action(parsed_args)
+
+        self.image_client.import_image.assert_has_calls(
+            [
+                mock.call(
+                    first,
+                    method='web-download',
+                    uri='https://example.com/image.qcow2',
+                    remote_region=None,
+                    remote_image_id=None,
+                    remote_service_interface=None,
+                    stores=None,
+                    all_stores=True,
+                    all_stores_must_succeed=False,
+                ),
+                mock.call(
+                    second,
+                    method='copy-image',
+                    uri=None,
+                    remote_region=None,
+                    remote_image_id=None,
+                    remote_service_interface=None,
+                    stores=['fast', 'slow'],
+                    all_stores=False,
+                    all_stores_must_succeed=False,
+                ),
+            ],
+            any_order=True,
+        )
+        self.assertEqual(
+            [
+                (first.id, first.name, 'web-download', '', 'importing'),
+                (second.id, second.name, 'copy-image', 'fast', 'importing'),
+                (second.id, second.name, 'copy-image', 'slow', 'importing'),
+            ],
+            list(data),
+        )
+
+    def test_import_images_manifest_invalid(self):
+        manifest = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'manifest.json'
+        )
+        with open(manifest, 'w') as fh:
+            json.dump([{'image': 'image', 'store': 'fast'}], fh)
+        arglist = ['--manifest', manifest]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.assertIn('Unknown keys store', str(exc))
+        self.image_client.import_image.assert_not_called()
+
+    def test_import_images_invalid_image(self):
+        # the second image cannot be imported, so neither is
+        self.images[1].status = 'queued'
+        arglist = [
+            self.images[0].name,
+            self.images[1].name,
+            '--method',
+            'copy-image',
+            '--all-stores',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.image_client.import_image.assert_not_called()
+
+    def test_import_no_images(self):
+        parsed_args = self.check_parser(self.cmd, [], [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+
 class TestImageSave(image_fakes.TestImagev2):
-    image = image_fakes.create_one_image({})
+    data = b'some image data' * 1024
+    image = image_fakes.create_one_image(
+        {
+            'checksum': hashlib.md5(data).hexdigest(),
+            'hash_algo': 'sha512',
+            'hash_value': hashlib.sha512(data).hexdigest(),
+        }
+    )
 
     def setUp(self):
         super().setUp()
 
         self.image_client.find_image.return_value = self.image
-        self.image_client.download_image.return_value = self.image
+        self.response = mock.Mock(raw=io.BytesIO(self.data))
+        self.image_client.download_image.return_value = self.response
+        self.filename = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'image'
+        )
 
         # Get the command object to test
         self.cmd = _image.SaveImage(self.app, None)
 
     def test_save_data(self):
-        arglist = ['--file', '/path/to/file', self.image.id]
+        arglist = ['--file', self.filename, self.image.id]
 
         verifylist = [
-            ('filename', '/path/to/file'),
+            ('filename', self.filename),
+            ('chunk_size', None),
             ('image', self.image.id),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -2504,20 +2968,23 @@ class TestImageSave(image_fakes.TestImagev2):
         self.cmd.take_action(parsed_args)
 
         self.image_client.download_image.assert_called_once_with(
-            self.image.id, output='/path/to/file', stream=True, chunk_size=1024
+            self.image.id, stream=True
         )
+        self.response.close.assert_called_once_with()
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
 
     def test_save_data_with_chunk_size(self):
         arglist = [
             '--file',
-            '/path/to/file',
+            self.filename,
             '--chunk-size',
             '2048',
             self.image.id,
         ]
 
         verifylist = [
-            ('filename', '/path/to/file'),
+            ('filename', self.filename),
             ('chunk_size', 2048),
             ('image', self.image.id),
         ]
@@ -2525,9 +2992,220 @@ class TestImageSave(image_fakes.TestImagev2):
 
         self.cmd.take_action(parsed_args)
 
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+
+    def test_save_data_checksum_mismatch(self):
+        self.response.raw = io.BytesIO(b'corrupted' + self.data)
+        arglist = ['--file', self.filename, self.image.id]
+        verifylist = [('filename', self.filename)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.assertIn('sha512', str(exc))
+        self.assertFalse(os.path.exists(self.filename))
+
+    def test_save_data_sparse(self):
+        self.response.raw = io.BytesIO(self.data)
+        arglist = ['--file', self.filename, '--sparse', self.image.id]
+        verifylist = [('filename', self.filename), ('sparse', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch.object(
+            _image.transfer, 'SparseWriter', wraps=_image.transfer.SparseWriter
+        ) as writer:
+            self.cmd.take_action(parsed_args)
+
+        writer.assert_called_once()
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+
+    def test_save_data_sparse_to_stdout(self):
+        arglist = ['--sparse', self.image.id]
+        verifylist = [('sparse', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.image_client.download_image.assert_not_called()
+
+    def test_save_data_progress(self):
+        arglist = ['--file', self.filename, '--progress', self.image.id]
+        verifylist = [('filename', self.filename), ('progress', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        events = io.StringIO()
+        with mock.patch('sys.stderr', events):
+            self.cmd.take_action(parsed_args)
+
+        lines = [json.loads(line) for line in events.getvalue().splitlines()]
+        self.assertEqual('start', lines[0]['event'])
+        self.assertEqual('finish', lines[-1]['event'])
+        self.assertEqual(len(self.data), lines[-1]['bytes'])
+
+    def test_save_data_to_stdout(self):
+        arglist = [self.image.id]
+        verifylist = [('filename', None)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        output = io.BytesIO()
+        with mock.patch('sys.stdout', mock.Mock(buffer=output)):
+            self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.data, output.getvalue())
+
+
+class TestImageSaveParallel(image_fakes.TestImagev2):
+    data = bytes(range(256)) * 64
+    image = image_fakes.create_one_image(
+        {
+            'size': len(data),
+            'checksum': hashlib.md5(data).hexdigest(),
+            'hash_algo': 'sha512',
+            'hash_value': hashlib.sha512(data).hexdigest(),
+        }
+    )
+
+    def setUp(self):
+        super().setUp()
+
+        self.image_client.find_image.return_value = self.image
+        self.image_client.get.side_effect = self._get_range
+        self.ranges = []
+        self.filename = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'image'
+        )
+        self.useFixture(
+            fixtures.MockPatchObject(_image, 'DOWNLOAD_RANGE_SIZE', 4096)
+        )
+
+        self.cmd = _image.SaveImage(self.app, None)
+
+    def _get_range(self, url, headers, stream):
+        self.assertEqual(f'images/{self.image.id}/file', url)
+        start, end = map(int, headers['Range'][6:].split('-'))
+        self.ranges.append((start, end))
+        data = self.data[start : end + 1]
+        return mock.Mock(
+            status_code=206, iter_content=mock.Mock(return_value=[data])
+        )
+
+    def test_save_parallel(self):
+        arglist = ['--file', self.filename, '--parallel', '3', self.image.id]
+        verifylist = [('filename', self.filename), ('parallel', 3)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        # a probe followed by each of the four ranges
+        self.assertEqual((0, 0), self.ranges[0])
+        self.assertEqual(
+            [(0, 4095), (4096, 8191), (8192, 12287), (12288, 16383)],
+            sorted(self.ranges[1:]),
+        )
+        self.image_client.download_image.assert_not_called()
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+        self.assertFalse(os.path.exists(self.filename + '.part'))
+        self.assertFalse(os.path.exists(self.filename + '.part.json'))
+
+    def test_save_parallel_resume(self):
+        arglist = ['--file', self.filename, '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        def _fail_range(url, headers, stream):
+            if headers['Range'] == 'bytes=8192-12287':
+                raise ks_exceptions.ConnectFailure('connection reset')
+            return self._get_range(url, headers, stream)
+
+        self.image_client.get.side_effect = _fail_range
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+        self.assertIn('run the command again to resume', str(exc))
+        self.assertFalse(os.path.exists(self.filename))
+
+        self.ranges = []
+        self.image_client.get.side_effect = self._get_range
+        self.cmd.take_action(parsed_args)
+
+        # only the failed range and any not reached before the failure
+        self.assertNotIn((0, 4095), self.ranges)
+        self.assertIn((8192, 12287), self.ranges)
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+
+    def test_save_parallel_checksum_mismatch(self):
+        self.image_client.find_image.return_value = (
+            image_fakes.create_one_image(
+                {
+                    'id': self.image.id,
+                    'size': len(self.data),
+                    'hash_algo': 'sha512',
+                    'hash_value': hashlib.sha512(b'other').hexdigest(),
+                }
+            )
+        )
+        arglist = ['--file', self.filename, '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+        self.assertIn('sha512', str(exc))
+        self.assertEqual([], os.listdir(os.path.dirname(self.filename)))
+
+    def test_save_parallel_ranges_unsupported(self):
+        self.image_client.get.side_effect = None
+        self.image_client.get.return_value = mock.Mock(status_code=200)
+        self.image_client.download_image.return_value = mock.Mock(
+            raw=io.BytesIO(self.data)
+        )
+        arglist = ['--file', self.filename, '--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.cmd.take_action(parsed_args)
+
+        self.image_client.get.assert_called_once()
         self.image_client.download_image.assert_called_once_with(
-            self.image.id, output='/path/to/file', stream=True, chunk_size=2048
+            self.image.id, stream=True
+        )
+        with open(self.filename, 'rb') as fh:
+            self.assertEqual(self.data, fh.read())
+
+    def test_save_parallel_progress(self):
+        arglist = [
+            '--file',
+            self.filename,
+            '--parallel',
+            '2',
+            '--progress',
+            self.image.id,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        events = io.StringIO()
+        with mock.patch('sys.stderr', events):
+            self.cmd.take_action(parsed_args)
+
+        lines = [json.loads(line) for line in events.getvalue().splitlines()]
+        self.assertEqual('finish', lines[-1]['event'])
+        self.assertEqual(len(self.data), lines[-1]['bytes'])
+        self.assertEqual(len(self.data), lines[-1]['total'])
+
+    def test_save_parallel_to_stdout(self):
+        arglist = ['--parallel', '2', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
         )
+        self.image_client.get.assert_not_called()
 
 
 class TestImageGetData(image_fakes.TestImagev2):
@@ -15,6 +15,8 @@
 
 import copy
 
+from osc_lib import exceptions
+
 from openstackclient.object.v1 import container
 from openstackclient.tests.unit.object.v1 import fakes as object_fakes
 
@@ -48,10 +50,7 @@ class TestContainerDelete(object_fakes.TestObjectV1):
         self.object_store_client.object_delete.assert_not_called()
 
     def test_recursive_delete(self):
-        self.object_store_client.object_delete.return_value = None
-        self.object_store_client.object_list.return_value = [
-            object_fakes.OBJECT
-        ]
+        self.object_store_client.object_delete_all.return_value = []
 
         arglist = [
             '--recursive',
@@ -68,19 +67,12 @@ class TestContainerDelete(object_fakes.TestObjectV1):
         self.object_store_client.container_delete.assert_called_with(
             container=object_fakes.container_name
         )
-        self.object_store_client.object_list.assert_called_with(
+        self.object_store_client.object_delete_all.assert_called_with(
             container=object_fakes.container_name
         )
-        self.object_store_client.object_delete.assert_called_with(
-            container=object_fakes.container_name,
-            object=object_fakes.OBJECT['name'],
-        )
 
     def test_r_delete(self):
-        self.object_store_client.object_delete.return_value = None
-        self.object_store_client.object_list.return_value = [
-            object_fakes.OBJECT
-        ]
+        self.object_store_client.object_delete_all.return_value = []
 
         arglist = [
             '-r',
@@ -97,13 +89,29 @@ class TestContainerDelete(object_fakes.TestObjectV1):
         self.object_store_client.container_delete.assert_called_with(
             container=object_fakes.container_name
         )
-        self.object_store_client.object_list.assert_called_with(
+        self.object_store_client.object_delete_all.assert_called_with(
             container=object_fakes.container_name
         )
-        self.object_store_client.object_delete.assert_called_with(
-            container=object_fakes.container_name,
-            object=object_fakes.OBJECT['name'],
+
+    def test_recursive_delete_failure(self):
+        self.object_store_client.object_delete_all.return_value = [
+            (object_fakes.OBJECT['name'], '409 Conflict'),
+        ]
+
+        arglist = [
+            '--recursive',
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('containers', [object_fakes.container_name]),
+            ('recursive', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
         )
+        self.object_store_client.container_delete.assert_not_called()
 
 
 class TestContainerList(object_fakes.TestObjectV1):
@@ -276,7 +284,7 @@ class TestContainerList(object_fakes.TestObjectV1):
         self.assertEqual(datalist, tuple(data))
 
     def test_object_list_containers_all(self):
-        self.object_store_client.container_list.return_value = [
+        self.object_store_client.container_list_iter.return_value = [
             copy.deepcopy(object_fakes.CONTAINER),
             copy.deepcopy(object_fakes.CONTAINER_2),
             copy.deepcopy(object_fakes.CONTAINER_3),
@@ -295,8 +303,8 @@ class TestContainerList(object_fakes.TestObjectV1):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.object_store_client.container_list.assert_called_with(
-            full_listing=True,
+        self.object_store_client.container_list_iter.assert_called_with(
+            prefetch=True,
         )
 
         self.assertEqual(self.columns, columns)
@@ -308,6 +316,80 @@ class TestContainerList(object_fakes.TestObjectV1):
         self.assertEqual(datalist, tuple(data))
 
 
+class TestContainerSave(object_fakes.TestObjectV1):
+    def setUp(self):
+        super().setUp()
+
+        self.object_store_client.container_save.return_value = []
+
+        # Get the command object to test
+        self.cmd = container.SaveContainer(self.app, None)
+
+    def test_container_save(self):
+        arglist = [
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('prefix', None),
+            ('parallel', 10),
+            ('sync', False),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertIsNone(self.cmd.take_action(parsed_args))
+
+        self.object_store_client.container_save.assert_called_with(
+            container=object_fakes.container_name,
+            prefix=None,
+            concurrency=10,
+            sync=False,
+        )
+
+    def test_container_save_options(self):
+        arglist = [
+            '--prefix',
+            'backups/',
+            '--parallel',
+            '32',
+            '--sync',
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('prefix', 'backups/'),
+            ('parallel', 32),
+            ('sync', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertIsNone(self.cmd.take_action(parsed_args))
+
+        self.object_store_client.container_save.assert_called_with(
+            container=object_fakes.container_name,
+            prefix='backups/',
+            concurrency=32,
+            sync=True,
+        )
+
+    def test_container_save_failure(self):
+        self.object_store_client.container_save.return_value = [
+            (object_fakes.OBJECT['name'], '500 Internal Server Error'),
+        ]
+
+        arglist = [
+            object_fakes.container_name,
+        ]
+        verifylist = [
+            ('container', object_fakes.container_name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+
 class TestContainerShow(object_fakes.TestObjectV1):
     def setUp(self):
         super().setUp()
@@ -250,7 +250,7 @@ class TestObjectList(object_fakes.TestObjectV1):
         self.assertEqual(datalist, tuple(data))
 
     def test_object_list_objects_all(self):
-        self.object_store_client.object_list.return_value = [
+        self.object_store_client.object_list_iter.return_value = [
             copy.deepcopy(object_fakes.OBJECT),
             copy.deepcopy(object_fakes.OBJECT_2),
         ]
@@ -270,9 +270,9 @@ class TestObjectList(object_fakes.TestObjectV1):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
 
-        self.object_store_client.object_list.assert_called_with(
+        self.object_store_client.object_list_iter.assert_called_with(
             container=object_fakes.container_name,
-            full_listing=True,
+            prefetch=True,
         )
 
         self.assertEqual(self.columns, columns)
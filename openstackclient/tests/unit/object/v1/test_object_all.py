@@ -13,8 +13,11 @@
 
 import copy
 import io
+import os
+import re
 from unittest import mock
 
+import fixtures
 from keystoneauth1 import session
 from osc_lib import exceptions
 from requests_mock.contrib import fixture
@@ -22,6 +25,7 @@ from requests_mock.contrib import fixture
 from openstackclient.api import object_store_v1 as object_store
 from openstackclient.object.v1 import object as object_cmds
 from openstackclient.tests.unit.object.v1 import fakes as object_fakes
+from openstackclient.tests.unit import utils as tests_utils
 
 
 class TestObjectAll(object_fakes.TestObjectV1):
@@ -67,6 +71,203 @@ class TestObjectCreate(TestObjectAll):
             exceptions.CommandError, self.cmd.take_action, parsed_args
         )
 
+    def _make_tree(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        os.makedirs(os.path.join(path, 'sub'))
+        for name in ('a', os.path.join('sub', 'b'), os.path.join('sub', 'c')):
+            with open(os.path.join(path, name), 'w') as fh:
+                fh.write(name)
+        return path
+
+    def test_object_create_directory_parallel(self):
+        path = self._make_tree()
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(object_fakes.ENDPOINT + '/.*'),
+            headers={'Etag': 'abc', 'X-Trans-Id': 'tx123'},
+            status_code=201,
+        )
+
+        arglist = [
+            object_fakes.container_name,
+            path,
+            '--parallel',
+            '2',
+        ]
+        verifylist = [
+            ('container', object_fakes.container_name),
+            ('objects', [path]),
+            ('parallel', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            ('object', 'container', 'etag', 'x-trans-id'), columns
+        )
+        self.assertEqual(
+            [
+                (
+                    os.path.join(path, name),
+                    object_fakes.container_name,
+                    'abc',
+                    'tx123',
+                )
+                for name in ('a', 'sub/b', 'sub/c')
+            ],
+            sorted(data),
+        )
+        self.assertEqual(3, self.requests_mock.call_count)
+
+    def test_object_create_failure(self):
+        path = self._make_tree()
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(object_fakes.ENDPOINT + '/.*'),
+            headers={'Etag': 'abc'},
+            status_code=201,
+        )
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(object_fakes.ENDPOINT + '/.*/b$'),
+            headers={'X-Trans-Id': 'tx503'},
+            status_code=503,
+        )
+
+        arglist = [object_fakes.container_name, path, '--parallel', '4']
+        verifylist = [('parallel', 4)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        # the results are shown before the command fails
+        with self.assertLogs(object_cmds.LOG, level='ERROR') as log_ctx:
+            exc = self.assertRaises(
+                exceptions.CommandError, self.cmd.run, parsed_args
+            )
+
+        self.assertEqual(
+            'Failed to upload 1 object(s) to container '
+            + object_fakes.container_name,
+            str(exc),
+        )
+        output = self.app.stdout.make_string()
+        self.assertIn(os.path.join(path, 'a'), output)
+        self.assertIn(os.path.join(path, 'sub', 'c'), output)
+        self.assertNotIn(os.path.join(path, 'sub', 'b'), output)
+        self.assertIn('x-trans-id: tx503', log_ctx.output[0])
+
+    def test_object_create_directory_with_object_name(self):
+        path = self._make_tree()
+        arglist = [
+            object_fakes.container_name,
+            path,
+            '--name',
+            object_fakes.object_upload_name,
+        ]
+        verifylist = [('name', object_fakes.object_upload_name)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+    def test_object_create_segmented(self):
+        path = self.useFixture(fixtures.TempDir()).path
+        small = os.path.join(path, 'small')
+        large = os.path.join(path, 'large')
+        for name, size in ((small, 2), (large, 10)):
+            with open(name, 'wb') as fh:
+                fh.write(b'x' * size)
+        self.requests_mock.register_uri(
+            'PUT',
+            re.compile(object_fakes.ENDPOINT + '/.*/small$'),
+            headers={'Etag': 'abc'},
+            status_code=201,
+        )
+        object_store = self.app.client_manager.object_store
+        object_store.object_create_segmented = mock.Mock(
+            return_value={
+                'object': large,
+                'container': object_fakes.container_name,
+                'etag': '"def"',
+            }
+        )
+
+        arglist = [
+            object_fakes.container_name,
+            small,
+            large,
+            '--segment-size',
+            '4',
+            '--resume',
+        ]
+        verifylist = [
+            ('segment_size', 4),
+            ('segment_container', None),
+            ('resume', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        _, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            [
+                (small, object_fakes.container_name, 'abc', None),
+                (large, object_fakes.container_name, '"def"', ''),
+            ],
+            list(data),
+        )
+        object_store.object_create_segmented.assert_called_once_with(
+            container=object_fakes.container_name,
+            object=large,
+            name=None,
+            segment_size=4,
+            segment_container=None,
+            concurrency=1,
+            resume=True,
+            progress=None,
+        )
+
+    def test_object_create_segment_size_suffix(self):
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            '--segment-size',
+            '2G',
+        ]
+        verifylist = [('segment_size', 2 * 1024**3)]
+        self.check_parser(self.cmd, arglist, verifylist)
+
+    def test_object_create_segment_size_invalid(self):
+        for size in ('0', '-1', '1X'):
+            arglist = [
+                object_fakes.container_name,
+                object_fakes.object_name_1,
+                '--segment-size',
+                size,
+            ]
+            self.assertRaises(
+                tests_utils.ParserException,
+                self.check_parser,
+                self.cmd,
+                arglist,
+                [],
+            )
+
+    def test_object_create_invalid_parallel(self):
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            '--parallel',
+            '0',
+        ]
+        verifylist = [('parallel', 0)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
 
 class TestObjectList(TestObjectAll):
     columns = ('Name',)
@@ -274,3 +475,166 @@ class TestObjectSave(TestObjectAll):
             fake_fdopen.return_value.context_manager_calls,
             ['__enter__', '__exit__'],
         )
+
+    def test_save_parallel(self):
+        object_store = self.app.client_manager.object_store
+        object_store.object_save_ranged = mock.Mock()
+
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            '--parallel',
+            '8',
+            '--range-size',
+            '16M',
+        ]
+        verifylist = [
+            ('parallel', 8),
+            ('range_size', 16 * 1024**2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        object_store.object_save_ranged.assert_called_once_with(
+            container=object_fakes.container_name,
+            object=object_fakes.object_name_1,
+            file=None,
+            concurrency=8,
+            range_size=16 * 1024**2,
+            progress=None,
+        )
+
+    def test_save_progress(self):
+        object_store = self.app.client_manager.object_store
+        object_store.object_save = mock.Mock()
+
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            '--progress',
+        ]
+        verifylist = [('progress', True)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch.object(
+            object_cmds.progressbar, 'ProgressReporter'
+        ) as reporter:
+            self.cmd.take_action(parsed_args)
+
+        object_store.object_save.assert_called_once_with(
+            container=object_fakes.container_name,
+            object=object_fakes.object_name_1,
+            file=None,
+            progress=reporter.return_value,
+        )
+        reporter.return_value.close.assert_called_once_with()
+
+    def test_save_parallel_to_stdout(self):
+        arglist = [
+            object_fakes.container_name,
+            object_fakes.object_name_1,
+            '--parallel',
+            '8',
+            '--file',
+            '-',
+        ]
+        verifylist = [('parallel', 8), ('file', '-')]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )
+
+
+class TestObjectSync(TestObjectAll):
+    def setUp(self):
+        super().setUp()
+
+        self.directory = self.useFixture(fixtures.TempDir()).path
+        self.index = os.path.join(self.directory, 'index.json')
+        self.object_sync = mock.Mock(
+            return_value=iter(
+                [
+                    ('a', 'uploaded', None),
+                    ('b', None, None),
+                    ('c', 'deleted', None),
+                ]
+            )
+        )
+        self.app.client_manager.object_store.object_sync = self.object_sync
+
+        # Get the command object to test
+        self.cmd = object_cmds.SyncObject(self.app, None)
+
+    def test_object_sync(self):
+        arglist = [
+            self.directory,
+            object_fakes.container_name,
+            '--index',
+            self.index,
+            '--delete',
+            '--parallel',
+            '4',
+        ]
+        verifylist = [
+            ('directory', self.directory),
+            ('container', object_fakes.container_name),
+            ('prefix', ''),
+            ('index', self.index),
+            ('delete', True),
+            ('parallel', 4),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('Object', 'Action'), columns)
+        self.assertEqual([('a', 'uploaded'), ('c', 'deleted')], list(data))
+        kwargs = self.object_sync.call_args.kwargs
+        self.assertEqual(self.index, kwargs['index'].path)
+        self.assertEqual(4, kwargs['concurrency'])
+        self.assertTrue(kwargs['delete'])
+
+    def test_object_sync_failure(self):
+        self.object_sync.return_value = iter(
+            [
+                ('a', 'uploaded', None),
+                ('b', None, Exception('boom')),
+                ('c', 'deleted', None),
+            ]
+        )
+        arglist = [
+            self.directory,
+            object_fakes.container_name,
+            '--index',
+            self.index,
+        ]
+        verifylist = [('index', self.index)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        # the results are shown before the command fails
+        exc = self.assertRaises(
+            exceptions.CommandError, self.cmd.run, parsed_args
+        )
+
+        self.assertEqual(
+            'Failed to sync 1 object(s) with container '
+            + object_fakes.container_name,
+            str(exc),
+        )
+        output = self.app.stdout.make_string()
+        self.assertRegex(output, r'\| a +\| uploaded')
+        self.assertRegex(output, r'\| c +\| deleted')
+
+    def test_object_sync_not_a_directory(self):
+        arglist = [
+            self.index,
+            object_fakes.container_name,
+        ]
+        verifylist = [('directory', self.index)]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args
+        )